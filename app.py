@@ -1,93 +1,579 @@
-from flask import Flask, render_template, request, jsonify
-from scrabble_solver import calculate_word_score, generate_valid_words, load_dictionary
-from utils.grouping import group_words, get_available_grouping_options
-from utils.sorting import apply_sorting, sort_flat_words, get_available_sorting_options
-from utils.filtering import apply_filters, validate_filters, get_filter_summary
+from flask import Flask, Response, render_template, request, jsonify
+from scrabble_solver import (
+    best_words, calculate_word_score, find_pattern_words, find_words_batch, iter_words, prepare_engine,
+    word_signature, SearchBudget, ENGINES, DEFAULT_ENGINE, BLANK
+)
+from lexicon_registry import LexiconRegistry, parse_lexicon_sources
+from solver_pool import SolverPool
+from utils.grouping import group_and_sort, iter_groups, get_available_grouping_options
+from utils.sorting import sort_flat_words, sort_words_within_groups, get_available_sorting_options
+from utils.filtering import (
+    iter_filters, validate_filters, validate_pattern, get_filter_summary
+)
+from utils.cache import ResultCache, rack_cache_key
+from utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsRegistry
+from utils.results import RESULT_FORMATS, encode_words
+from utils.pagination import decode_cursor, page_ordering, paginate
+from itertools import islice
+import hmac
+import json
 import os
 
 app = Flask(__name__)
 
-# Load dictionary once when app starts
 DICTIONARY_PATH = os.path.join(os.path.dirname(__file__), 'dictionary.txt')
-dictionary = load_dictionary(DICTIONARY_PATH)
+
+# Search engine used when a request does not pick one (see scrabble_solver.ENGINES)
+SOLVER_ENGINE = os.environ.get('SOLVER_ENGINE', DEFAULT_ENGINE)
+
+# Word lists requests can pick with 'lexicon', as name=path pairs (the first
+# is the default). Each is compiled and mapped on first use, so workers share
+# its pages through the OS cache, and the least recently used are dropped
+# when their mapped artifacts, plus the indexes each worker builds for them
+# (pattern index, letter matrix), outgrow LEXICON_MAX_BYTES. A reload swaps in a
+# rebuilt lexicon and drops the results cached for the old version.
+LEXICON_SOURCES = parse_lexicon_sources(os.environ.get('LEXICONS', f'default={DICTIONARY_PATH}'))
+
+# Metrics served at /metrics. Set METRICS_DIR to a directory shared by the
+# gunicorn workers (emptied before the server starts) so that every scrape
+# sums all of them; without it each worker reports only its own.
+metrics = MetricsRegistry(os.environ.get('METRICS_DIR') or None)
+
+# Stages of the solve endpoints timed in solve_stage_seconds. 'generate' is
+# the search, which reads each word's precomputed score and applies the
+# filters as it goes; 'filter' is filtering results found in the cache.
+# The grouped view groups and sorts in one pass (group_and_sort), timed as
+# 'group'; 'sort' only times sorting the flat view.
+SOLVE_STAGES = ('generate', 'filter', 'paginate', 'group', 'sort', 'encode', 'serialize')
+solve_stage_seconds = metrics.histogram(
+    'scrabble_solve_stage_seconds',
+    'Seconds spent in each stage of solve requests '
+    '(group includes sorting the grouped view; sort is the flat view only)',
+    label='stage', label_values=SOLVE_STAGES)
+rack_lengths = metrics.histogram(
+    'scrabble_rack_length', 'Tiles per /solve rack, blanks included',
+    (2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 15, 20))
+result_counts = metrics.histogram(
+    'scrabble_solve_words', 'Words per /solve response, after filters',
+    (0, 10, 50, 100, 500, 1000, 5000, 10000, 50000, 100000))
+cache_lookups = metrics.counter(
+    'scrabble_result_cache_lookups_total', 'Racks looked up in the result cache, by result',
+    label='result', label_values=('hit', 'miss'))
+lexicon_load_seconds = metrics.histogram(
+    'scrabble_lexicon_load_seconds', 'Seconds to map and prepare a lexicon, or to rebuild it on reload',
+    (0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 120), label='lexicon', label_values=list(LEXICON_SOURCES))
+
+lexicons = LexiconRegistry(
+    LEXICON_SOURCES,
+    max_bytes=int(os.environ.get('LEXICON_MAX_BYTES', 512 * 1024 * 1024)),
+    prepare=lambda lexicon: prepare_engine(lexicon, SOLVER_ENGINE),
+    on_swap=lambda old, new: result_cache.invalidate_version(old.version),
+    on_load=lambda name, seconds: lexicon_load_seconds.observe(seconds, name)
+)
+# Map the default lexicon when the app starts, so the first request is fast
+lexicons.get()
+
+# Seconds between checks for changed lexicon source files; 0 disables the
+# watch, leaving reloads to the admin endpoint
+LEXICON_WATCH_INTERVAL = float(os.environ.get('LEXICON_WATCH_INTERVAL', 0))
+if LEXICON_WATCH_INTERVAL > 0:
+    lexicons.watch(LEXICON_WATCH_INTERVAL)
+
+# Bearer token for the admin endpoints; they are disabled when unset
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
+
+# A standard Scrabble set has two blank tiles
+MAX_BLANKS = 2
+
+# Upper bound on racks accepted by /solve/batch
+MAX_BATCH_RACKS = 1000
+
+# Upper bound on the words per page when a request sets a limit
+MAX_PAGE_SIZE = 1000
+
+# /solve modes: every word, or only the best few found by a best-first search
+SOLVE_MODES = ('all', 'best')
+
+# Words returned by mode 'best' when the request sets no limit
+DEFAULT_BEST_WORDS = 20
+
+# Seconds a solve may search before it stops and returns the words found so
+# far, marked truncated, per endpoint; a request's time_limit can only
+# shorten it. 0 lifts the limit.
+TIME_LIMITS = {
+    'solve': float(os.environ.get('SOLVE_TIME_LIMIT', 10)),
+    'batch': float(os.environ.get('BATCH_TIME_LIMIT', 30))
+}
+
+# Solver processes for heavy racks, mapping the same compiled dictionaries (see
+# solver_pool); 0 solves every rack in the request thread
+SOLVER_PROCESSES = int(os.environ.get('SOLVER_PROCESSES', 0))
+solver_pool = SolverPool(SOLVER_PROCESSES) if SOLVER_PROCESSES > 0 else None
+
+# Raw solver results per canonical rack, shared by filters/grouping/sorting
+result_cache = ResultCache(
+    max_entries=int(os.environ.get('RESULT_CACHE_SIZE', 1024)),
+    max_bytes=int(os.environ.get('RESULT_CACHE_MAX_BYTES', 64 * 1024 * 1024)),
+    ttl=float(os.environ.get('RESULT_CACHE_TTL', 600))
+)
+
+def cached_find_words(racks, engine, filters=None, dictionary=None, budget=None):
+    """
+    Solve racks through the result cache; misses are solved together in one batch.
+    
+    Racks are searched in the given lexicon (the default one if None), and
+    cached under its version. Misses are searched within the budget, and
+    results cut short by it are not cached.
+    
+    Filters are pushed down into the search, and filtered results are cached
+    under their own key. A rack whose unfiltered results are already cached
+    is filtered from those instead of being searched again.
+    
+    Returns:
+        One filtered result list per rack, in input order
+    """
+    if dictionary is None:
+        dictionary = lexicons.get()
+    keys = [rack_cache_key(letters, dictionary.version, filters) for letters in racks]
+    batch_results = []
+    for letters, key in zip(racks, keys):
+        # One lookup per rack, trying the unfiltered results first
+        lookup = [rack_cache_key(letters, dictionary.version), key] if filters else [key]
+        found, results = result_cache.get_first(lookup)
+        if results is not None and found != key:
+            with solve_stage_seconds.timer('filter'):
+                results = list(iter_filters(results, filters))
+        cache_lookups.inc('miss' if results is None else 'hit')
+        batch_results.append(results if results is None else cap_words(letters, results, budget))
+    
+    missing = [index for index, results in enumerate(batch_results) if results is None]
+    if missing:
+        solve_batch = solver_pool.find_words_batch if solver_pool else find_words_batch
+        with solve_stage_seconds.timer('generate'):
+            solved = solve_batch([racks[index] for index in missing], dictionary, engine, filters, budget)
+        for index, results in zip(missing, solved):
+            if budget is None or not budget.was_cut(racks[index]):
+                result_cache.put(keys[index], results)
+            batch_results[index] = results
+    
+    return batch_results
+
+def cached_best_words(letters, n, filters=None, dictionary=None, budget=None):
+    """
+    Find the n best words for a rack, cut from cached results when there are any.
+    
+    Cached result lists are already best first, so their head is the answer;
+    otherwise the best-first search finds the words without enumerating the
+    rest, and its partial result is not cached.
+    """
+    if dictionary is None:
+        dictionary = lexicons.get()
+    key = rack_cache_key(letters, dictionary.version, filters)
+    unfiltered = rack_cache_key(letters, dictionary.version)
+    found, results = result_cache.get_first([key, unfiltered] if filters else [key])
+    if results is not None and found != key:
+        results = iter_filters(results, filters)
+    cache_lookups.inc('miss' if results is None else 'hit')
+    if results is not None:
+        with solve_stage_seconds.timer('filter'):
+            return cap_words(letters, list(islice(results, n)), budget)
+    with solve_stage_seconds.timer('generate'):
+        if solver_pool:
+            return solver_pool.best_words(letters, dictionary, n, filters, budget)
+        return best_words(letters, dictionary, n, filters, budget)
 
 @app.route('/')
 def index():
     """Main page with letter input form."""
     return render_template('index.html')
 
+def clean_letters(raw_letters):
+    """
+    Normalize a rack from a request.
+    
+    Returns:
+        Tuple of (letters, error message); letters is None when invalid
+    """
+    letters = str(raw_letters or '').lower().strip()
+    
+    if not letters:
+        return None, 'No letters provided'
+    
+    # Remove any characters that are neither tile letters (a-z) nor blank tiles
+    letters = ''.join(c for c in letters if 'a' <= c <= 'z' or c == BLANK)
+    
+    if not letters:
+        return None, 'No valid letters found'
+    
+    if letters.count(BLANK) > MAX_BLANKS:
+        return None, f'At most {MAX_BLANKS} blank tiles are allowed'
+    
+    return letters, None
+
+def parse_solve_options(data):
+    """
+    Read the engine, filter, grouping and sorting options shared by the solve endpoints.
+    
+    Returns:
+        Tuple of (options, error payload); options is None when invalid
+    """
+    options = {
+        'group_by': data.get('group_by', 'length'),
+        'sort_groups': data.get('sort_groups', 'asc'),
+        'sort_within_groups': data.get('sort_within_groups', 'score'),
+        'view_type': data.get('view_type', 'grouped'),  # 'grouped' or 'flat'
+        'filters': data.get('filters', {}),
+        'engine': data.get('engine', SOLVER_ENGINE),
+        'lexicon': data.get('lexicon') or lexicons.default,
+        'format': data.get('format', 'objects'),  # 'objects' or 'columnar'
+        'limit': data.get('limit'),  # page size; None returns every word
+        'cursor': data.get('cursor'),  # next_cursor of the previous page
+        'time_limit': data.get('time_limit'),  # seconds, within the endpoint's limit
+        'max_words': data.get('max_words')  # most words returned per rack
+    }
+    
+    if options['engine'] not in ENGINES:
+        return None, {'error': f"Unknown engine '{options['engine']}'"}
+    
+    if not isinstance(options['lexicon'], str) or options['lexicon'] not in lexicons:
+        return None, {'error': f"Unknown lexicon '{options['lexicon']}'"}
+    
+    if options['format'] not in RESULT_FORMATS:
+        return None, {'error': f"Unknown format '{options['format']}'"}
+    
+    if options['limit'] is not None:
+        if type(options['limit']) is not int or options['limit'] < 1:
+            return None, {'error': 'Limit must be a positive integer'}
+        if options['limit'] > MAX_PAGE_SIZE:
+            return None, {'error': f'Limit must be at most {MAX_PAGE_SIZE}'}
+    
+    if options['time_limit'] is not None:
+        time_limit = options['time_limit']
+        if isinstance(time_limit, bool) or not isinstance(time_limit, (int, float)) or not time_limit > 0:
+            return None, {'error': 'Time limit must be a positive number of seconds'}
+    
+    if options['max_words'] is not None:
+        if type(options['max_words']) is not int or options['max_words'] < 1:
+            return None, {'error': 'Max words must be a positive integer'}
+    
+    if options['cursor'] is not None:
+        if options['limit'] is None:
+            return None, {'error': 'A cursor requires a limit'}
+        try:
+            decode_cursor(str(options['cursor']), options['sort_within_groups'])
+        except ValueError as e:
+            return None, {'error': str(e)}
+    
+    # Validate filters
+    filter_errors = validate_filters(options['filters'])
+    if filter_errors:
+        return None, {'error': 'Invalid filters', 'details': filter_errors}
+    
+    return options, None
+
+def search_budget(options, endpoint):
+    """
+    Build the search budget for a request to an endpoint of TIME_LIMITS.
+    
+    The deadline is the earlier of the endpoint's limit and the request's
+    time_limit, counted from now; max_words caps each rack's results.
+    """
+    seconds = [limit for limit in (TIME_LIMITS[endpoint], options['time_limit']) if limit]
+    return SearchBudget(min(seconds) if seconds else None, options['max_words'])
+
+def cap_words(letters, results, budget):
+    """Hold cached results (best first) to the budget's max_words, as a search would be."""
+    if budget is not None and budget.max_words is not None and len(results) > budget.max_words:
+        budget.cut(letters, 'word_limit')
+        return results[:budget.max_words]
+    return results
+
+def truncation(budget, letters):
+    """Response fields saying whether a rack's results were cut short, and why."""
+    reason = budget.was_cut(letters)
+    if reason:
+        return {'truncated': True, 'truncated_reason': reason}
+    return {'truncated': False}
+
+def format_solve_results(letters, filtered_results, options):
+    """
+    Group and sort already filtered results into a solve response payload.
+    
+    Word lists are sent as one object per word, or with format 'columnar'
+    as one array per field ({'word': [...], 'score': [...], ...}).
+    
+    With a limit only one page of words is formatted: the best words by the
+    within-group sort, after the request's cursor, grouped in the grouped
+    view. Results must be in find_words order, so pages by score are sliced
+    straight out of them.
+    """
+    filters = options['filters']
+    result_format = options.get('format', 'objects')
+    page = None
+    words = filtered_results
+    if options.get('limit'):
+        with solve_stage_seconds.timer('paginate'):
+            page = paginate(filtered_results, options['limit'], options['sort_within_groups'],
+                            options.get('cursor'), presorted=page_ordering(options['sort_within_groups']) == 'score')
+        words = page['words']
+    
+    # Prepare response based on view type
+    if options['view_type'] == 'flat':
+        # Sort flat results (a page is already in order)
+        sorted_results = words
+        if not page:
+            with solve_stage_seconds.timer('sort'):
+                sorted_results = sort_flat_words(words, options['sort_within_groups'])
+        with solve_stage_seconds.timer('encode'):
+            encoded = encode_words(sorted_results, result_format)
+        
+        payload = {
+            'letters': letters,
+            'words': encoded,
+            'total_words': len(filtered_results),
+            'view_type': 'flat',
+            'format': result_format,
+            'engine': options['engine'],
+            'lexicon': options['lexicon'],
+            'filters_applied': get_filter_summary(filters)
+        }
+    else:
+        # Group and sort results in one pass
+        with solve_stage_seconds.timer('group'):
+            sorted_groups = group_and_sort(words, options['group_by'],
+                                           options['sort_groups'], options['sort_within_groups'])
+        with solve_stage_seconds.timer('encode'):
+            for group in sorted_groups:
+                group['words'] = encode_words(group['words'], result_format)
+        
+        payload = {
+            'letters': letters,
+            'total_words': len(filtered_results),
+            'view_type': 'grouped',
+            'format': result_format,
+            'engine': options['engine'],
+            'lexicon': options['lexicon'],
+            'grouping': {
+                'type': options['group_by'],
+                'sort_order': options['sort_groups'],
+                'groups': sorted_groups
+            },
+            'filters_applied': get_filter_summary(filters)
+        }
+    
+    if page:
+        payload['limit'] = options['limit']
+        payload['next_cursor'] = page['next_cursor']
+    return payload
+
+def ndjson_line(payload):
+    """Serialize one newline-delimited JSON record."""
+    return json.dumps(payload, separators=(',', ':')) + '\n'
+
+def stream_solve_results(letters, options, budget=None):
+    """
+    Yield a solve response as NDJSON records through a lazy pipeline.
+    
+    Words flow generate -> filter -> emit without building the full result
+    list. Flat view words arrive in discovery order. Grouped by length, each
+    group (header record, then its words) is sent as soon as the search has
+    moved past that length; other groupings are sent once the search ends.
+    A cached result set is streamed as-is when one exists. Every word is its
+    own record, so the columnar format does not apply to streams. A search
+    cut short by the budget ends the stream early, flagged in the end record.
+    """
+    if budget is None:
+        budget = SearchBudget()
+    view_type = 'flat' if options['view_type'] == 'flat' else 'grouped'
+    yield ndjson_line({
+        'type': 'meta',
+        'letters': letters,
+        'view_type': view_type,
+        'engine': options['engine'],
+        'lexicon': options['lexicon'],
+        'filters_applied': get_filter_summary(options['filters'])
+    })
+    
+    total_words = 0
+    try:
+        group_by = options['group_by']
+        by_length = view_type == 'grouped' and group_by not in ('first_letter', 'last_letter')
+        length_order = ('desc' if options['sort_groups'] == 'desc' else 'asc') if by_length else None
+        
+        dictionary = lexicons.get(options['lexicon'])
+        cached = result_cache.get(rack_cache_key(letters, dictionary.version))
+        if cached is not None:
+            words = cap_words(letters, list(iter_filters(cached, options['filters'])), budget)
+        else:
+            words = iter_words(letters, dictionary, options['engine'], length_order, options['filters'], budget)
+        
+        if view_type == 'flat':
+            for word in words:
+                total_words += 1
+                yield ndjson_line({'type': 'word', **word})
+        else:
+            ordered = by_length and cached is None
+            if ordered:
+                groups = iter_groups(words, group_by, ordered=True)
+            else:
+                groups = group_and_sort(words, group_by, options['sort_groups'], options['sort_within_groups'])
+            for group in groups:
+                if ordered:
+                    sort_words_within_groups([group], options['sort_within_groups'])
+                total_words += group['count']
+                yield ndjson_line({
+                    'type': 'group',
+                    'name': group['name'],
+                    'count': group['count'],
+                    'total_score': group['total_score']
+                })
+                for word in group['words']:
+                    yield ndjson_line({'type': 'word', **word})
+    except Exception as e:
+        yield ndjson_line({'type': 'error', 'error': str(e)})
+        return
+    
+    yield ndjson_line({'type': 'end', 'total_words': total_words, **truncation(budget, letters)})
+
+def solve_response(data):
+    """
+    Answer a /solve request body, apart from the web framework serving it.
+    
+    Shared by the Flask routes and the ASGI entry point (see asgi).
+    
+    Returns:
+        Tuple of (payload, status code); for a streamed request the payload
+        is a generator of NDJSON lines instead of a dict
+    """
+    letters, error = clean_letters(data.get('letters', ''))
+    
+    if error:
+        return {'error': error}, 400
+    
+    options, error = parse_solve_options(data)
+    if error:
+        return error, 400
+    
+    mode = data.get('mode', 'all')
+    if mode not in SOLVE_MODES:
+        return {'error': f"Unknown mode '{mode}'"}, 400
+    
+    budget = search_budget(options, 'solve')
+    rack_lengths.observe(len(letters))
+    if data.get('stream'):
+        if options['limit'] is not None or mode != 'all':
+            return {'error': 'Limit, cursor and mode are not supported for streamed results'}, 400
+        return stream_solve_results(letters, options, budget), 200
+    
+    if mode == 'best':
+        if options['cursor'] is not None:
+            return {'error': "A cursor is not supported with mode 'best'"}, 400
+        # The limit picks how many best words to find; they are all sent
+        results = cached_best_words(letters, options['limit'] or DEFAULT_BEST_WORDS, options['filters'],
+                                    lexicons.get(options['lexicon']), budget)
+        payload = format_solve_results(letters, results, {**options, 'limit': None})
+        del payload['engine']
+        payload['mode'] = 'best'
+        payload.update(truncation(budget, letters))
+        result_counts.observe(payload['total_words'])
+        return payload, 200
+    
+    # Generate valid words with their scores (or reuse them for an anagram rack)
+    results = cached_find_words([letters], options['engine'], options['filters'],
+                                lexicons.get(options['lexicon']), budget)[0]
+    
+    payload = format_solve_results(letters, results, options)
+    payload.update(truncation(budget, letters))
+    result_counts.observe(payload['total_words'])
+    return payload, 200
+
 @app.route('/solve', methods=['POST'])
 def solve():
     """API endpoint to solve Scrabble words from letters with grouping and filtering."""
+    try:
+        payload, status = solve_response(request.get_json())
+        if isinstance(payload, dict):
+            with solve_stage_seconds.timer('serialize'):
+                response = jsonify(payload)
+            return response, status
+        return Response(payload, mimetype='application/x-ndjson')
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/solve/batch', methods=['POST'])
+def solve_batch():
+    """API endpoint to solve many racks in one request with shared options."""
     try:
         data = request.get_json()
-        letters = data.get('letters', '').lower().strip()
-        
-        if not letters:
-            return jsonify({'error': 'No letters provided'}), 400
-        
-        # Remove any non-alphabetic characters
-        letters = ''.join(c for c in letters if c.isalpha())
-        
-        if not letters:
-            return jsonify({'error': 'No valid letters found'}), 400
-        
-        # Get grouping and sorting parameters
-        group_by = data.get('group_by', 'length')
-        sort_groups = data.get('sort_groups', 'asc')
-        sort_within_groups = data.get('sort_within_groups', 'score')
-        view_type = data.get('view_type', 'grouped')  # 'grouped' or 'flat'
-        filters = data.get('filters', {})
-        
-        # Validate filters
-        filter_errors = validate_filters(filters)
-        if filter_errors:
-            return jsonify({'error': 'Invalid filters', 'details': filter_errors}), 400
-        
-        # Generate valid words
-        valid_words = generate_valid_words(letters, dictionary)
-        
-        # Format results with scores
-        results = []
-        for word in valid_words:
-            score = calculate_word_score(word)
-            results.append({
-                'word': word,
-                'score': score,
-                'length': len(word)
-            })
-        
-        # Apply filters
-        filtered_results = apply_filters(results, filters)
-        
-        # Prepare response based on view type
-        if view_type == 'flat':
-            # Sort flat results
-            sorted_results = sort_flat_words(filtered_results, sort_within_groups)
-            
-            return jsonify({
-                'letters': letters,
-                'words': sorted_results,
-                'total_words': len(sorted_results),
-                'view_type': 'flat',
-                'filters_applied': get_filter_summary(filters)
-            })
-        else:
-            # Group and sort results
-            groups = group_words(filtered_results, group_by)
-            sorted_groups = apply_sorting(groups, sort_groups, sort_within_groups)
-            
-            return jsonify({
-                'letters': letters,
-                'total_words': len(filtered_results),
-                'view_type': 'grouped',
-                'grouping': {
-                    'type': group_by,
-                    'sort_order': sort_groups,
-                    'groups': sorted_groups
-                },
-                'filters_applied': get_filter_summary(filters)
-            })
+        racks = data.get('racks')
+        
+        if not isinstance(racks, list) or not racks:
+            return jsonify({'error': 'No racks provided'}), 400
+        
+        if len(racks) > MAX_BATCH_RACKS:
+            return jsonify({'error': f'At most {MAX_BATCH_RACKS} racks are allowed per batch'}), 400
+        
+        options, error = parse_solve_options(data)
+        if error:
+            return jsonify(error), 400
+        
+        # Validate every rack up front so bad items only fail themselves
+        cleaned = [clean_letters(rack) for rack in racks]
+        valid_racks = [letters for letters, error in cleaned if not error]
+        # One deadline covers the whole batch; racks it cuts short say so
+        budget = search_budget(options, 'batch')
+        batch_results = iter(cached_find_words(valid_racks, options['engine'], options['filters'],
+                                               lexicons.get(options['lexicon']), budget))
+        
+        items = []
+        for rack, (letters, error) in zip(racks, cleaned):
+            if error:
+                items.append({'letters': rack, 'error': error})
+            else:
+                items.append({**format_solve_results(letters, next(batch_results), options),
+                              **truncation(budget, letters)})
+        
+        return jsonify({
+            'results': items,
+            'total_racks': len(racks),
+            'unique_racks': len(set(word_signature(letters) for letters in valid_racks)),
+            'truncated_racks': sum(1 for item in items if item.get('truncated')),
+            'errors': sum(1 for _, error in cleaned if error)
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/solve/pattern', methods=['POST'])
+def solve_pattern():
+    """API endpoint to find words matching a crossword-style pattern, optionally from a rack."""
+    try:
+        data = request.get_json()
+        pattern = str(data.get('pattern') or '').strip()
+        
+        error = validate_pattern(pattern)
+        if error:
+            return jsonify({'error': error}), 400
+        
+        # The rack is optional: without one every matching word is returned
+        letters = None
+        if data.get('letters'):
+            letters, error = clean_letters(data['letters'])
+            if error:
+                return jsonify({'error': error}), 400
+        
+        options, error = parse_solve_options(data)
+        if error:
+            return jsonify(error), 400
+        
+        dictionary = lexicons.get(options['lexicon'])
+        results = list(iter_filters(find_pattern_words(pattern, dictionary, letters), options['filters']))
+        
+        payload = format_solve_results(letters, results, options)
+        del payload['engine']
+        payload['pattern'] = pattern.lower()
+        return jsonify(payload)
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -110,20 +596,79 @@ def get_sorting_options():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/cache')
+def get_cache_stats():
+    """API endpoint to get result cache counters."""
+    try:
+        return jsonify(result_cache.stats())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def word_score_response(word):
+    """
+    Answer a word score request (shared with the ASGI entry point).
+    
+    Returns:
+        Tuple of (payload, status code)
+    """
+    word = word.lower().strip()
+    if not word.isalpha():
+        return {'error': 'Invalid word'}, 400
+    
+    score = calculate_word_score(word)
+    return {
+        'word': word,
+        'score': score,
+        'length': len(word)
+    }, 200
+
+@app.route('/api/lexicons')
+def get_lexicon_stats():
+    """API endpoint to get the available lexicons and which are loaded."""
+    try:
+        return jsonify(lexicons.stats())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/lexicons/<name>/reload', methods=['POST'])
+def reload_lexicon(name):
+    """
+    Admin endpoint to rebuild a lexicon from its source file.
+    
+    The rebuild runs in the background and the new index is swapped in when
+    ready; its report (build time and word delta) appears under the lexicon
+    in /api/lexicons. Requires 'Authorization: Bearer <ADMIN_TOKEN>'.
+    """
+    try:
+        if not ADMIN_TOKEN:
+            return jsonify({'error': 'Reloading is disabled (set ADMIN_TOKEN)'}), 403
+        if not hmac.compare_digest(request.headers.get('Authorization', '').encode(), f'Bearer {ADMIN_TOKEN}'.encode()):
+            return jsonify({'error': 'Unauthorized'}), 401
+        if name not in lexicons:
+            return jsonify({'error': f"Unknown lexicon '{name}'"}), 404
+        if not lexicons.start_reload(name):
+            return jsonify({'error': f"Lexicon '{name}' is already reloading"}), 409
+        return jsonify({'lexicon': name, 'status': 'reloading'}), 202
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/metrics')
+def get_metrics():
+    """
+    Prometheus endpoint: solve stage latencies, rack lengths, words per
+    response, result cache lookups and lexicon load times.
+    """
+    try:
+        return Response(metrics.render(), content_type=METRICS_CONTENT_TYPE)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/score/<word>')
 def get_word_score(word):
     """API endpoint to get score for a specific word."""
     try:
-        word = word.lower().strip()
-        if not word.isalpha():
-            return jsonify({'error': 'Invalid word'}), 400
-        
-        score = calculate_word_score(word)
-        return jsonify({
-            'word': word,
-            'score': score,
-            'length': len(word)
-        })
+        payload, status = word_score_response(word)
+        return jsonify(payload), status
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
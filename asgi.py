@@ -0,0 +1,186 @@
+"""
+ASGI entry point for Scrabble Word Solver.
+
+Serves /solve, /api/score/<word>, /api/groups, /api/sorting and /metrics
+from an asyncio event loop, with the dictionary, result cache and solver pool set up
+by app. Solves, and the encoding of their often large responses, run on a
+pool of SOLVE_CONCURRENCY threads so the loop is free to answer the cheap
+routes while they are in flight. Up to MAX_PENDING_SOLVES solves may be
+running or waiting for a thread; requests past that get a 503.
+
+Usage:
+    uvicorn asgi:app
+    gunicorn -k uvicorn.workers.UvicornWorker asgi:app
+"""
+
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+import app as wsgi
+from utils.grouping import get_available_grouping_options
+from utils.sorting import get_available_sorting_options
+
+# Threads running solves at once. A thread solving in-process holds the GIL
+# the loop needs, so without a solver pool one runs at a time; with a pool,
+# threads mostly wait on its processes.
+SOLVE_CONCURRENCY = int(os.environ.get('SOLVE_CONCURRENCY', 4 * wsgi.SOLVER_PROCESSES or 1))
+
+# Solves allowed in flight (running or waiting for a thread)
+MAX_PENDING_SOLVES = int(os.environ.get('MAX_PENDING_SOLVES', 64))
+
+# NDJSON lines produced per trip to a solve thread when streaming
+STREAM_CHUNK_LINES = 256
+
+solve_executor = ThreadPoolExecutor(SOLVE_CONCURRENCY, thread_name_prefix='solve')
+
+# Solves in flight; only touched from the event loop
+_pending_solves = 0
+
+# Routes answered on the event loop: path -> payload builder
+CHEAP_ROUTES: Dict[str, Callable[[], Dict[str, Any]]] = {
+    '/api/groups': lambda: {'options': get_available_grouping_options()},
+    '/api/sorting': get_available_sorting_options
+}
+
+
+def encode_json(payload: Dict[str, Any]) -> bytes:
+    return json.dumps(payload, separators=(',', ':')).encode()
+
+
+def solve_body(body: bytes) -> Tuple[int, Any]:
+    """
+    Answer a /solve request body; runs on a solve thread.
+
+    Returns:
+        Tuple of (status code, JSON bytes or an iterator of NDJSON lines)
+    """
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return 400, encode_json({'error': 'Invalid JSON'})
+    try:
+        payload, status = wsgi.solve_response(data)
+    except Exception as e:
+        payload, status = {'error': str(e)}, 500
+    if isinstance(payload, dict):
+        with wsgi.solve_stage_seconds.timer('serialize'):
+            return status, encode_json(payload)
+    return status, payload
+
+
+def next_chunk(lines: Iterator[str]) -> bytes:
+    return ''.join(islice(lines, STREAM_CHUNK_LINES)).encode()
+
+
+async def read_body(receive: Callable) -> bytes:
+    body = b''
+    while True:
+        message = await receive()
+        body += message.get('body', b'')
+        if not message.get('more_body'):
+            return body
+
+
+async def send_response(send: Callable, status: int, body: bytes,
+                        content_type: str = 'application/json', headers: Optional[list] = None) -> None:
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', content_type.encode()),
+                    (b'content-length', str(len(body)).encode())] + (headers or [])
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def send_json(send: Callable, status: int, payload: Dict[str, Any], headers: Optional[list] = None) -> None:
+    await send_response(send, status, encode_json(payload), headers=headers)
+
+
+async def solve(receive: Callable, send: Callable) -> None:
+    """Run a /solve request on a solve thread, streaming NDJSON a chunk at a time."""
+    global _pending_solves
+    body = await read_body(receive)
+    if _pending_solves >= MAX_PENDING_SOLVES:
+        await send_json(send, 503, {'error': 'Too many solves in progress'}, [(b'retry-after', b'1')])
+        return
+
+    loop = asyncio.get_running_loop()
+    _pending_solves += 1
+    try:
+        status, result = await loop.run_in_executor(solve_executor, solve_body, body)
+        if isinstance(result, bytes):
+            await send_response(send, status, result)
+            return
+
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-type', b'application/x-ndjson')]
+        })
+        while True:
+            chunk = await loop.run_in_executor(solve_executor, next_chunk, result)
+            if not chunk:
+                break
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b''})
+    finally:
+        _pending_solves -= 1
+
+
+async def lifespan(receive: Callable, send: Callable) -> None:
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            solve_executor.shutdown(wait=False, cancel_futures=True)
+            if wsgi.solver_pool:
+                wsgi.solver_pool.shutdown()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+    """ASGI application."""
+    if scope['type'] == 'lifespan':
+        await lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    path, method = scope['path'], scope['method']
+    if path == '/solve':
+        if method != 'POST':
+            await send_json(send, 405, {'error': 'Method not allowed'}, [(b'allow', b'POST')])
+            return
+        await solve(receive, send)
+        return
+
+    if path == '/metrics':
+        if method != 'GET':
+            await send_json(send, 405, {'error': 'Method not allowed'}, [(b'allow', b'GET')])
+            return
+        await send_response(send, 200, wsgi.metrics.render().encode(), wsgi.METRICS_CONTENT_TYPE)
+        return
+
+    word = path[len('/api/score/'):] if path.startswith('/api/score/') else ''
+    is_score = bool(word) and '/' not in word
+    if not is_score and path not in CHEAP_ROUTES:
+        await send_json(send, 404, {'error': 'Not found'})
+        return
+    if method != 'GET':
+        await send_json(send, 405, {'error': 'Method not allowed'}, [(b'allow', b'GET')])
+        return
+
+    try:
+        if is_score:
+            payload, status = wsgi.word_score_response(word)
+        else:
+            payload, status = CHEAP_ROUTES[path](), 200
+    except Exception as e:
+        payload, status = {'error': str(e)}, 500
+    await send_json(send, status, payload)
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for Scrabble Word Solver.
+
+Times the dictionary loaders, the DAWG and GADDAG builds (with the packed
+size of each graph), every search engine across rack lengths 2-15 with 0-2
+blanks, best-first searches for the best 20 words against full searches,
+board move generation on a mid-game position with each backend,
+pattern queries through the letter-position index, the filtering/grouping/
+sorting helpers on a large result set (and the same filters pushed down into
+each engine), encoding that set in each response format and the /solve
+endpoint end to end, in full and one cached page at a time. Each case
+records its median time and peak traced memory. Results can be saved as a
+JSON baseline, and a later run compared against it fails when a case
+regresses past a threshold, or when move generation for a rack without
+blanks takes longer than MOVE_BUDGET_MS.
+
+Usage:
+    python benchmark.py                              # run and print
+    python benchmark.py --save baseline.json         # record a baseline
+    python benchmark.py --compare baseline.json      # exit 1 on regression or over budget
+    python benchmark.py --quick --engines anagram    # smaller run
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from scrabble_solver import (
+    ENGINES, BLANK, best_words, find_pattern_words, find_words, generate_valid_words, load_dictionary
+)
+from board import Board
+from dawg import CompactDawg, Dawg, subtree_bounds
+from gaddag import Gaddag
+from lexicon_file import load_compiled_dictionary
+from move_generator import BACKENDS, generate_moves
+from pattern_index import PatternIndex
+from utils.filtering import apply_filters
+from utils.grouping import group_and_sort, group_words
+from utils.results import RESULT_FORMATS, encode_words
+from utils.sorting import apply_sorting, sort_flat_words
+
+DICTIONARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dictionary.txt')
+
+# Standard English tile distribution (without blanks), used to draw racks
+TILE_BAG = (
+    'a' * 9 + 'b' * 2 + 'c' * 2 + 'd' * 4 + 'e' * 12 + 'f' * 2 + 'g' * 3 + 'h' * 2 + 'i' * 9 +
+    'j' + 'k' + 'l' * 4 + 'm' * 2 + 'n' * 6 + 'o' * 8 + 'p' * 2 + 'q' + 'r' * 6 + 's' * 4 +
+    't' * 6 + 'u' * 4 + 'v' * 2 + 'w' * 2 + 'x' + 'y' * 2 + 'z'
+)
+
+RACK_LENGTHS = range(2, 16)
+QUICK_RACK_LENGTHS = (2, 7, 11, 15)
+BLANK_COUNTS = (0, 1, 2)
+
+# Mid-game position used for the board move generation cases
+MIDGAME_ROWS = (
+    '...............',
+    '...............',
+    '...............',
+    '...............',
+    '...............',
+    '......c........',
+    '......r........',
+    '....quartz.....',
+    '......n..o.....',
+    '..stone..n.....',
+    '.........e.....',
+    '...............',
+    '...............',
+    '...............',
+    '...............',
+)
+
+# A rack with many plays on that position, besides the racks drawn from the bag
+MIDGAME_RACK = 'aeinrst'
+
+# Cases faster than this are compared on absolute time only, to ignore timer noise
+NOISE_FLOOR_MS = 1.0
+
+# Median time allowed for every move of a 7-tile rack without blanks on the
+# mid-game position, checked by --compare whatever the baseline says
+MOVE_BUDGET_MS = 100.0
+
+# Pattern queries timed with and without a rack: fixed letters, prefix/suffix, inner letters
+PATTERNS = ('?a??e', 's*ing', '*x*z*')
+
+
+def make_rack(length: int, blanks: int, seed: int = 0) -> str:
+    """
+    Draw a reproducible rack from the tile bag.
+
+    Args:
+        length: Total rack length including blanks
+        blanks: Number of blank tiles in the rack
+        seed: Random seed
+
+    Returns:
+        Rack letters with blanks written as '?'
+    """
+    rng = random.Random(f'{seed}-{length}-{blanks}')
+    return ''.join(rng.sample(TILE_BAG, length - blanks)) + BLANK * blanks
+
+
+def make_board() -> Board:
+    """A fixed mid-game position for the board move generator."""
+    return Board.from_rows(MIDGAME_ROWS)
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """
+    Time a callable and record its peak traced memory.
+
+    Timing runs are untraced; one extra run under tracemalloc gives the
+    peak memory allocated while the callable runs.
+
+    Args:
+        func: Zero-argument callable to benchmark
+        repeat: Number of timed runs
+
+    Returns:
+        Dictionary with median/min time in milliseconds and peak memory in KiB
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'median_ms': round(statistics.median(times), 3),
+        'min_ms': round(min(times), 3),
+        'peak_kib': round(peak / 1024, 1)
+    }
+
+
+def run_benchmarks(engines: List[str], quick: bool = False, repeat: int = 3,
+                   log: Callable[[str], None] = print) -> Dict[str, Dict[str, float]]:
+    """
+    Run every benchmark case.
+
+    Args:
+        engines: Search engines to benchmark
+        quick: Use fewer rack lengths
+        repeat: Timed runs per case
+        log: Progress callback receiving one line per case
+
+    Returns:
+        Mapping of case name to its measurements
+    """
+    results = {}
+
+    def record(name, func, case_repeat=repeat):
+        results[name] = measure(func, case_repeat)
+        log(f"{name:<40} {results[name]['median_ms']:>10.2f} ms {results[name]['peak_kib']:>12.1f} KiB")
+
+    record('load_dictionary', lambda: load_dictionary(DICTIONARY_PATH), 1)
+    record('load_compiled_dictionary', lambda: load_compiled_dictionary(DICTIONARY_PATH))
+    dictionary = load_compiled_dictionary(DICTIONARY_PATH)
+
+    # Word graph builds, with the size of the packed arrays each one produces
+    record('build/dawg', lambda: CompactDawg.from_dawg(Dawg(dictionary)), 1)
+    record('build/gaddag', lambda: Gaddag.from_words(dictionary), 1)
+    for name, graph in (('dawg', dictionary.dawg), ('gaddag', dictionary.gaddag)):
+        results[f'build/{name}'].update(nodes=graph.node_count, size_kib=round(graph.nbytes / 1024, 1))
+        log(f"{name + ' graph':<40} {graph.node_count:>10} nodes {graph.nbytes / 1024:>9.1f} KiB packed")
+
+    lengths = QUICK_RACK_LENGTHS if quick else RACK_LENGTHS
+    for engine in engines:
+        # Build lazy indexes up front so they are not charged to the first rack
+        generate_valid_words('ab?', dictionary, engine)
+        for length in lengths:
+            for blanks in BLANK_COUNTS:
+                if blanks >= length:
+                    continue
+                rack = make_rack(length, blanks)
+                record(f'generate/{engine}/len{length}/blanks{blanks}',
+                       lambda: generate_valid_words(rack, dictionary, engine))
+
+    # The n best words by best-first search, against the top n of a full search
+    record('build/signature_bounds', lambda: subtree_bounds(dictionary.signature_dawg), 1)
+    dictionary.signature_bounds
+    for length in (7, 12, 15):
+        rack = make_rack(length, 2)
+        record(f'best_words/20/len{length}/blanks2', lambda: best_words(rack, dictionary, 20))
+        record(f'find_words_limit/20/len{length}/blanks2', lambda: find_words(rack, dictionary, limit=20))
+
+    board = make_board()
+    for backend in BACKENDS:
+        for rack in (make_rack(7, 0), make_rack(7, 1), MIDGAME_RACK):
+            record(f'generate_moves/{backend}/{rack}', lambda: generate_moves(board, rack, dictionary, backend))
+
+    record('build/pattern_index', lambda: PatternIndex.from_words(dictionary), 1)
+    for pattern in PATTERNS:
+        for rack in (None, make_rack(7, 1)):
+            record(f'find_pattern/{pattern}/{rack or "any"}', lambda: find_pattern_words(pattern, dictionary, rack))
+
+    # A large result set for the post-processing helpers
+    words = find_words(make_rack(15, 2), dictionary)
+    filters = {'min_length': 4, 'max_length': 12, 'starts_with': 's'}
+    record(f'apply_filters/{len(words)}', lambda: apply_filters(words, filters))
+    # The same filters pushed down into each engine's search
+    for engine in engines:
+        record(f'find_words_filtered/{engine}', lambda: find_words(make_rack(15, 2), dictionary, engine, filters))
+    for group_by in ('length', 'first_letter', 'last_letter'):
+        record(f'group_words/{group_by}/{len(words)}', lambda: group_words(words, group_by))
+    record(f'apply_sorting/{len(words)}',
+           lambda: apply_sorting(group_words(words, 'length'), 'asc', 'score'))
+    for sort_by in ('score', 'alphabetical'):
+        record(f'group_and_sort/{sort_by}/{len(words)}',
+               lambda: group_and_sort(words, 'first_letter', 'desc', sort_by))
+    record(f'sort_flat_words/{len(words)}', lambda: sort_flat_words(words, 'alphabetical'))
+    for result_format in RESULT_FORMATS:
+        record(f'encode_words/{result_format}/{len(words)}', lambda: json.dumps(encode_words(words, result_format)))
+
+    # End to end through Flask; the result cache is cleared so every run solves
+    import app as web_app
+    client = web_app.app.test_client()
+    for length, blanks in ((7, 0), (7, 2), (12, 1)):
+        rack = make_rack(length, blanks)
+        for view_type in ('grouped', 'flat'):
+            def solve_request():
+                web_app.result_cache.clear()
+                response = client.post('/solve', json={'letters': rack, 'view_type': view_type})
+                assert response.status_code == 200, response.get_data(as_text=True)
+            record(f'http/solve/{view_type}/len{length}/blanks{blanks}', solve_request)
+        # One page of the cached result set, as a client paging through results would fetch
+        client.post('/solve', json={'letters': rack})
+        for sort_by in ('score', 'alphabetical'):
+            def page_request():
+                response = client.post('/solve', json={'letters': rack, 'view_type': 'flat', 'limit': 20,
+                                                       'sort_within_groups': sort_by})
+                assert response.status_code == 200, response.get_data(as_text=True)
+            record(f'http/solve/page20/{sort_by}/len{length}/blanks{blanks}', page_request)
+
+    return results
+
+
+def compare(current: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float) -> List[str]:
+    """
+    Find cases that regressed against a baseline.
+
+    A case regresses when its median time or peak memory grows by more
+    than the threshold fraction. Times under NOISE_FLOOR_MS only count when
+    they cross the floor.
+
+    Args:
+        current: Measurements from this run
+        baseline: Measurements from the baseline file
+        threshold: Allowed fractional slowdown (0.25 = 25%)
+
+    Returns:
+        Human-readable descriptions of every regression
+    """
+    regressions = []
+    for name, measured in current.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+
+        allowed_ms = max(reference['median_ms'] * (1 + threshold), NOISE_FLOOR_MS)
+        if measured['median_ms'] > allowed_ms:
+            regressions.append(f"{name}: {reference['median_ms']:.2f} ms -> {measured['median_ms']:.2f} ms")
+
+        allowed_kib = reference['peak_kib'] * (1 + threshold) + 64
+        if measured['peak_kib'] > allowed_kib:
+            regressions.append(f"{name}: {reference['peak_kib']:.1f} KiB -> {measured['peak_kib']:.1f} KiB")
+    return regressions
+
+
+def time_budgets() -> Dict[str, float]:
+    """Absolute median time limits in milliseconds, by case name."""
+    return {f'generate_moves/{backend}/{rack}': MOVE_BUDGET_MS
+            for backend in BACKENDS for rack in (make_rack(7, 0), MIDGAME_RACK)}
+
+
+def over_budget(current: Dict[str, Dict[str, float]], budgets: Dict[str, float]) -> List[str]:
+    """
+    Find cases slower than their absolute time budget.
+
+    Args:
+        current: Measurements from this run
+        budgets: Allowed median time in milliseconds, by case name
+
+    Returns:
+        Human-readable descriptions of every case over budget
+    """
+    return [f"{name}: {current[name]['median_ms']:.2f} ms, over its {limit:.0f} ms budget"
+            for name, limit in budgets.items()
+            if name in current and current[name]['median_ms'] > limit]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the Scrabble Word Solver.')
+    parser.add_argument('--engines', nargs='+', default=sorted(ENGINES), choices=sorted(ENGINES),
+                        help='search engines to benchmark (default: all available)')
+    parser.add_argument('--quick', action='store_true', help='benchmark fewer rack lengths')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case (default: 3)')
+    parser.add_argument('--save', metavar='PATH', help='write results as a JSON baseline')
+    parser.add_argument('--compare', metavar='PATH', help='fail if slower than this baseline')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed regression as a fraction (default: 0.25)')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.engines, quick=args.quick, repeat=args.repeat)
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump({
+                'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'results': results
+            }, file, indent=2, sort_keys=True)
+        print(f'Saved baseline to {args.save}')
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)['results']
+        regressions = compare(results, baseline, args.threshold) + over_budget(results, time_budgets())
+        if regressions:
+            print(f'{len(regressions)} regression(s) beyond {args.threshold:.0%} or over a time budget:')
+            for regression in regressions:
+                print(f'  {regression}')
+            return 1
+        print(f'No regressions beyond {args.threshold:.0%}')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
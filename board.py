@@ -0,0 +1,325 @@
+"""
+Game board for Scrabble Word Solver.
+Holds the tiles and premium squares of a 15x15 board and derives the anchor
+squares, cross-check letter sets and cross-word scores used by the move
+generator.
+"""
+
+from functools import partial
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+from scrabble_solver import SCRABBLE_SCORES
+
+BOARD_SIZE = 15
+CENTER = BOARD_SIZE // 2
+
+ACROSS = 'across'
+DOWN = 'down'
+
+# Character used for empty squares in Board.from_rows / str(board)
+EMPTY = '.'
+
+# Bonus for playing every tile of a full rack in one move
+RACK_SIZE = 7
+BINGO_BONUS = 50
+
+# Premium squares of the standard board: T/D triple/double word, t/d triple/double letter
+PREMIUM_LAYOUT = (
+    'T..d...T...d..T',
+    '.D...t...t...D.',
+    '..D...d.d...D..',
+    'd..D...d...D..d',
+    '....D.....D....',
+    '.t...t...t...t.',
+    '..d...d.d...d..',
+    'T..d...D...d..T',
+    '..d...d.d...d..',
+    '.t...t...t...t.',
+    '....D.....D....',
+    'd..D...d...D..d',
+    '..D...d.d...D..',
+    '.D...t...t...D.',
+    'T..d...T...d..T',
+)
+
+# (letter multiplier, word multiplier) for each layout character
+PREMIUMS = {'T': (1, 3), 'D': (1, 2), 't': (3, 1), 'd': (2, 1), EMPTY: (1, 1)}
+
+Square = Tuple[int, int]
+
+
+class Board:
+    """
+    A square board of placed tiles.
+
+    ``cells[row][col]`` holds a lowercase letter or None; squares holding a
+    blank tile are listed in ``blanks`` (their letter scores 0).
+    ``letter_multipliers`` and ``word_multipliers`` hold each square's
+    premium, which only counts for a tile placed on it in the current move.
+
+    ``cross_scores[direction][row][col]`` is the face value of the tiles a
+    play in that direction would join at right angles on an empty square
+    (None where there are none). ``place`` keeps it up to date by
+    recomputing only the squares at the ends of the runs the new tiles touch.
+    """
+
+    def __init__(self, size: int = BOARD_SIZE, layout: Optional[Sequence[str]] = None):
+        """
+        Args:
+            size: Squares per side
+            layout: Premium layout rows (see PREMIUM_LAYOUT); defaults to the
+                standard layout on a 15x15 board and no premiums otherwise
+        """
+        self.size = size
+        self.cells: List[List[Optional[str]]] = [[None] * size for _ in range(size)]
+        self.blanks: Set[Square] = set()
+
+        if layout is None:
+            layout = PREMIUM_LAYOUT if size == BOARD_SIZE else [EMPTY * size] * size
+        self.letter_multipliers = [[PREMIUMS[char][0] for char in line] for line in layout]
+        self.word_multipliers = [[PREMIUMS[char][1] for char in line] for line in layout]
+        self.cross_scores: Dict[str, List[List[Optional[int]]]] = {
+            ACROSS: [[None] * size for _ in range(size)],
+            DOWN: [[None] * size for _ in range(size)],
+        }
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[str], blanks: Iterable[Square] = (),
+                  layout: Optional[Sequence[str]] = None) -> 'Board':
+        """
+        Build a board from one string per row.
+
+        Args:
+            rows: Row strings using letters for tiles and '.' for empty squares
+            blanks: Squares whose tiles are blanks
+            layout: Premium layout rows (see Board)
+
+        Returns:
+            New Board
+        """
+        rows = list(rows)
+        board = cls(len(rows), layout)
+        for row, line in enumerate(rows):
+            if len(line) != board.size:
+                raise ValueError(f'Row {row} has {len(line)} squares, expected {board.size}')
+            for col, char in enumerate(line):
+                if char != EMPTY:
+                    board.cells[row][col] = char.lower()
+        board.blanks = set(blanks)
+        for row in range(board.size):
+            for col in range(board.size):
+                board._update_cross_scores(row, col)
+        return board
+
+    def __str__(self) -> str:
+        return '\n'.join(''.join(cell or EMPTY for cell in row) for row in self.cells)
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        return 0 <= row < self.size and 0 <= col < self.size
+
+    def get(self, row: int, col: int) -> Optional[str]:
+        """Letter on a square, or None if it is empty or off the board."""
+        if 0 <= row < self.size and 0 <= col < self.size:
+            return self.cells[row][col]
+        return None
+
+    def is_empty(self) -> bool:
+        """True if no tile has been played yet."""
+        return not any(any(row) for row in self.cells)
+
+    def tile_value(self, row: int, col: int) -> int:
+        """Face value of the tile on a square (0 for blanks and empty squares)."""
+        letter = self.cells[row][col]
+        if letter is None or (row, col) in self.blanks:
+            return 0
+        return SCRABBLE_SCORES[letter]
+
+    def place(self, tiles: Iterable[Tuple[int, int, str, bool]]) -> None:
+        """
+        Put tiles on the board and refresh the cross-scores around them.
+
+        Args:
+            tiles: (row, col, letter, is_blank) for each new tile
+        """
+        tiles = list(tiles)
+        for row, col, letter, is_blank in tiles:
+            if self.cells[row][col] is not None:
+                raise ValueError(f'Square ({row}, {col}) is already occupied')
+            self.cells[row][col] = letter
+            if is_blank:
+                self.blanks.add((row, col))
+
+        # Only the empty squares just beyond each run through a new tile can change
+        touched = set()
+        for row, col, _, _ in tiles:
+            for d_row, d_col in ((1, 0), (0, 1)):
+                r, c = row, col
+                while self.get(r, c) is not None:
+                    r, c = r - d_row, c - d_col
+                touched.add((r, c))
+                r, c = row, col
+                while self.get(r, c) is not None:
+                    r, c = r + d_row, c + d_col
+                touched.add((r, c))
+            touched.add((row, col))
+        for row, col in touched:
+            if self.in_bounds(row, col):
+                self._update_cross_scores(row, col)
+
+    def _update_cross_scores(self, row: int, col: int) -> None:
+        """Recompute both cross-scores of one square from its neighbouring runs."""
+        for direction, d_row, d_col in ((ACROSS, 1, 0), (DOWN, 0, 1)):
+            score = None
+            if self.cells[row][col] is None:
+                for step in (-1, 1):
+                    r, c = row + step * d_row, col + step * d_col
+                    while self.get(r, c) is not None:
+                        score = (score or 0) + self.tile_value(r, c)
+                        r, c = r + step * d_row, c + step * d_col
+            self.cross_scores[direction][row][col] = score
+
+    def transposed(self) -> 'Board':
+        """Copy of the board mirrored along the main diagonal (down becomes across)."""
+        board = Board(self.size)
+        board.cells = [list(column) for column in zip(*self.cells)]
+        board.blanks = {(col, row) for row, col in self.blanks}
+        board.letter_multipliers = [list(column) for column in zip(*self.letter_multipliers)]
+        board.word_multipliers = [list(column) for column in zip(*self.word_multipliers)]
+        board.cross_scores = {
+            ACROSS: [list(column) for column in zip(*self.cross_scores[DOWN])],
+            DOWN: [list(column) for column in zip(*self.cross_scores[ACROSS])],
+        }
+        return board
+
+    def score_play(self, tiles: Sequence[Tuple[int, int, str, bool]], direction: str) -> int:
+        """
+        Score a play of new tiles that are not yet on the board.
+
+        The main word and every cross-word formed count, with letter and word
+        premiums applied only under new tiles, plus BINGO_BONUS when a whole
+        rack is played.
+
+        Args:
+            tiles: (row, col, letter, is_blank) for each new tile
+            direction: ACROSS or DOWN, the direction of the main word
+
+        Returns:
+            Total score of the play
+        """
+        d_row, d_col = (0, 1) if direction == ACROSS else (1, 0)
+        new = {(row, col): (letter, is_blank) for row, col, letter, is_blank in tiles}
+        cross_scores = self.cross_scores[direction]
+
+        main = cross = 0
+        multiplier = 1
+        row, col = min(new)
+        while self.get(row - d_row, col - d_col) is not None:
+            row, col = row - d_row, col - d_col
+        length = 0
+        while (row, col) in new or self.get(row, col) is not None:
+            if (row, col) in new:
+                letter, is_blank = new[(row, col)]
+                tile_score = 0 if is_blank else SCRABBLE_SCORES[letter] * self.letter_multipliers[row][col]
+                word_multiplier = self.word_multipliers[row][col]
+                main += tile_score
+                multiplier *= word_multiplier
+                if cross_scores[row][col] is not None:
+                    cross += (cross_scores[row][col] + tile_score) * word_multiplier
+            else:
+                main += self.tile_value(row, col)
+            length += 1
+            row, col = row + d_row, col + d_col
+
+        score = cross + (main * multiplier if length > 1 else 0)
+        if len(new) == RACK_SIZE:
+            score += BINGO_BONUS
+        return score
+
+    def anchors(self) -> Set[Square]:
+        """
+        Empty squares next to a tile, where every new move must touch down.
+
+        On an empty board the only anchor is the centre square.
+        """
+        if self.is_empty():
+            return {(self.size // 2, self.size // 2)}
+        anchors = set()
+        for row in range(self.size):
+            for col in range(self.size):
+                if self.cells[row][col] is not None:
+                    continue
+                if (self.get(row - 1, col) or self.get(row + 1, col) or
+                        self.get(row, col - 1) or self.get(row, col + 1)):
+                    anchors.add((row, col))
+        return anchors
+
+    def vertical_word_parts(self, row: int, col: int) -> Tuple[str, str]:
+        """Contiguous letters directly above and below an empty square."""
+        above = []
+        r = row - 1
+        while r >= 0 and self.cells[r][col] is not None:
+            above.append(self.cells[r][col])
+            r -= 1
+        below = []
+        r = row + 1
+        while r < self.size and self.cells[r][col] is not None:
+            below.append(self.cells[r][col])
+            r += 1
+        return ''.join(reversed(above)), ''.join(below)
+
+    def cross_checks(self, graph) -> Dict[Square, FrozenSet[str]]:
+        """
+        Letters allowed on each empty square for moves played across.
+
+        A square with a tile above or below it only accepts letters that
+        complete a valid vertical word; squares missing from the result
+        have no vertical neighbours and accept any letter.
+
+        Args:
+            graph: Word graph exposing root/child/edges/is_terminal (see dawg.Dawg);
+                a graph with its own allowed_letters(before, after) method, such
+                as the GADDAG, is asked directly
+
+        Returns:
+            Mapping of constrained squares to their allowed letters
+        """
+        letters_for = getattr(graph, 'allowed_letters', None) or partial(allowed_letters, graph)
+        checks = {}
+        for row in range(self.size):
+            for col in range(self.size):
+                if self.cells[row][col] is not None:
+                    continue
+                above, below = self.vertical_word_parts(row, col)
+                if above or below:
+                    checks[(row, col)] = letters_for(above, below)
+        return checks
+
+
+def allowed_letters(graph, before: str, after: str) -> FrozenSet[str]:
+    """
+    Letters that make before + letter + after a word in the graph.
+
+    Args:
+        graph: Word graph exposing root/child/edges/is_terminal
+        before: Fixed letters preceding the square
+        after: Fixed letters following the square
+
+    Returns:
+        Frozen set of allowed letters
+    """
+    node = graph.root
+    for letter in before:
+        node = graph.child(node, letter)
+        if node is None:
+            return frozenset()
+
+    allowed = []
+    for letter, child in graph.edges(node):
+        for next_letter in after:
+            child = graph.child(child, next_letter)
+            if child is None:
+                break
+        else:
+            if graph.is_terminal(child):
+                allowed.append(letter)
+    return frozenset(allowed)
@@ -0,0 +1,441 @@
+"""
+Directed acyclic word graph (minimized trie) for Scrabble Word Solver.
+Provides prefix-pruned searches over a rack of letters.
+"""
+
+import string
+from array import array
+from collections import Counter, deque
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Rack searches given a budget (anything with an exhausted(found) method, such
+# as scrabble_solver.SearchBudget) check it at every node this close to the root
+BUDGET_CHECK_DEPTH = 3
+
+
+class _OutOfBudget(Exception):
+    """Unwinds a rack search whose budget has run out."""
+
+
+class DawgNode:
+    """A single state in the word graph."""
+
+    __slots__ = ('children', 'terminal')
+
+    def __init__(self):
+        self.children: Dict[str, 'DawgNode'] = {}
+        self.terminal = False
+
+    def key(self):
+        """Structural identity used to merge equivalent suffix states."""
+        return (self.terminal,
+                tuple((letter, id(child)) for letter, child in sorted(self.children.items())))
+
+
+class Dawg:
+    """
+    Minimized trie built incrementally from a sorted word list.
+
+    Equivalent suffix states are merged as soon as a branch can no longer
+    change, so the graph never holds the full unminimized trie.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        self.root = DawgNode()
+        self.node_count = 1
+        self._previous = ''
+        self._unchecked = []
+        self._minimized = {}
+
+        for word in sorted(set(words)):
+            self._insert(word)
+        self._minimize(0)
+
+        # Only needed while building
+        del self._previous, self._unchecked, self._minimized
+
+    def _insert(self, word: str) -> None:
+        common = 0
+        for a, b in zip(word, self._previous):
+            if a != b:
+                break
+            common += 1
+
+        self._minimize(common)
+
+        node = self.root if not self._unchecked else self._unchecked[-1][2]
+        for letter in word[common:]:
+            child = DawgNode()
+            node.children[letter] = child
+            self._unchecked.append((node, letter, child))
+            node = child
+
+        node.terminal = True
+        self._previous = word
+
+    def _minimize(self, down_to: int) -> None:
+        while len(self._unchecked) > down_to:
+            parent, letter, child = self._unchecked.pop()
+            key = child.key()
+            existing = self._minimized.get(key)
+            if existing is not None:
+                parent.children[letter] = existing
+            else:
+                self._minimized[key] = child
+                self.node_count += 1
+
+    # Node-level interface shared by every word graph, used by the board move generator
+
+    def edges(self, node: DawgNode):
+        """(letter, child) pairs leaving a node, in letter order."""
+        return node.children.items()
+
+    def child(self, node: DawgNode, letter: str) -> Optional[DawgNode]:
+        """The node reached by following one letter, or None."""
+        return node.children.get(letter)
+
+    def is_terminal(self, node: DawgNode) -> bool:
+        """True if a word ends at the node."""
+        return node.terminal
+
+    def __contains__(self, word: str) -> bool:
+        node = self.root
+        for letter in word:
+            node = node.children.get(letter)
+            if node is None:
+                return False
+        return node.terminal
+
+    def has_prefix(self, prefix: str) -> bool:
+        """Return True if any word in the graph starts with the prefix."""
+        node = self.root
+        for letter in prefix:
+            node = node.children.get(letter)
+            if node is None:
+                return False
+        return True
+
+    def words_from_rack(self, letters: str) -> List[str]:
+        """
+        Find every word that can be spelled from the rack.
+
+        Args:
+            letters: Rack letters (repeats allowed)
+
+        Returns:
+            List of distinct words in depth-first order
+        """
+        return [word for word, _, _ in self.search_rack(letters)]
+
+    def search_rack(self, letters: str, blanks: int = 0,
+                    letter_values: Optional[Dict[str, int]] = None,
+                    max_length: Optional[int] = None,
+                    first_letter: Optional[str] = None,
+                    budget: Any = None) -> List[Tuple[str, str, int]]:
+        """
+        Find every word that can be spelled from the rack plus blank tiles.
+
+        Branches are abandoned as soon as their prefix leaves the graph. A
+        blank is only spent on a letter once the rack has no real copy of
+        it left, so each word is produced exactly once, with the fewest
+        (and therefore cheapest) blanks. Scores are summed along the path,
+        counting only real tiles.
+
+        Args:
+            letters: Rack letters (repeats allowed)
+            blanks: Number of blank tiles that may stand for any letter
+            letter_values: Per-letter scores (all 0 if omitted)
+            max_length: Do not extend words past this length
+            first_letter: Only spell words starting with this letter
+            budget: Search budget; once exhausted the search stops and
+                returns the words found so far
+
+        Returns:
+            List of (word, blank_letters, score) tuples in depth-first order
+        """
+        values = letter_values or {}
+        counts = Counter(letters)
+        limit = max_length if max_length is not None else len(letters) + blanks
+        found = []
+        prefix = []
+        blank_letters = []
+
+        def extend(node, blanks_left, score):
+            if budget is not None and len(prefix) < BUDGET_CHECK_DEPTH and budget.exhausted(len(found)):
+                raise _OutOfBudget
+            if first_letter and not prefix:
+                candidates = [(first_letter, node.children.get(first_letter))]
+            elif blanks_left:
+                candidates = node.children.items()
+            else:
+                candidates = [(letter, node.children.get(letter))
+                              for letter, remaining in counts.items() if remaining]
+            for letter, child in candidates:
+                if child is None:
+                    continue
+                remaining = counts.get(letter, 0)
+                if remaining:
+                    counts[letter] = remaining - 1
+                    letter_score = values.get(letter, 0)
+                elif blanks_left:
+                    letter_score = 0
+                    blank_letters.append(letter)
+                    blanks_left -= 1
+                else:
+                    continue
+                prefix.append(letter)
+                if child.terminal:
+                    found.append((''.join(prefix), ''.join(blank_letters), score + letter_score))
+                if child.children and len(prefix) < limit:
+                    extend(child, blanks_left, score + letter_score)
+                prefix.pop()
+                if remaining:
+                    counts[letter] = remaining
+                else:
+                    blank_letters.pop()
+                    blanks_left += 1
+
+        try:
+            extend(self.root, blanks, 0)
+        except _OutOfBudget:
+            pass
+        return found
+
+
+class CompactDawg:
+    """
+    Array-backed word graph that can live in a shared, memory-mapped file.
+
+    Node ``n`` owns the edges ``edge_start[n]:edge_start[n + 1]``; each edge
+    has a letter byte and a target node id, and ``terminal[n]`` is 1 when a
+    word ends at node ``n``. The root is node 0.
+
+    ``edge_masks[n]`` has bit ``letter_bit(letter)`` set for every edge of
+    node ``n``, so a child is found in constant time: its edge index is the
+    number of lower bits set. This relies on edges being sorted by letter,
+    which orders them the same way as their bits for a-z plus MARKER, the
+    one character below 'a' (see letter_bit); any other character finds no edge.
+    """
+
+    SECTIONS = ('edge_start', 'edge_letters', 'edge_targets', 'edge_masks', 'terminal')
+
+    def __init__(self, edge_start: Sequence[int], edge_letters: Sequence[int],
+                 edge_targets: Sequence[int], edge_masks: Sequence[int], terminal: Sequence[int]):
+        self.edge_start = edge_start
+        self.edge_letters = edge_letters
+        self.edge_targets = edge_targets
+        self.edge_masks = edge_masks
+        self.terminal = terminal
+        self.node_count = len(terminal)
+        self.root = 0
+
+    @classmethod
+    def from_dawg(cls, dawg: Dawg) -> 'CompactDawg':
+        """Number the nodes of a built Dawg breadth-first and pack its edges."""
+        ids = {id(dawg.root): 0}
+        order = [dawg.root]
+        queue = deque(order)
+        while queue:
+            node = queue.popleft()
+            for _, child in sorted(node.children.items()):
+                if id(child) not in ids:
+                    ids[id(child)] = len(order)
+                    order.append(child)
+                    queue.append(child)
+
+        edge_start = array('I', [0])
+        edge_letters = bytearray()
+        edge_targets = array('I')
+        edge_masks = array('I')
+        terminal = bytearray()
+        for node in order:
+            mask = 0
+            for letter, child in sorted(node.children.items()):
+                edge_letters.append(ord(letter))
+                edge_targets.append(ids[id(child)])
+                mask |= letter_bit(letter)
+            edge_start.append(len(edge_targets))
+            edge_masks.append(mask)
+            terminal.append(node.terminal)
+
+        return cls(edge_start, bytes(edge_letters), edge_targets, edge_masks, bytes(terminal))
+
+    @classmethod
+    def from_sections(cls, sections: Dict[str, memoryview]) -> 'CompactDawg':
+        """Wrap buffers written by sections() (e.g. mapped from a file) without copying them."""
+        return cls(
+            sections['edge_start'].cast('I'),
+            sections['edge_letters'],
+            sections['edge_targets'].cast('I'),
+            sections['edge_masks'].cast('I'),
+            sections['terminal'],
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the graph arrays in bytes."""
+        return sum(memoryview(getattr(self, name)).nbytes for name in self.SECTIONS)
+
+    def sections(self) -> Dict[str, bytes]:
+        """Raw little-endian buffers for each array, keyed by section name."""
+        return {name: bytes(getattr(self, name)) for name in self.SECTIONS}
+
+    def edges(self, node: int):
+        """(letter, child) pairs leaving a node, in letter order."""
+        start, end = self.edge_start[node], self.edge_start[node + 1]
+        return zip(map(_LETTERS.__getitem__, self.edge_letters[start:end]), self.edge_targets[start:end])
+
+    def child(self, node: int, letter: str) -> Optional[int]:
+        """The node reached by following one letter, or None."""
+        bit = _LETTER_BITS.get(letter, 0)
+        mask = self.edge_masks[node]
+        if not mask & bit:
+            return None
+        return self.edge_targets[self.edge_start[node] + (mask & (bit - 1)).bit_count()]
+
+    def is_terminal(self, node: int) -> bool:
+        """True if a word ends at the node."""
+        return bool(self.terminal[node])
+
+    def _edge_range(self, node: int, letter: Optional[str] = None) -> range:
+        """Edge indexes of a node, or only the one labelled with the letter if given."""
+        start = self.edge_start[node]
+        if not letter:
+            return range(start, self.edge_start[node + 1])
+        bit = _LETTER_BITS.get(letter, 0)
+        mask = self.edge_masks[node]
+        if not mask & bit:
+            return range(0)
+        edge = start + (mask & (bit - 1)).bit_count()
+        return range(edge, edge + 1)
+
+    def _walk(self, prefix: str) -> Optional[int]:
+        node = 0
+        for letter in prefix:
+            node = self.child(node, letter)
+            if node is None:
+                break
+        return node
+
+    def __contains__(self, word: str) -> bool:
+        node = self._walk(word)
+        return node is not None and bool(self.terminal[node])
+
+    def has_prefix(self, prefix: str) -> bool:
+        """Return True if any word in the graph starts with the prefix."""
+        return self._walk(prefix) is not None
+
+    def words_from_rack(self, letters: str) -> List[str]:
+        """Find every word that can be spelled from the rack (see Dawg.words_from_rack)."""
+        return [word for word, _, _ in self.search_rack(letters)]
+
+    def search_rack(self, letters: str, blanks: int = 0,
+                    letter_values: Optional[Dict[str, int]] = None,
+                    max_length: Optional[int] = None,
+                    first_letter: Optional[str] = None,
+                    budget: Any = None) -> List[Tuple[str, str, int]]:
+        """Find every word the rack plus blanks can spell (see Dawg.search_rack)."""
+        values = letter_values or {}
+        edge_start, edge_letters = self.edge_start, self.edge_letters
+        edge_targets, terminal = self.edge_targets, self.terminal
+        counts = Counter(letters)
+        limit = max_length if max_length is not None else len(letters) + blanks
+        found = []
+        prefix = []
+        blank_letters = []
+
+        def extend(node, blanks_left, score):
+            if budget is not None and len(prefix) < BUDGET_CHECK_DEPTH and budget.exhausted(len(found)):
+                raise _OutOfBudget
+            for edge in self._edge_range(node, first_letter if not prefix else None):
+                letter = _LETTERS[edge_letters[edge]]
+                remaining = counts.get(letter, 0)
+                if remaining:
+                    counts[letter] = remaining - 1
+                    letter_score = values.get(letter, 0)
+                elif blanks_left:
+                    letter_score = 0
+                    blank_letters.append(letter)
+                    blanks_left -= 1
+                else:
+                    continue
+                child = edge_targets[edge]
+                prefix.append(letter)
+                if terminal[child]:
+                    found.append((''.join(prefix), ''.join(blank_letters), score + letter_score))
+                if edge_start[child] != edge_start[child + 1] and len(prefix) < limit:
+                    extend(child, blanks_left, score + letter_score)
+                prefix.pop()
+                if remaining:
+                    counts[letter] = remaining
+                else:
+                    blank_letters.pop()
+                    blanks_left += 1
+
+        try:
+            extend(self.root, blanks, 0)
+        except _OutOfBudget:
+            pass
+        return found
+
+
+def subtree_bounds(graph) -> Tuple[Sequence[int], Sequence[int]]:
+    """
+    Per-node limits on what any path below a node can still spell.
+
+    Used to bound the best score a partial word can reach: no word through a
+    node is longer than its height past the node, and none uses a letter
+    outside its mask.
+
+    Args:
+        graph: Word graph exposing root/edges (Dawg or CompactDawg)
+
+    Returns:
+        (heights, masks), both indexed by node: the length of the longest
+        path below each node and the letter_bit mask of every letter on
+        those paths. They are arrays by node id for a CompactDawg, so they
+        can be stored alongside it, and dicts by node otherwise.
+    """
+    heights = {}
+    masks = {}
+    stack = [(graph.root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if node in heights:
+            continue
+        edges = list(graph.edges(node))
+        if not expanded:
+            stack.append((node, True))
+            stack.extend((child, False) for _, child in edges if child not in heights)
+            continue
+        height = mask = 0
+        for letter, child in edges:
+            height = max(height, heights[child] + 1)
+            mask |= masks[child] | letter_bit(letter)
+        heights[node] = height
+        masks[node] = mask
+
+    if isinstance(graph, CompactDawg):
+        nodes = range(graph.node_count)
+        return array('B', map(heights.__getitem__, nodes)), array('I', map(masks.__getitem__, nodes))
+    return heights, masks
+
+
+_LETTERS = [chr(code) for code in range(256)]
+
+# The one character sorting before 'a' that edge masks can hold (the GADDAG separator)
+MARKER = '@'
+
+# Bits of the characters edge masks can hold (see letter_bit)
+_LETTER_BITS = {letter: 1 << (ord(letter) & 31) for letter in MARKER + string.ascii_lowercase}
+
+
+def letter_bit(letter: str) -> int:
+    """
+    Bit standing for a letter in CompactDawg.edge_masks.
+
+    Letters a-z map to bits 1-26 in alphabetical order and MARKER to bit 0.
+    Any other character gets no bit (0) and so matches no edge, rather than
+    aliasing onto a letter with the same low bits ('A' onto 'a', 'é' onto 'i').
+    """
+    return _LETTER_BITS.get(letter, 0)
@@ -0,0 +1,244 @@
+"""
+GADDAG word graph for Scrabble Word Solver.
+
+A GADDAG stores every word ``w`` once per split point ``i`` as
+``reverse(w[:i]) + SEPARATOR + w[i:]``, so a word can be read outward from
+any of its letters: first leftwards, then (after the separator) rightwards.
+Board plays can therefore be grown from an anchor square in both directions
+instead of guessing the left part first.
+
+The graph is packed into the same flat arrays as ``CompactDawg`` (see
+``Gaddag.from_words`` for what the build holds), and can be serialized and
+memory-mapped like the other word graphs (see ``lexicon_file``).
+"""
+
+from array import array
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from dawg import BUDGET_CHECK_DEPTH, MARKER, CompactDawg, _LETTERS, _OutOfBudget, letter_bit
+
+# Marks the switch from reading leftwards to reading rightwards; it is the one
+# character sorting before 'a' that CompactDawg's edge masks can hold with the
+# letters (see dawg.letter_bit)
+SEPARATOR = MARKER
+
+
+def gaddag_paths(words: Iterable[str], first_letter: Optional[str] = None) -> List[str]:
+    """
+    Every GADDAG path of the words, sorted.
+
+    Args:
+        words: Words to encode
+        first_letter: Only return paths starting with this letter
+
+    Returns:
+        Sorted list of reverse-prefix + SEPARATOR + suffix strings
+    """
+    paths = []
+    for word in words:
+        if first_letter is None:
+            splits = range(1, len(word) + 1)
+        else:
+            splits = []
+            index = word.find(first_letter)
+            while index >= 0:
+                splits.append(index + 1)
+                index = word.find(first_letter, index + 1)
+        for split in splits:
+            paths.append(word[split - 1::-1] + SEPARATOR + word[split:])
+    paths.sort()
+    return paths
+
+
+class Gaddag(CompactDawg):
+    """
+    Minimized GADDAG in CompactDawg's array encoding; the root is node 0.
+
+    Only nodes reached after the separator can be terminal, and a node with
+    a terminal separator child spells (reversed) a complete word.
+    """
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> 'Gaddag':
+        """
+        Build the minimized GADDAG of a word list.
+
+        Paths are generated one leading letter at a time, already sorted, and
+        merged into equivalent suffix states as soon as a branch is final, so
+        neither all paths nor the unminimized trie are held in memory at once.
+
+        The minimized graph itself is held as Python objects until it is
+        packed: one tuple per node (its terminal flag and edges), kept in
+        ``nodes`` and shared as the key of ``register``, which finds
+        equivalent nodes. With one leading letter's paths alongside, peak
+        memory during the build is around ten times the finished graph's
+        nbytes.
+        """
+        words = sorted(set(words))
+        # Closed nodes by id (children first); each is (terminal, letter, child, letter, child, ...)
+        nodes: List[tuple] = []
+        register: Dict[tuple, int] = {}
+        # Open nodes along the current path: [terminal, edges]
+        path = [[False, []]]
+        previous = ''
+
+        def close(down_to):
+            while len(path) > down_to + 1:
+                terminal, edges = path.pop()
+                key = (terminal, *edges)
+                node_id = register.get(key)
+                if node_id is None:
+                    node_id = register[key] = len(nodes)
+                    nodes.append(key)
+                path[-1][1].extend((ord(previous[len(path) - 1]), node_id))
+
+        letters = sorted({letter for word in words for letter in word})
+        for first_letter in letters:
+            for string in gaddag_paths(words, first_letter):
+                common = 0
+                for a, b in zip(string, previous):
+                    if a != b:
+                        break
+                    common += 1
+                close(common)
+                for _ in string[common:]:
+                    path.append([False, []])
+                path[-1][0] = True
+                previous = string
+        close(0)
+        terminal, edges = path.pop()
+        nodes.append((terminal, *edges))
+
+        # Post-order ids put the root last; reverse them so the root is node 0
+        last = len(nodes) - 1
+        edge_start = array('I', [0])
+        edge_letters = bytearray()
+        edge_targets = array('I')
+        edge_masks = array('I')
+        terminals = bytearray()
+        for node in reversed(nodes):
+            codes = node[1::2]
+            edge_letters.extend(codes)
+            edge_targets.extend(last - child for child in node[2::2])
+            edge_start.append(len(edge_targets))
+            edge_masks.append(sum(letter_bit(_LETTERS[code]) for code in codes))
+            terminals.append(node[0])
+        return cls(edge_start, bytes(edge_letters), edge_targets, edge_masks, bytes(terminals))
+
+    def __contains__(self, word: str) -> bool:
+        if not word:
+            return False
+        node = self._walk(word[::-1] + SEPARATOR)
+        return node is not None and bool(self.terminal[node])
+
+    def has_prefix(self, prefix: str) -> bool:
+        """Return True if any word in the graph starts with the prefix."""
+        # Paths split after the prefix read it reversed, then continue past the separator
+        return not prefix or self._walk(prefix[::-1]) is not None
+
+    def allowed_letters(self, before: str, after: str) -> FrozenSet[str]:
+        """
+        Letters that make before + letter + after a word (see board.allowed_letters).
+
+        Reads the path split at the gap: the letter, before reversed, the
+        separator, then after.
+        """
+        allowed = []
+        for letter, node in self.edges(self.root):
+            for next_letter in before[::-1] + SEPARATOR + after:
+                node = self.child(node, next_letter)
+                if node is None:
+                    break
+            else:
+                if self.terminal[node]:
+                    allowed.append(letter)
+        return frozenset(allowed)
+
+    def search_rack(self, letters: str, blanks: int = 0,
+                    letter_values: Optional[Dict[str, int]] = None,
+                    max_length: Optional[int] = None, first_letter: Optional[str] = None,
+                    last_letter: Optional[str] = None, budget: Any = None) -> List[Tuple[str, str, int]]:
+        """
+        Find every word the rack plus blanks can spell (see Dawg.search_rack).
+
+        Words are spelled backwards from their last letter, along the paths
+        that hold the whole word before the separator, which fixes the last
+        letter up front. A fixed first letter (and no last letter) is read as
+        the path split after it instead: that letter, the separator, then the
+        rest of the word forwards, as in a DAWG.
+        """
+        if first_letter and not last_letter:
+            return self._search_after_first(first_letter, letters, blanks, letter_values, max_length, budget)
+        values = letter_values or {}
+        separator = ord(SEPARATOR)
+        edge_start, edge_letters = self.edge_start, self.edge_letters
+        edge_targets, terminal = self.edge_targets, self.terminal
+        counts = Counter(letters)
+        limit = max_length if max_length is not None else len(letters) + blanks
+        found = []
+        prefix = []
+        blank_letters = []
+
+        def extend(node, blanks_left, score):
+            if budget is not None and len(prefix) < BUDGET_CHECK_DEPTH and budget.exhausted(len(found)):
+                raise _OutOfBudget
+            for edge in self._edge_range(node, last_letter if not prefix else None):
+                code = edge_letters[edge]
+                if code == separator:
+                    # Only reachable below the root: the whole word has been read
+                    if terminal[edge_targets[edge]]:
+                        found.append((''.join(reversed(prefix)), ''.join(blank_letters), score))
+                    continue
+                letter = _LETTERS[code]
+                remaining = counts.get(letter, 0)
+                if remaining:
+                    counts[letter] = remaining - 1
+                    letter_score = values.get(letter, 0)
+                elif blanks_left:
+                    letter_score = 0
+                    blank_letters.append(letter)
+                    blanks_left -= 1
+                else:
+                    continue
+                prefix.append(letter)
+                if len(prefix) <= limit:
+                    extend(edge_targets[edge], blanks_left, score + letter_score)
+                prefix.pop()
+                if remaining:
+                    counts[letter] = remaining
+                else:
+                    blank_letters.pop()
+                    blanks_left += 1
+
+        try:
+            extend(0, blanks, 0)
+        except _OutOfBudget:
+            pass
+        return found
+
+    def _search_after_first(self, first_letter: str, letters: str, blanks: int,
+                            letter_values: Optional[Dict[str, int]], max_length: Optional[int],
+                            budget: Any = None) -> List[Tuple[str, str, int]]:
+        """Rack search for words starting with one letter (see search_rack)."""
+        values = letter_values or {}
+        node = self._walk(first_letter + SEPARATOR)
+        if node is None:
+            return []
+        if first_letter in letters:
+            letters = letters.replace(first_letter, '', 1)
+            blank_letter, score = '', values.get(first_letter, 0)
+        elif blanks:
+            blanks -= 1
+            blank_letter, score = first_letter, 0
+        else:
+            return []
+
+        found = [(first_letter, blank_letter, score)] if self.terminal[node] else []
+        # Past the separator the graph reads forwards and marks word ends like a DAWG
+        rest = CompactDawg(self.edge_start, self.edge_letters, self.edge_targets, self.edge_masks, self.terminal)
+        rest.root = node
+        limit = max_length - 1 if max_length is not None else None
+        for word, blank_letters, word_score in rest.search_rack(letters, blanks, values, limit, budget=budget):
+            found.append((first_letter + word, blank_letter + blank_letters, score + word_score))
+        return found
@@ -0,0 +1,446 @@
+"""
+Precompiled, memory-mappable dictionary format for Scrabble Word Solver.
+
+``compile_lexicon`` turns ``dictionary.txt`` into a binary artifact holding
+the packed word list, the anagram index, both word graphs and the signature
+graph's node bounds. Workers then ``mmap`` the artifact instead of parsing
+the text file, so they start almost instantly and share the same pages
+through the OS cache. The GADDAG, which
+is much slower to build, lives in a second artifact compiled on first use.
+
+Usage:
+    python lexicon_file.py dictionary.txt [output.lexicon]
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+from functools import cached_property
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import matrix_engine
+from dawg import CompactDawg, subtree_bounds
+from gaddag import Gaddag
+from scrabble_solver import Lexicon, load_dictionary, SCRABBLE_SCORES
+
+MAGIC = b'SCRLEX\x00\x01'
+FORMAT_VERSION = 6
+
+# Magic, section count, then one (name, offset, length) entry per section
+_HEADER = struct.Struct('<8sI')
+_SECTION = struct.Struct('<32sQQ')
+_ALIGNMENT = 8
+
+if sys.byteorder != 'little':
+    raise ImportError('The compiled lexicon format requires a little-endian platform')
+
+# Artifacts get the mode a plain open() would give them (mkstemp creates
+# files readable by their owner only). The umask can only be read by
+# setting it, so it is read once here rather than while other threads run.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_ARTIFACT_MODE = 0o666 & ~_UMASK
+
+
+def compiled_path(source_path: str) -> str:
+    """Default artifact location for a dictionary text file."""
+    return os.path.splitext(source_path)[0] + '.lexicon'
+
+
+def _source_fingerprint(source_path: str) -> Dict[str, object]:
+    stat = os.stat(source_path)
+    with open(source_path, 'rb') as file:
+        digest = hashlib.sha256(file.read()).hexdigest()
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest}
+
+
+def _hash_table(keys: List[bytes]) -> array:
+    """Open-addressing table mapping crc32(key) to key id + 1 (0 marks an empty slot)."""
+    size = 1
+    while size < 2 * len(keys):
+        size *= 2
+    mask = size - 1
+    slots = array('I', bytes(4 * size))
+    for key_id, key in enumerate(keys):
+        slot = zlib.crc32(key) & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = key_id + 1
+    return slots
+
+
+def _pack_strings(strings: List[bytes]):
+    offsets = array('I', [0])
+    for string in strings:
+        offsets.append(offsets[-1] + len(string))
+    return b''.join(strings), offsets
+
+
+def compile_lexicon(source_path: str, output_path: Optional[str] = None) -> str:
+    """
+    Compile a dictionary text file into the binary lexicon format.
+
+    The artifact is written to a temporary file and renamed into place, so
+    concurrent workers never observe a partially written file.
+
+    Args:
+        source_path: Path to the dictionary text file
+        output_path: Artifact path (defaults to ``compiled_path(source_path)``)
+
+    Returns:
+        Path of the written artifact
+    """
+    output_path = output_path or compiled_path(source_path)
+    fingerprint = _source_fingerprint(source_path)
+    lexicon = load_dictionary(source_path)
+
+    words = lexicon.word_list
+    encoded_words = [word.encode('ascii') for word in words]
+    word_blob, word_offsets = _pack_strings(encoded_words)
+
+    signatures = sorted(lexicon.anagram_index)
+    encoded_signatures = [signature.encode('ascii') for signature in signatures]
+    signature_blob, signature_offsets = _pack_strings(encoded_signatures)
+    signature_words = array('I')
+    signature_word_offsets = array('I', [0])
+    for signature in signatures:
+        signature_words.extend(lexicon.anagram_index[signature])
+        signature_word_offsets.append(len(signature_words))
+
+    meta = {
+        'format_version': FORMAT_VERSION,
+        'source': fingerprint,
+        'version': lexicon.version,
+        'word_count': len(words),
+        'signature_count': len(signatures),
+        'max_word_length': lexicon.max_word_length,
+    }
+
+    sections = {
+        'meta': json.dumps(meta).encode('utf-8'),
+        'words': word_blob,
+        'word_offsets': word_offsets.tobytes(),
+        'word_table': _hash_table(encoded_words).tobytes(),
+        'word_scores': lexicon.scores.tobytes(),
+        'word_lengths': lexicon.lengths.tobytes(),
+        'signatures': signature_blob,
+        'signature_offsets': signature_offsets.tobytes(),
+        'signature_table': _hash_table(encoded_signatures).tobytes(),
+        'signature_words': signature_words.tobytes(),
+        'signature_word_offsets': signature_word_offsets.tobytes(),
+        'letter_counts': matrix_engine.pack_letter_counts(words),
+    }
+    graphs = {prefix: CompactDawg.from_dawg(graph)
+              for prefix, graph in (('dawg', lexicon.dawg), ('sigdawg', lexicon.signature_dawg))}
+    for prefix, graph in graphs.items():
+        for name, data in graph.sections().items():
+            sections[f'{prefix}.{name}'] = data
+    # Node bounds for best-first searches, numbered like the packed signature graph
+    heights, masks = subtree_bounds(graphs['sigdawg'])
+    sections['sigdawg_heights'] = heights.tobytes()
+    sections['sigdawg_masks'] = masks.tobytes()
+
+    _write_sections(output_path, sections)
+    return output_path
+
+
+def _write_sections(output_path: str, sections: Dict[str, bytes]) -> None:
+    offset = _HEADER.size + _SECTION.size * len(sections)
+    table = []
+    for name, data in sections.items():
+        offset += -offset % _ALIGNMENT
+        table.append((name, offset, len(data)))
+        offset += len(data)
+
+    directory = os.path.dirname(os.path.abspath(output_path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        os.fchmod(fd, _ARTIFACT_MODE)
+        with os.fdopen(fd, 'wb') as file:
+            file.write(_HEADER.pack(MAGIC, len(sections)))
+            for name, section_offset, length in table:
+                file.write(_SECTION.pack(name.encode('ascii'), section_offset, length))
+            for (name, section_offset, _), data in zip(table, sections.values()):
+                file.write(bytes(section_offset - file.tell()))
+                file.write(data)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _map_sections(path: str):
+    """
+    Map an artifact and locate its sections.
+
+    Returns:
+        The mmap object and a mapping of section name to a memoryview over it
+    """
+    with open(path, 'rb') as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    buffer = memoryview(mapped)
+
+    magic, section_count = _HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError(f'{path} is not a compiled lexicon')
+    sections = {}
+    for index in range(section_count):
+        name, offset, length = _SECTION.unpack_from(buffer, _HEADER.size + index * _SECTION.size)
+        sections[name.rstrip(b'\x00').decode('ascii')] = buffer[offset:offset + length]
+
+    format_version = json.loads(bytes(sections['meta']))['format_version']
+    if format_version != FORMAT_VERSION:
+        raise ValueError(f'{path} uses format version {format_version}')
+    return mapped, sections
+
+
+def _prefixed(sections: Dict[str, memoryview], prefix: str) -> Dict[str, memoryview]:
+    """The sections named '<prefix>.<name>', keyed by name."""
+    start = len(prefix) + 1
+    return {name[start:]: data for name, data in sections.items() if name.startswith(prefix + '.')}
+
+
+def gaddag_path(artifact_path: str) -> str:
+    """Location of the GADDAG artifact that accompanies a compiled lexicon."""
+    return os.path.splitext(artifact_path)[0] + '.gaddag'
+
+
+def compile_gaddag(lexicon: Lexicon, output_path: str) -> str:
+    """
+    Build a lexicon's GADDAG and write it as its own artifact.
+
+    The GADDAG takes several times longer to build than the rest of the
+    lexicon, so it is compiled separately, the first time it is needed.
+
+    Args:
+        lexicon: Lexicon to index (its version is recorded in the artifact)
+        output_path: Artifact path
+
+    Returns:
+        Path of the written artifact
+    """
+    graph = Gaddag.from_words(lexicon)
+    meta = {
+        'format_version': FORMAT_VERSION,
+        'version': lexicon.version,
+        'node_count': graph.node_count,
+    }
+    sections = {'meta': json.dumps(meta).encode('utf-8')}
+    for name, data in graph.sections().items():
+        sections[f'gaddag.{name}'] = data
+    _write_sections(output_path, sections)
+    return output_path
+
+
+def load_gaddag(lexicon: Lexicon, path: str) -> Gaddag:
+    """
+    Map a lexicon's GADDAG artifact, compiling it first if missing or built from other words.
+
+    Args:
+        lexicon: Lexicon the GADDAG must match
+        path: Artifact path
+
+    Returns:
+        Gaddag reading the mapped file
+    """
+    if os.path.exists(path):
+        try:
+            _, sections = _map_sections(path)
+            if json.loads(bytes(sections['meta']))['version'] == lexicon.version:
+                return Gaddag.from_sections(_prefixed(sections, 'gaddag'))
+        except (ValueError, KeyError, struct.error):
+            pass  # Unreadable or outdated format, rebuild below
+    compile_gaddag(lexicon, path)
+    _, sections = _map_sections(path)
+    return Gaddag.from_sections(_prefixed(sections, 'gaddag'))
+
+
+class _MappedAnagramIndex:
+    """Read-only signature -> word ids mapping backed by the mapped artifact."""
+
+    def __init__(self, lexicon: 'MappedLexicon'):
+        self._lexicon = lexicon
+
+    def get(self, signature: str, default=None):
+        if not signature.isascii():
+            return default
+        lexicon = self._lexicon
+        signature_id = lexicon._lookup(signature.encode('ascii'), lexicon._signature_table,
+                                       lexicon._signatures, lexicon._signature_offsets)
+        if signature_id < 0:
+            return default
+        start = lexicon._signature_word_offsets[signature_id]
+        end = lexicon._signature_word_offsets[signature_id + 1]
+        return lexicon._signature_words[start:end]
+
+    def __getitem__(self, signature: str) -> Sequence[int]:
+        words = self.get(signature)
+        if words is None:
+            raise KeyError(signature)
+        return words
+
+    def __contains__(self, signature: str) -> bool:
+        return self.get(signature) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        lexicon = self._lexicon
+        for signature_id in range(lexicon.meta['signature_count']):
+            yield lexicon._string(lexicon._signatures, lexicon._signature_offsets, signature_id)
+
+    def __len__(self) -> int:
+        return self._lexicon.meta['signature_count']
+
+
+class MappedLexicon(Lexicon):
+    """
+    Lexicon whose word list and indexes live in a memory-mapped artifact.
+
+    Nothing is parsed or copied at load time; lookups read the mapped pages
+    directly, so every process mapping the same file shares one copy.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._mmap, sections = _map_sections(path)
+        self.meta = json.loads(bytes(sections['meta']))
+
+        self.max_word_length = self.meta['max_word_length']
+        self.version = self.meta['version']
+        self._words = sections['words']
+        self._word_offsets = sections['word_offsets'].cast('I')
+        self._word_table = sections['word_table'].cast('I')
+        self.scores = sections['word_scores'].cast('H')
+        self.lengths = sections['word_lengths']
+        self._signatures = sections['signatures']
+        self._signature_offsets = sections['signature_offsets'].cast('I')
+        self._signature_table = sections['signature_table'].cast('I')
+        self._signature_words = sections['signature_words'].cast('I')
+        self._signature_word_offsets = sections['signature_word_offsets'].cast('I')
+        self._letter_counts = sections['letter_counts']
+        self.anagram_index = _MappedAnagramIndex(self)
+        self._graphs = {
+            prefix: CompactDawg.from_sections(_prefixed(sections, prefix))
+            for prefix in ('dawg', 'sigdawg')
+        }
+        self.signature_bounds = (sections['sigdawg_heights'], sections['sigdawg_masks'].cast('I'))
+
+    @property
+    def dawg(self) -> CompactDawg:
+        return self._graphs['dawg']
+
+    @property
+    def signature_dawg(self) -> CompactDawg:
+        return self._graphs['sigdawg']
+
+    @cached_property
+    def gaddag(self) -> Gaddag:
+        """GADDAG mapped from the artifact next to this one, compiled on first use."""
+        return load_gaddag(self, gaddag_path(self.path))
+
+    @cached_property
+    def letter_matrix(self):
+        """Letter-count matrix viewed directly over the mapped rows."""
+        return matrix_engine.LetterMatrix.from_buffer(self._letter_counts, self.word, SCRABBLE_SCORES)
+
+    @staticmethod
+    def _string(blob, offsets, string_id: int) -> str:
+        return str(blob[offsets[string_id]:offsets[string_id + 1]], 'ascii')
+
+    @staticmethod
+    def _lookup(key: bytes, table, blob, offsets) -> int:
+        mask = len(table) - 1
+        slot = zlib.crc32(key) & mask
+        while True:
+            entry = table[slot]
+            if not entry:
+                return -1
+            if blob[offsets[entry - 1]:offsets[entry]] == key:
+                return entry - 1
+            slot = (slot + 1) & mask
+
+    def word(self, word_id: int) -> str:
+        """Return the word with the given id (ids follow alphabetical order)."""
+        return self._string(self._words, self._word_offsets, word_id)
+
+    def __contains__(self, word: str) -> bool:
+        if not word.isascii():
+            return False
+        return self._lookup(word.encode('ascii'), self._word_table,
+                            self._words, self._word_offsets) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.word(word_id) for word_id in range(len(self)))
+
+    def __len__(self) -> int:
+        return self.meta['word_count']
+
+    def is_stale(self, source_path: str) -> bool:
+        """Return True if the source text file no longer matches this artifact."""
+        return is_stale(self.meta, source_path)
+
+
+def is_stale(meta: Dict[str, object], source_path: str) -> bool:
+    """Compare an artifact's recorded source fingerprint with the file on disk."""
+    source = meta['source']
+    stat = os.stat(source_path)
+    if stat.st_size != source['size']:
+        return True
+    if stat.st_mtime_ns == source['mtime_ns']:
+        return False
+    # Touched (e.g. by a checkout) but possibly unchanged: fall back to the content hash
+    return _source_fingerprint(source_path)['sha256'] != source['sha256']
+
+
+def word_delta(old: MappedLexicon, new: MappedLexicon) -> Dict[str, int]:
+    """
+    Count the words added and removed between two versions of a lexicon.
+
+    Words are compared as the packed bytes in each artifact, without
+    decoding them.
+
+    Returns:
+        Dictionary with 'added' and 'removed' word counts
+    """
+    def packed_words(lexicon):
+        blob, offsets = bytes(lexicon._words), lexicon._word_offsets
+        return set(blob[start:stop] for start, stop in zip(offsets, offsets[1:]))
+
+    old_words, new_words = packed_words(old), packed_words(new)
+    return {'added': len(new_words - old_words), 'removed': len(old_words - new_words)}
+
+
+def load_compiled_dictionary(source_path: str, artifact_path: Optional[str] = None) -> MappedLexicon:
+    """
+    Map the compiled artifact for a dictionary, compiling it first if missing or stale.
+
+    Args:
+        source_path: Path to the dictionary text file
+        artifact_path: Artifact path (defaults to ``compiled_path(source_path)``)
+
+    Returns:
+        MappedLexicon usable anywhere a Lexicon is accepted
+    """
+    artifact_path = artifact_path or compiled_path(source_path)
+    if os.path.exists(artifact_path):
+        try:
+            lexicon = MappedLexicon(artifact_path)
+            if not lexicon.is_stale(source_path):
+                return lexicon
+        except (ValueError, KeyError, struct.error):
+            pass  # Unreadable or outdated format, rebuild below
+    compile_lexicon(source_path, artifact_path)
+    return MappedLexicon(artifact_path)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (2, 3):
+        print(__doc__.strip().splitlines()[-1].strip())
+        sys.exit(1)
+    path = compile_lexicon(*sys.argv[1:])
+    print(f'Compiled {sys.argv[1]} -> {path}')
@@ -0,0 +1,327 @@
+"""
+Lexicon registry for Scrabble Word Solver.
+
+Serves several word lists (e.g. TWL, Collins and house lists) by name. Each
+is compiled and mapped (see lexicon_file) the first time it is asked for, and
+the least recently used ones are dropped once their mapped artifacts and the
+indexes built in memory for them outgrow a budget. A dropped lexicon is
+unmapped when the last request still searching it lets go of it, and mapped
+again on its next use.
+
+A lexicon whose source file changes can be reloaded without a restart: the
+new index is compiled in another process and swapped in atomically, so
+requests already searching the old version finish on it.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from lexicon_file import load_compiled_dictionary, word_delta, MappedLexicon
+
+
+def parse_lexicon_sources(spec: str) -> Dict[str, str]:
+    """
+    Read lexicon sources from a 'name=path,name=path' list (e.g. the LEXICONS variable).
+
+    Args:
+        spec: Comma-separated name=path pairs
+
+    Returns:
+        Dictionary mapping each name to its dictionary text file, in listed order
+
+    Raises:
+        ValueError: If an entry is not a name=path pair
+    """
+    sources = {}
+    for entry in filter(None, (part.strip() for part in spec.split(','))):
+        name, separator, path = entry.partition('=')
+        if not separator or not name.strip() or not path.strip():
+            raise ValueError(f"Invalid lexicon entry '{entry}' (expected name=path)")
+        sources[name.strip()] = path.strip()
+    return sources
+
+
+def lexicon_size(lexicon: MappedLexicon) -> int:
+    """
+    Bytes held for a lexicon: its mapped artifact, plus each index built since it loaded.
+
+    The GADDAG counts its graph arrays, whether mapped or built in memory;
+    the pattern index and letter matrix are built by each process in
+    memory, on their first use.
+    """
+    size = os.path.getsize(lexicon.path)
+    built = lexicon.__dict__
+    for name in ('gaddag', 'pattern_index', 'letter_matrix'):
+        if name in built:
+            size += built[name].nbytes
+    return size
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _rebuild(source_path: str, with_gaddag: bool) -> str:
+    # Runs in a separate process: compiles the artifact (and GADDAG) if stale
+    lexicon = load_compiled_dictionary(source_path)
+    if with_gaddag:
+        lexicon.gaddag
+    return lexicon.path
+
+
+class LexiconRegistry:
+    """
+    Named lexicons, loaded on first use and evicted least recently used first.
+
+    The budget is checked after each load, counting the bytes held for
+    every loaded lexicon (see lexicon_size): its mapped artifact and the
+    indexes built for it so far. The lexicon just asked for is never evicted, so
+    one larger than the budget still loads. All bookkeeping takes a single
+    lock, and each lexicon is loaded once however many threads ask for it
+    together.
+    """
+
+    def __init__(self, sources: Dict[str, str], max_bytes: int,
+                 prepare: Optional[Callable[[MappedLexicon], Any]] = None,
+                 on_swap: Optional[Callable[[MappedLexicon, MappedLexicon], Any]] = None,
+                 on_load: Optional[Callable[[str, float], Any]] = None):
+        """
+        Args:
+            sources: Lexicon names mapped to their dictionary text files
+            max_bytes: Budget for the bytes held by loaded lexicons (see lexicon_size)
+            prepare: Called with each lexicon as it loads (e.g. to build an engine's index)
+            on_swap: Called with the old and new lexicon after a reload swaps them
+            on_load: Called with a lexicon's name and the seconds its load (or reload) took
+        """
+        if not sources:
+            raise ValueError('At least one lexicon is required')
+        self.sources = dict(sources)
+        self.max_bytes = max_bytes
+        self.prepare = prepare
+        self.on_swap = on_swap
+        self.on_load = on_load
+        self._loaded: 'OrderedDict[str, MappedLexicon]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks = {name: threading.Lock() for name in self.sources}
+        self._reloading = set()
+        self.last_reload: Dict[str, Dict[str, Any]] = {}
+        self.loads = 0
+        self.evictions = 0
+        self.reloads = 0
+
+    @property
+    def default(self) -> str:
+        """Name of the first lexicon, used when a request names none."""
+        return next(iter(self.sources))
+
+    def names(self) -> List[str]:
+        return list(self.sources)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.sources
+
+    def get(self, name: Optional[str] = None) -> MappedLexicon:
+        """
+        Get a lexicon, loading it if needed.
+
+        Args:
+            name: Lexicon name (defaults to the first one)
+
+        Returns:
+            The mapped lexicon
+
+        Raises:
+            KeyError: If no lexicon has that name
+        """
+        name = name or self.default
+        if name not in self.sources:
+            raise KeyError(name)
+        with self._lock:
+            lexicon = self._loaded.get(name)
+            if lexicon is not None:
+                self._loaded.move_to_end(name)
+                return lexicon
+
+        with self._load_locks[name]:
+            with self._lock:
+                lexicon = self._loaded.get(name)
+            if lexicon is None:
+                started = time.perf_counter()
+                lexicon = load_compiled_dictionary(self.sources[name])
+                if self.prepare:
+                    self.prepare(lexicon)
+                if self.on_load:
+                    self.on_load(name, time.perf_counter() - started)
+                with self._lock:
+                    self._loaded[name] = lexicon
+                    self.loads += 1
+                    self._evict(keep=name)
+        return lexicon
+
+    def reload(self, name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Rebuild a lexicon from its source file and swap it in.
+
+        The artifact is compiled in a separate process, so the build does not
+        hold up requests served by this one, and renamed into place. The new
+        lexicon is then mapped, prepared and swapped in under the lock:
+        requests holding the old one finish on it, later ones get the new one.
+        An artifact that is already current (e.g. rebuilt by another worker)
+        is just mapped.
+
+        Args:
+            name: Lexicon name (defaults to the first one)
+
+        Returns:
+            Report with the 'old_version' (None if it was not loaded) and new
+            'version', 'build_ms', 'words', and the 'added' and 'removed' word counts
+
+        Raises:
+            KeyError: If no lexicon has that name
+        """
+        name = name or self.default
+        if name not in self.sources:
+            raise KeyError(name)
+        # Taken for the whole rebuild, so loads and reloads of the same lexicon wait for it
+        with self._load_locks[name]:
+            with self._lock:
+                old = self._loaded.get(name)
+            started = time.perf_counter()
+            with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context('spawn')) as executor:
+                with_gaddag = old is not None and 'gaddag' in old.__dict__
+                path = executor.submit(_rebuild, self.sources[name], with_gaddag).result()
+            lexicon = MappedLexicon(path)
+            if self.prepare:
+                self.prepare(lexicon)
+            build_ms = (time.perf_counter() - started) * 1000
+            if self.on_load:
+                self.on_load(name, build_ms / 1000)
+
+            with self._lock:
+                self._loaded[name] = lexicon
+                self._loaded.move_to_end(name)
+                self.reloads += 1
+                self._evict(keep=name)
+
+            changed = old is not None and old.version != lexicon.version
+            report = {
+                'lexicon': name,
+                'old_version': old.version if old is not None else None,
+                'version': lexicon.version,
+                'build_ms': round(build_ms, 1),
+                'words': len(lexicon),
+                **(word_delta(old, lexicon) if changed else {'added': 0, 'removed': 0})
+            }
+            if changed and self.on_swap:
+                self.on_swap(old, lexicon)
+            self.last_reload[name] = report
+        return report
+
+    def start_reload(self, name: Optional[str] = None) -> bool:
+        """
+        Reload a lexicon in a background thread (see reload).
+
+        The report, or the error if the rebuild failed, is kept in last_reload.
+
+        Returns:
+            False if a reload of that lexicon is already running
+
+        Raises:
+            KeyError: If no lexicon has that name
+        """
+        name = name or self.default
+        if name not in self.sources:
+            raise KeyError(name)
+        with self._lock:
+            if name in self._reloading:
+                return False
+            self._reloading.add(name)
+
+        def run():
+            try:
+                self.reload(name)
+            except Exception as e:
+                self.last_reload[name] = {
+                    'lexicon': name,
+                    'error': str(e),
+                    'source_mtime_ns': _mtime_ns(self.sources[name])
+                }
+            finally:
+                with self._lock:
+                    self._reloading.discard(name)
+
+        threading.Thread(target=run, name=f'reload-{name}', daemon=True).start()
+        return True
+
+    def watch(self, interval: float) -> threading.Thread:
+        """
+        Reload loaded lexicons whose source files change, checking every interval seconds.
+
+        Source files should be replaced atomically (written elsewhere, then
+        renamed over the old one), or a half-written file may be compiled. A
+        source whose reload failed is retried once it changes again.
+
+        Returns:
+            The daemon thread doing the checks
+        """
+        def run():
+            while True:
+                time.sleep(interval)
+                with self._lock:
+                    loaded = list(self._loaded.items())
+                for name, lexicon in loaded:
+                    failed = self.last_reload.get(name, {}).get('source_mtime_ns')
+                    if failed is not None and failed == _mtime_ns(self.sources[name]):
+                        continue
+                    try:
+                        stale = lexicon.is_stale(self.sources[name])
+                    except OSError:
+                        continue  # Source missing, e.g. while being replaced
+                    if stale:
+                        self.start_reload(name)
+
+        thread = threading.Thread(target=run, name='lexicon-watch', daemon=True)
+        thread.start()
+        return thread
+
+    def _evict(self, keep: str) -> None:
+        # Sizes are measured each time, as indexes may have been built since the load
+        sizes = {name: lexicon_size(lexicon) for name, lexicon in self._loaded.items()}
+        for name in list(self._loaded):
+            if sum(sizes.values()) <= self.max_bytes:
+                break
+            if name != keep:
+                del self._loaded[name]
+                del sizes[name]
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Loaded lexicons and counters, for monitoring."""
+        with self._lock:
+            sizes = {name: lexicon_size(lexicon) for name, lexicon in self._loaded.items()}
+            return {
+                'lexicons': {
+                    name: {
+                        'loaded': name in self._loaded,
+                        'version': self._loaded[name].version if name in self._loaded else None,
+                        'bytes': sizes.get(name, 0),
+                        'reloading': name in self._reloading,
+                        'last_reload': self.last_reload.get(name)
+                    }
+                    for name in self.sources
+                },
+                'default': self.default,
+                'loaded_bytes': sum(sizes.values()),
+                'max_bytes': self.max_bytes,
+                'loads': self.loads,
+                'evictions': self.evictions,
+                'reloads': self.reloads
+            }
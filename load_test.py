@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Load test for a running Scrabble Word Solver server.
+
+Keeps a number of clients busy with a mix of heavy solves (long racks with
+blanks), light solves (seven tiles) and cheap requests (word scores and the
+grouping options) for a fixed time. It then reports requests per second
+overall and the p50/p99 latency of each kind, so the same run against the
+gunicorn and ASGI entry points can be compared. Racks are drawn fresh for
+every request, so solves miss the result cache.
+
+Usage:
+    python load_test.py http://127.0.0.1:8000
+    python load_test.py http://127.0.0.1:8000 --clients 32 --duration 30
+"""
+
+import argparse
+import http.client
+import json
+import random
+import sys
+import threading
+import time
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+
+from benchmark import TILE_BAG
+from scrabble_solver import BLANK
+
+# Request kinds and their share of the mix
+REQUEST_MIX = {'heavy': 0.1, 'light': 0.4, 'cheap': 0.5}
+
+SCORE_WORDS = ('quiz', 'scrabble', 'jukebox', 'oxygen', 'cat')
+
+
+def make_request(kind: str, rng: random.Random) -> Tuple[str, str, bytes]:
+    """
+    Build one request of a kind.
+
+    Args:
+        kind: 'heavy', 'light' or 'cheap'
+        rng: Random source for racks and words
+
+    Returns:
+        Tuple of (method, path, body)
+    """
+    if kind == 'heavy':
+        rack = ''.join(rng.sample(TILE_BAG, rng.randint(8, 10))) + BLANK * 2
+    elif kind == 'light':
+        rack = ''.join(rng.sample(TILE_BAG, 7))
+    elif rng.random() < 0.5:
+        return 'GET', f'/api/score/{rng.choice(SCORE_WORDS)}', b''
+    else:
+        return 'GET', '/api/groups', b''
+    return 'POST', '/solve', json.dumps({'letters': rack, 'view_type': 'flat'}).encode()
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of values (0.0 for none)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+def run_load(url: str, clients: int, duration: float, seed: int = 0) -> Dict[str, object]:
+    """
+    Drive a server with the request mix from several client threads.
+
+    Args:
+        url: Base URL of the server
+        clients: Number of concurrent clients, each with one keep-alive connection
+        duration: Seconds to run for
+        seed: Random seed for the request mix
+
+    Returns:
+        Dictionary with 'requests_per_second', 'errors' and per-kind
+        'count', 'p50_ms' and 'p99_ms'
+    """
+    parts = urlsplit(url)
+    kinds, weights = zip(*REQUEST_MIX.items())
+    latencies = {kind: [] for kind in kinds}
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client(index):
+        rng = random.Random(f'{seed}-{index}')
+        connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=60)
+        while time.perf_counter() < deadline:
+            kind = rng.choices(kinds, weights)[0]
+            method, path, body = make_request(kind, rng)
+            start = time.perf_counter()
+            try:
+                connection.request(method, path, body, {'Content-Type': 'application/json'})
+                response = connection.getresponse()
+                response.read()
+                ok = response.status == 200
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                ok = False
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                if ok:
+                    latencies[kind].append(elapsed)
+                else:
+                    errors[0] += 1
+        connection.close()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client, args=(index,)) for index in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    report = {
+        'requests_per_second': round(sum(map(len, latencies.values())) / elapsed, 1),
+        'errors': errors[0]
+    }
+    for kind, values in latencies.items():
+        report[kind] = {
+            'count': len(values),
+            'p50_ms': round(percentile(values, 0.5), 1),
+            'p99_ms': round(percentile(values, 0.99), 1)
+        }
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Load test a running Scrabble Word Solver server.')
+    parser.add_argument('url', help='base URL of the server, e.g. http://127.0.0.1:8000')
+    parser.add_argument('--clients', type=int, default=16, help='concurrent clients (default: 16)')
+    parser.add_argument('--duration', type=float, default=20, help='seconds to run for (default: 20)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed for the request mix')
+    args = parser.parse_args(argv)
+
+    report = run_load(args.url, args.clients, args.duration, args.seed)
+    print(f"{report['requests_per_second']} req/s, {report['errors']} errors")
+    for kind in REQUEST_MIX:
+        stats = report[kind]
+        print(f"  {kind:<6} {stats['count']:>6} requests  p50 {stats['p50_ms']:>8.1f} ms  p99 {stats['p99_ms']:>8.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Vectorized letter-count matrix search for Scrabble Word Solver.
+
+The whole lexicon is held as an N x 26 ``uint8`` matrix of letter counts
+with precomputed length and score columns, so a rack query is a handful of
+NumPy array operations over every word at once, whatever the rack length.
+Requires NumPy; ``AVAILABLE`` is False when it is not installed.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+AVAILABLE = np is not None
+
+ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+_LETTER_INDEX = {letter: index for index, letter in enumerate(ALPHABET)}
+
+
+def pack_letter_counts(words: List[str]) -> bytes:
+    """
+    Pack per-word letter counts as consecutive 26-byte rows.
+
+    Pure Python so the compiled dictionary can store the matrix without
+    NumPy being installed at compile time.
+    """
+    rows = bytearray(26 * len(words))
+    for row, word in enumerate(words):
+        base = 26 * row
+        for letter in word:
+            rows[base + _LETTER_INDEX[letter]] += 1
+    return bytes(rows)
+
+
+class LetterMatrix:
+    """
+    Letter-count matrix over a lexicon whose word ids follow alphabetical order.
+
+    Attributes:
+        counts: (N, 26) uint8 letter counts per word
+        lengths: (N,) word lengths
+        scores: (N,) face-value word scores
+    """
+
+    def __init__(self, counts, word_at: Callable[[int], str], letter_values: Dict[str, int]):
+        if not AVAILABLE:
+            raise RuntimeError('The matrix engine requires NumPy')
+        self.counts = counts
+        self.word_at = word_at
+        self.values = np.array([letter_values.get(letter, 0) for letter in ALPHABET], dtype=np.int32)
+        self.lengths = counts.sum(axis=1, dtype=np.int32)
+        self.scores = counts @ self.values
+
+    @classmethod
+    def from_buffer(cls, buffer, word_at: Callable[[int], str],
+                    letter_values: Dict[str, int]) -> 'LetterMatrix':
+        """Wrap packed rows (see pack_letter_counts) without copying them."""
+        counts = np.frombuffer(buffer, dtype=np.uint8).reshape(-1, 26)
+        return cls(counts, word_at, letter_values)
+
+    @classmethod
+    def from_words(cls, words: List[str], letter_values: Dict[str, int]) -> 'LetterMatrix':
+        """Build the matrix for an alphabetically sorted word list."""
+        return cls.from_buffer(pack_letter_counts(words), words.__getitem__, letter_values)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Bytes of the arrays computed from the counts.
+
+        The counts themselves are not included: they wrap the buffer they
+        were built from, such as a mapped artifact, without copying it.
+        """
+        return self.values.nbytes + self.lengths.nbytes + self.scores.nbytes
+
+    def search(self, letters: str, blanks: int = 0, min_length: int = 1,
+               max_length: Optional[int] = None,
+               id_range: Optional[Tuple[int, int]] = None) -> List[Tuple[str, int, int, str]]:
+        """
+        Find every word the rack plus blanks can spell.
+
+        A word fits when ``counts <= rack_counts`` in every column, except
+        that up to ``blanks`` letters in total may be missing; those
+        missing letters are the ones the blanks stand for and score 0.
+
+        Args:
+            letters: Rack letters (repeats allowed, non a-z ignored)
+            blanks: Number of blank tiles
+            min_length: Shortest word length to return
+            max_length: Longest word length to return (no limit if None)
+            id_range: Only test the words with ids in [start, stop), e.g. the
+                alphabetical run of words sharing a first letter
+
+        Returns:
+            List of (word, score, length, blank_letters) records, highest
+            score first and alphabetical within a score
+        """
+        rack = np.zeros(26, dtype=np.uint8)
+        for letter in letters:
+            index = _LETTER_INDEX.get(letter)
+            if index is not None:
+                rack[index] += 1
+
+        start, stop = id_range or (0, len(self.counts))
+        counts = self.counts[start:stop]
+        lengths = self.lengths[start:stop]
+        fits_length = lengths >= min_length
+        if max_length is not None:
+            fits_length &= lengths <= max_length
+
+        if not blanks:
+            ids = np.flatnonzero((counts <= rack).all(axis=1) & fits_length) + start
+            scores = self.scores[ids]
+            missing = None
+        else:
+            deficit = counts - np.minimum(counts, rack)
+            rows = np.flatnonzero((deficit.sum(axis=1, dtype=np.int32) <= blanks) & fits_length)
+            missing = deficit[rows]
+            ids = rows + start
+            scores = self.scores[ids] - missing @ self.values
+
+        order = np.lexsort((ids, -scores))
+        results = []
+        for position in order.tolist():
+            blank_letters = ''
+            if missing is not None and missing[position].any():
+                blank_letters = ''.join(ALPHABET[index] * int(count)
+                                        for index, count in enumerate(missing[position]) if count)
+            word_id = int(ids[position])
+            results.append((self.word_at(word_id), int(scores[position]),
+                            int(self.lengths[word_id]), blank_letters))
+        return results
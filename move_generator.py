@@ -0,0 +1,356 @@
+"""
+Board move generation for Scrabble Word Solver.
+
+Implements the Appel-Jacobson algorithm: every move must cover an anchor
+square (an empty square next to a tile), letters on squares with vertical
+neighbours are restricted to precomputed cross-check sets, and each word is
+built as a left part ending just before the anchor and then extended to the
+right through the lexicon's word graph. With the GADDAG backend each move is
+instead grown outward from its anchor, leftwards and then rightwards. Down
+moves are generated as across moves on the transposed board.
+"""
+
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from board import ACROSS, BINGO_BONUS, DOWN, RACK_SIZE, Board
+from gaddag import SEPARATOR
+from scrabble_solver import BLANK, SCRABBLE_SCORES, as_lexicon
+
+Tile = Tuple[int, int, str, bool]
+
+DEFAULT_BACKEND = 'dawg'
+
+
+class Move(NamedTuple):
+    """A legal play: the main word, where it starts, the tiles it adds and its full score."""
+    word: str
+    row: int
+    col: int
+    direction: str
+    tiles: Tuple[Tile, ...]
+    score: int
+
+
+def generate_moves(board: Board, rack: str, dictionary, backend: str = DEFAULT_BACKEND) -> List[Move]:
+    """
+    Generate every legal move for a rack on a board.
+
+    Both the real-letter and the blank-tile variant of a play are returned
+    when the rack allows either. Scores are full play scores (see
+    Board.score_play): premiums under new tiles, every cross-word formed
+    and the bingo bonus, accumulated square by square as words are extended
+    using the board's precomputed cross-scores.
+
+    Args:
+        board: Current board
+        rack: Rack letters, '?' for blanks
+        dictionary: Lexicon (or any word collection) defining valid words
+        backend: Word graph to generate from, a key of BACKENDS
+
+    Returns:
+        List of Move tuples
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'")
+    across_moves = BACKENDS[backend]
+    graph = getattr(as_lexicon(dictionary), backend)
+    counts = dict(Counter(rack.lower()))
+    counts.setdefault(BLANK, 0)
+
+    moves = across_moves(board, counts, graph, ACROSS)
+
+    transposed = board.transposed()
+    for move in across_moves(transposed, counts, graph, DOWN):
+        # A single tile touching tiles on both axes was already found across
+        if len(move.tiles) == 1:
+            row, col, _, _ = move.tiles[0]
+            if board.get(row, col - 1) or board.get(row, col + 1):
+                continue
+        moves.append(move)
+    return moves
+
+
+def _dawg_across_moves(board: Board, counts: Dict[str, int], graph, direction: str) -> List[Move]:
+    """All moves played left to right along the rows, built as left part + extend right."""
+    size = board.size
+    cells = board.cells
+    check_rows, face_rows = _square_rows(board, graph)
+    anchors = board.anchors()
+    values = SCRABBLE_SCORES
+    child, is_terminal = graph.child, graph.is_terminal
+    branches = _branches(counts, graph)
+    moves = []
+
+    for row, anchor_col in sorted(anchors):
+        line = cells[row]
+        letter_line = board.letter_multipliers[row]
+        word_line = board.word_multipliers[row]
+        cross_line = board.cross_scores[ACROSS][row]
+        check_line = check_rows[row]
+        face_line = face_rows[row]
+
+        # Scores are carried as plain ints: the main word's letter total, its
+        # word multiplier and the total of the cross-words formed so far
+        def extend_right(partial, node, col, placed, main, multiplier, cross):
+            if col < size and line[col] is not None:
+                letter = line[col]
+                next_node = child(node, letter)
+                if next_node is not None:
+                    extend_right(partial + letter, next_node, col + 1, placed,
+                                 main + face_line[col], multiplier, cross)
+                return
+
+            if col > anchor_col and placed and is_terminal(node):
+                start = col - len(partial)
+                score = cross + main * multiplier + (BINGO_BONUS if len(placed) == RACK_SIZE else 0)
+                moves.append(_make_move(line, row, start, direction, partial, placed, score))
+            if col >= size:
+                return
+
+            word_multiplier = word_line[col]
+            cross_score = cross_line[col]
+            for letter, next_node, tile in branches(node, check_line[col]):
+                tile_score = 0 if tile == BLANK else values[letter] * letter_line[col]
+                counts[tile] -= 1
+                extend_right(partial + letter, next_node, col + 1, placed + tile,
+                             main + tile_score, multiplier * word_multiplier,
+                             cross if cross_score is None else cross + (cross_score + tile_score) * word_multiplier)
+                counts[tile] += 1
+
+        def left_part(partial, node, limit, placed, face):
+            # The left part sits right-aligned against the anchor, so only its
+            # face value can be carried along; premiums are added for the few
+            # premium squares it reaches. None of its squares has a cross-word.
+            main = face
+            multiplier = 1
+            length = len(partial)
+            for distance, letter_multiplier, word_multiplier in left_premiums:
+                if distance > length:
+                    break
+                if placed[length - distance] != BLANK:
+                    main += values[partial[length - distance]] * (letter_multiplier - 1)
+                multiplier *= word_multiplier
+            extend_right(partial, node, anchor_col, placed, main, multiplier, 0)
+
+            if not limit:
+                return
+            # Squares left of the anchor have no neighbours, so need no cross-checks
+            for letter, next_node, tile in branches(node, None):
+                counts[tile] -= 1
+                left_part(partial + letter, next_node, limit - 1, placed + tile,
+                          face if tile == BLANK else face + values[letter])
+                counts[tile] += 1
+
+        if anchor_col > 0 and line[anchor_col - 1] is not None:
+            # The left part is already on the board
+            start = anchor_col - 1
+            while start > 0 and line[start - 1] is not None:
+                start -= 1
+            node: Optional[object] = graph.root
+            main = 0
+            for col in range(start, anchor_col):
+                node = child(node, line[col])
+                if node is None:
+                    break
+                main += face_line[col]
+            if node is not None:
+                extend_right(''.join(line[start:anchor_col]), node, anchor_col, '', main, 1, 0)
+        else:
+            limit = 0
+            col = anchor_col - 1
+            while col >= 0 and line[col] is None and (row, col) not in anchors:
+                limit += 1
+                col -= 1
+            # (distance from the anchor, letter multiplier, word multiplier), nearest first
+            left_premiums = [
+                (distance, letter_line[anchor_col - distance], word_line[anchor_col - distance])
+                for distance in range(1, limit + 1)
+                if letter_line[anchor_col - distance] != 1 or word_line[anchor_col - distance] != 1
+            ]
+            left_part('', graph.root, limit, '', 0)
+
+    return moves
+
+
+def _gaddag_across_moves(board: Board, counts: Dict[str, int], graph, direction: str) -> List[Move]:
+    """All moves played left to right along the rows, grown outward from each anchor."""
+    size = board.size
+    cells = board.cells
+    check_rows, face_rows = _square_rows(board, graph)
+    anchors = board.anchors()
+    values = SCRABBLE_SCORES
+    child, is_terminal = graph.child, graph.is_terminal
+    branches = _branches(counts, graph)
+    moves = []
+
+    for row, anchor_col in sorted(anchors):
+        line = cells[row]
+        letter_line = board.letter_multipliers[row]
+        word_line = board.word_multipliers[row]
+        cross_line = board.cross_scores[ACROSS][row]
+        check_line = check_rows[row]
+        face_line = face_rows[row]
+
+        # Scores are carried as in _dawg_across_moves
+        def extend_right(partial, node, start, col, placed, main, multiplier, cross):
+            if col < size and line[col] is not None:
+                letter = line[col]
+                next_node = child(node, letter)
+                if next_node is not None:
+                    extend_right(partial + letter, next_node, start, col + 1, placed,
+                                 main + face_line[col], multiplier, cross)
+                return
+
+            if is_terminal(node):
+                score = cross + main * multiplier + (BINGO_BONUS if len(placed) == RACK_SIZE else 0)
+                moves.append(_make_move(line, row, start, direction, partial, placed, score))
+            if col >= size:
+                return
+
+            word_multiplier = word_line[col]
+            cross_score = cross_line[col]
+            for letter, next_node, tile in branches(node, check_line[col]):
+                tile_score = 0 if tile == BLANK else values[letter] * letter_line[col]
+                counts[tile] -= 1
+                extend_right(partial + letter, next_node, start, col + 1, placed + tile,
+                             main + tile_score, multiplier * word_multiplier,
+                             cross if cross_score is None else cross + (cross_score + tile_score) * word_multiplier)
+                counts[tile] += 1
+
+        def extend_left(partial, node, col, placed, main, multiplier, cross):
+            # partial covers col + 1 .. anchor; col is the next square to the left
+            if col >= 0 and line[col] is not None:
+                letter = line[col]
+                next_node = child(node, letter)
+                if next_node is not None:
+                    extend_left(letter + partial, next_node, col - 1, placed,
+                                main + face_line[col], multiplier, cross)
+                return
+
+            # Stop going left here and turn right after the anchor
+            turn = child(node, SEPARATOR)
+            if turn is not None:
+                extend_right(partial, turn, col + 1, anchor_col + 1, placed, main, multiplier, cross)
+
+            # Squares left of the anchor have no neighbours, so need no cross-checks
+            # and add no cross-words; another anchor to the left generates the
+            # moves that cover it
+            if col < 0 or (row, col) in anchors:
+                return
+            word_multiplier = word_line[col]
+            for letter, next_node, tile in branches(node, None):
+                counts[tile] -= 1
+                extend_left(letter + partial, next_node, col - 1, tile + placed,
+                            main if tile == BLANK else main + values[letter] * letter_line[col],
+                            multiplier * word_multiplier, cross)
+                counts[tile] += 1
+
+        # Every move covers its anchor square with a new tile
+        word_multiplier = word_line[anchor_col]
+        cross_score = cross_line[anchor_col]
+        for letter, node, tile in branches(graph.root, check_line[anchor_col]):
+            tile_score = 0 if tile == BLANK else values[letter] * letter_line[anchor_col]
+            counts[tile] -= 1
+            extend_left(letter, node, anchor_col - 1, tile, tile_score, word_multiplier,
+                        0 if cross_score is None else (cross_score + tile_score) * word_multiplier)
+            counts[tile] += 1
+
+    return moves
+
+
+def _square_rows(board: Board, graph) -> Tuple[List[list], List[List[int]]]:
+    """
+    Per-square data the generators look up at every step, as row lists.
+
+    Indexing a row by column is much cheaper in the search than hashing a
+    (row, col) square into the board's cross-check dict and blank set.
+
+    Returns:
+        (check_rows, face_rows): the cross-check letter set of each square
+        (None when it accepts any letter) and the face value of the tile on it
+    """
+    checks = board.cross_checks(graph)
+    squares = range(board.size)
+    check_rows = [[checks.get((row, col)) for col in squares] for row in squares]
+    face_rows = [[board.tile_value(row, col) for col in squares] for row in squares]
+    return check_rows, face_rows
+
+
+def _branches(counts: Dict[str, int], graph):
+    """
+    Build the function listing the tiles that can extend a node.
+
+    With blanks on the rack every edge of the node is a candidate; without,
+    only the edges labelled with one of the rack's letters. The search
+    reaches the same nodes again from other anchors, so each node's
+    candidate edges are read from the graph once, then only filtered by the
+    tiles left and the square's cross-check.
+
+    Returns:
+        branches(node, allowed) -> [(letter, next node, tile used)], where
+        allowed is a set of letters the square accepts or None for any
+    """
+    edges = graph.edges
+    every_edge = {}
+    rack_edges = {}
+
+    def branches(node, allowed):
+        blanks = counts[BLANK]
+        if blanks:
+            pairs = every_edge.get(node)
+            if pairs is None:
+                pairs = every_edge[node] = [(letter, next_node) for letter, next_node in edges(node)
+                                            if letter != SEPARATOR]
+        else:
+            pairs = rack_edges.get(node)
+            if pairs is None:
+                pairs = rack_edges[node] = [(letter, next_node) for letter, next_node in edges(node)
+                                            if letter in counts]
+        found = []
+        for letter, next_node in pairs:
+            if allowed is not None and letter not in allowed:
+                continue
+            if counts.get(letter):
+                found.append((letter, next_node, letter))
+            if blanks:
+                found.append((letter, next_node, BLANK))
+        return found
+
+    return branches
+
+
+def _make_move(line: List[Optional[str]], row: int, start: int, direction: str,
+               word: str, placed: str, score: int) -> Move:
+    """
+    Build a move found along a row of the (possibly transposed) board.
+
+    Args:
+        line: Row of the board the word lies on
+        row: Row index
+        start: Column of the first letter of the word
+        direction: ACROSS, or DOWN when the board searched is the transposed one;
+            the move's squares are then mirrored back onto the real board
+        word: Whole word, including letters already on the board
+        placed: One character per new tile, left to right: BLANK or the letter itself
+
+    Returns:
+        Move whose tiles are (row, col, letter, is_blank) for each empty square the word covers
+    """
+    tiles = []
+    index = 0
+    for col, letter in enumerate(word, start):
+        if line[col] is None:
+            tiles.append((row, col, letter, placed[index] == BLANK))
+            index += 1
+    if direction == DOWN:
+        return Move(word, start, row, direction,
+                    tuple([(col, row, letter, is_blank) for row, col, letter, is_blank in tiles]), score)
+    return Move(word, row, start, direction, tuple(tiles), score)
+
+
+# Board generators selectable by name; each reads the lexicon attribute of the same name
+BACKENDS = {
+    'dawg': _dawg_across_moves,
+    'gaddag': _gaddag_across_moves,
+}
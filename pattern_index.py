@@ -0,0 +1,185 @@
+"""
+Letter-position index for crossword-style pattern queries.
+
+A pattern such as ``?a??e`` or ``s*ing`` fixes letters at known positions:
+``?`` stands for exactly one letter and ``*`` for any run of letters. For
+each word length the index keeps one bitset per (position, letter) over the
+words of that length, so the words matching every fixed letter are found by
+intersecting a few bitsets instead of testing every word in the lexicon.
+"""
+
+import sys
+from array import array
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from utils.filtering import pattern_regex
+
+# Pattern characters: one unknown letter, and any run of letters (possibly empty)
+WILDCARD = '?'
+ANY_RUN = '*'
+
+# Set bit positions of every byte value, for walking a bitset one byte at a time
+_BYTE_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+class PatternIndex:
+    """
+    Per-length (position, letter) bitsets over a lexicon's word ids.
+
+    ``buckets[length]`` lists the ids of the words of that length in id
+    order; bit ``i`` of ``bitsets[(length, position, letter)]`` is set when
+    word ``buckets[length][i]`` has the letter at that position.
+    """
+
+    def __init__(self, buckets: Dict[int, array], bitsets: Dict[Tuple[int, int, str], int],
+                 word_at: Callable[[int], str]):
+        self.buckets = buckets
+        self.bitsets = bitsets
+        self.word_at = word_at
+        self.max_word_length = max(buckets, default=0)
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> 'PatternIndex':
+        """
+        Index a word list whose positions are the word ids.
+
+        Bits are set in one bytearray per (length, position, letter) and each
+        row is converted to an int once, rather than growing big ints bit by bit.
+        """
+        words = list(words)
+        buckets: Dict[int, array] = {}
+        for word_id, word in enumerate(words):
+            buckets.setdefault(len(word), array('I')).append(word_id)
+
+        bitsets = {}
+        for length, ids in buckets.items():
+            size = (len(ids) + 7) // 8
+            rows: Dict[Tuple[int, str], bytearray] = {}
+            for local_id, word_id in enumerate(ids):
+                byte, bit = local_id >> 3, 1 << (local_id & 7)
+                for position, letter in enumerate(words[word_id]):
+                    row = rows.get((position, letter))
+                    if row is None:
+                        row = rows[(position, letter)] = bytearray(size)
+                    row[byte] |= bit
+            for (position, letter), row in rows.items():
+                bitsets[(length, position, letter)] = int.from_bytes(row, 'little')
+        return cls(buckets, bitsets, words.__getitem__)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate bytes held by the bitsets and id buckets."""
+        return (sum(map(sys.getsizeof, self.bitsets.values())) +
+                sum(ids.itemsize * len(ids) for ids in self.buckets.values()))
+
+    def search(self, pattern: str, letters: Optional[str] = None) -> List[Tuple[int, str]]:
+        """
+        Find the words matching a pattern, optionally playable from a rack.
+
+        Letters before the first ``*`` are matched from the start of the word
+        and letters after the last one from its end, through the bitsets of
+        each candidate length; only patterns with letters between two ``*``
+        are checked against the words themselves, once the bitsets have
+        narrowed them to words holding those letters.
+
+        With a rack, the pattern's letters are taken to be on the board
+        already and the rack (``?`` for blanks) must supply every other
+        letter of the word, and at least one.
+
+        Args:
+            pattern: Letters, '?' and '*' (case-insensitive)
+            letters: Optional rack constraining the unknown letters
+
+        Returns:
+            List of (word id, letters the blanks stood for), shortest words
+            first and in id order within each length
+        """
+        pattern = pattern.lower()
+        parts = pattern.split(ANY_RUN)
+        head = parts[0]
+        tail = parts[-1] if len(parts) > 1 else ''
+        fixed = Counter(pattern.replace(ANY_RUN, '').replace(WILDCARD, ''))
+        min_length = len(pattern) - pattern.count(ANY_RUN)
+        max_length = min_length if len(parts) == 1 else self.max_word_length
+        middle = pattern_regex(pattern) if len(parts) > 2 else None
+        inner = sorted(set(''.join(parts[1:-1]).replace(WILDCARD, '')))
+
+        rack = blanks = None
+        excluded = ()
+        if letters is not None:
+            rack = Counter(letters.lower())
+            blanks = rack.pop(WILDCARD, 0)
+            # A play adds at least one tile and at most the whole rack
+            min_length = max(min_length, sum(fixed.values()) + 1)
+            max_length = min(max_length, sum(fixed.values()) + sum(rack.values()) + blanks)
+            if not blanks:
+                # Letters neither on the board nor on the rack cannot appear anywhere
+                excluded = [letter for letter in map(chr, range(ord('a'), ord('z') + 1))
+                            if letter not in rack and letter not in fixed]
+
+        found = []
+        for length in range(min_length, max_length + 1):
+            ids = self.buckets.get(length)
+            if not ids:
+                continue
+            bits = self._candidates(length, len(ids), head, tail, inner, excluded)
+            if not bits:
+                continue
+            data = bits.to_bytes((len(ids) + 7) // 8, 'little')
+            for byte_index, byte in enumerate(data):
+                if not byte:
+                    continue
+                for bit in _BYTE_BITS[byte]:
+                    word_id = ids[byte_index * 8 + bit]
+                    if middle is None and rack is None:
+                        found.append((word_id, ''))
+                        continue
+                    word = self.word_at(word_id)
+                    if middle is not None and not middle.fullmatch(word):
+                        continue
+                    if rack is None:
+                        found.append((word_id, ''))
+                        continue
+                    blank_letters = _blank_letters(word, fixed, rack, blanks)
+                    if blank_letters is not None:
+                        found.append((word_id, blank_letters))
+        return found
+
+    def _candidates(self, length: int, count: int, head: str, tail: str,
+                    inner: Iterable[str], excluded: Iterable[str]) -> int:
+        """
+        Bitset of the words of one length with the head and tail letters in
+        place, each inner letter somewhere between them and no excluded letter.
+        """
+        bitsets = self.bitsets
+        bits = (1 << count) - 1
+        offset = length - len(tail)
+        for position, letter in [*enumerate(head), *enumerate(tail, offset)]:
+            if letter != WILDCARD:
+                bits &= bitsets.get((length, position, letter), 0)
+                if not bits:
+                    return 0
+        for letter in inner:
+            anywhere = 0
+            for position in range(len(head), offset):
+                anywhere |= bitsets.get((length, position, letter), 0)
+            bits &= anywhere
+            if not bits:
+                return 0
+        unwanted = 0
+        for letter in excluded:
+            for position in range(length):
+                unwanted |= bitsets.get((length, position, letter), 0)
+        return bits & ~unwanted
+
+
+def _blank_letters(word: str, fixed: Counter, rack: Counter, blanks: int) -> Optional[str]:
+    """Letters the blanks must stand for to play the word around the fixed letters, or None."""
+    short = []
+    for letter, count in (Counter(word) - fixed).items():
+        missing = count - rack.get(letter, 0)
+        if missing > 0:
+            short.append(letter * missing)
+    blank_letters = ''.join(short)
+    return blank_letters if len(blank_letters) <= blanks else None
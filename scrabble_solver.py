@@ -1,4 +1,18 @@
-import itertools
+import hashlib
+import heapq
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter, namedtuple
+from itertools import count
+from functools import cached_property
+
+import matrix_engine
+from dawg import Dawg, letter_bit, subtree_bounds
+from gaddag import Gaddag
+from pattern_index import ANY_RUN, WILDCARD, PatternIndex
+from utils.filtering import iter_filters
+from utils.results import WordResult
 
 # Scrabble letter scores
 SCRABBLE_SCORES = {
@@ -7,24 +21,576 @@ SCRABBLE_SCORES = {
     "w": 4, "x": 8, "y": 4, "z": 10
 }
 
-def calculate_word_score(word):
-    """Calculate the Scrabble score for a word."""
-    return sum(SCRABBLE_SCORES.get(letter, 0) for letter in word)
+# Rack character standing for a blank tile
+BLANK = '?'
+
+def calculate_word_score(word, blanks=''):
+    """Calculate the Scrabble score for a word, counting blank-tile letters as 0."""
+    score = sum(SCRABBLE_SCORES.get(letter, 0) for letter in word)
+    return score - sum(SCRABBLE_SCORES.get(letter, 0) for letter in blanks)
+
+def word_signature(word):
+    """Return the sorted-letter signature shared by all anagrams of a word."""
+    return ''.join(sorted(word))
+
+def build_anagram_index(words):
+    """Map each sorted-letter signature to the ids (list positions) of the words that share it."""
+    index = {}
+    for word_id, word in enumerate(words):
+        index.setdefault(word_signature(word), []).append(word_id)
+    return index
+
+class Lexicon:
+    """
+    A word list together with the lookup indexes used by the solver.
+
+    Word ids follow alphabetical order; each word's score and length are
+    computed once here and stored in compact arrays indexed by id.
+    """
+
+    def __init__(self, words):
+        self.words = frozenset(words)
+        self.word_list = sorted(self.words)
+        self.scores = array('H', map(calculate_word_score, self.word_list))
+        self.lengths = array('B', map(len, self.word_list))
+        self.anagram_index = build_anagram_index(self.word_list)
+        self.max_word_length = max(self.lengths, default=0)
+
+    def word(self, word_id):
+        """Return the word with the given id."""
+        return self.word_list[word_id]
+
+    def anagrams(self, signature):
+        """Return the words whose sorted letters equal the signature."""
+        return [self.word(word_id) for word_id in self.anagram_index.get(signature, ())]
+
+    def prefix_range(self, prefix):
+        """Return the (start, stop) ids of the words starting with prefix, which are contiguous."""
+        start = bisect_left(range(len(self)), prefix, key=self.word)
+        stop = bisect_left(range(start, len(self)), prefix + '\x7f', key=self.word) + start
+        return start, stop
+
+    @cached_property
+    def version(self):
+        """Short content hash identifying this word list (e.g. for cache keys)."""
+        digest = hashlib.sha256('\n'.join(sorted(self.words)).encode('utf-8'))
+        return digest.hexdigest()[:16]
+
+    @cached_property
+    def dawg(self):
+        """Minimized trie over the word list, built on first use."""
+        return Dawg(self.words)
+
+    @cached_property
+    def signature_dawg(self):
+        """Minimized trie over the anagram signatures, used for blank-tile searches."""
+        return Dawg(self.anagram_index)
+
+    @cached_property
+    def signature_bounds(self):
+        """Heights and reachable-letter masks of the signature graph nodes, for best-first searches."""
+        return subtree_bounds(self.signature_dawg)
+
+    @cached_property
+    def gaddag(self):
+        """GADDAG over the word list, for reading words outward from any letter."""
+        return Gaddag.from_words(self.word_list)
+
+    @cached_property
+    def pattern_index(self):
+        """Letter-position bitsets for pattern queries such as '?a??e', built on first use."""
+        return PatternIndex.from_words(map(self.word, range(len(self))))
+
+    @cached_property
+    def letter_matrix(self):
+        """NumPy letter-count matrix over the alphabetically sorted words."""
+        return matrix_engine.LetterMatrix.from_words(self.word_list, SCRABBLE_SCORES)
+
+    def __contains__(self, word):
+        return word in self.words
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def __len__(self):
+        return len(self.words)
+
+def as_lexicon(dictionary):
+    """Return the dictionary as a Lexicon, indexing plain collections on the fly."""
+    if isinstance(dictionary, Lexicon):
+        return dictionary
+    return Lexicon(dictionary)
 
 def load_dictionary(file_path):
-    """Load the dictionary file into a set."""
+    """Load the dictionary file into an indexed Lexicon."""
     with open(file_path, 'r') as file:
-        return set(word.strip().lower() for word in file)
-
-def generate_valid_words(letters, dictionary):
-    """Generate all valid Scrabble words from the given letters."""
-    valid_words = set()
-    for i in range(1, len(letters) + 1):
-        for combination in itertools.permutations(letters, i):
-            word = ''.join(combination)
-            if word in dictionary:
-                valid_words.add(word)
-    return sorted(valid_words, key=calculate_word_score, reverse=True)
+        return Lexicon(word.strip().lower() for word in file)
+
+def rack_signatures(letters, max_length=None):
+    """Yield the signature of every distinct non-empty sub-multiset of the rack."""
+    signatures = ['']
+    for letter, count in sorted(Counter(letters).items()):
+        signatures = [
+            signature + letter * n
+            for signature in signatures
+            for n in range(count + 1)
+            if max_length is None or len(signature) + n <= max_length
+        ]
+    return (signature for signature in signatures if signature)
+
+def split_rack(letters):
+    """Split a rack into its real letters and the number of blank tiles."""
+    return letters.replace(BLANK, ''), letters.count(BLANK)
+
+# Searches given a budget check it every this many signatures (the graph
+# searches check it near the root, see dawg.BUDGET_CHECK_DEPTH)
+BUDGET_CHECK_EVERY = 64
+
+class SearchBudget:
+    """
+    Time and word limits for the searches of one request.
+
+    Searches check the budget as they go and, once it has run out, stop and
+    return the words found so far. The deadline (seconds from now, or a
+    time.monotonic() value) is shared by every search given the budget, while
+    max_words caps each rack's results on its own, so one rack of a batch
+    reaching it does not cut short the next. Searches are checked only every
+    so often, so one may find a few more words than max_words before it
+    stops; its results are then cut to the best max_words of them. cut_short
+    maps the signature of every rack whose results were cut short to the
+    reason: 'time_limit' or 'word_limit'.
+    """
+
+    def __init__(self, seconds=None, max_words=None, deadline=None):
+        if deadline is None and seconds is not None:
+            deadline = time.monotonic() + seconds
+        self.deadline = deadline
+        self.max_words = max_words
+        self.reason = None
+        self.cut_short = {}
+
+    def exhausted(self, found=0):
+        """True once the budget has run out, given the words found so far; stays True after."""
+        if self.reason is None:
+            if self.deadline is not None and time.monotonic() >= self.deadline:
+                self.reason = 'time_limit'
+            elif self.max_words is not None and found >= self.max_words:
+                self.reason = 'word_limit'
+        return self.reason is not None
+
+    def remaining(self):
+        """Seconds left before the deadline (None without one)."""
+        return None if self.deadline is None else max(0.0, self.deadline - time.monotonic())
+
+    def for_search(self):
+        """A fresh budget for one rack's search, sharing this one's deadline."""
+        return SearchBudget(max_words=self.max_words, deadline=self.deadline)
+
+    def cut(self, letters, reason):
+        """Record that the search for a rack stopped early."""
+        self.cut_short[word_signature(letters)] = reason
+        self.reason = self.reason or reason
+
+    def was_cut(self, letters):
+        """The reason the search for a rack stopped early, or None if it ran to the end."""
+        return self.cut_short.get(word_signature(letters))
+
+# What a filter spec lets engines skip: word lengths outside [min_length, max_length],
+# words not starting/ending with first_letter/last_letter ('' for any) and anagram
+# signatures missing any of the required letter counts
+SearchLimits = namedtuple('SearchLimits', 'min_length max_length first_letter last_letter required')
+
+def search_limits(filters):
+    """
+    Derive the search limits implied by a filter spec (see utils.filtering).
+
+    Limits only rule out words the filters would drop anyway; engines still
+    pass their results through the filters. Returns None without filters.
+    """
+    if not filters:
+        return None
+    starts_with = str(filters.get('starts_with') or '').lower()
+    ends_with = str(filters.get('ends_with') or '').lower()
+    pattern = str(filters.get('pattern') or '').strip().lower()
+    fixed = pattern.replace(ANY_RUN, '').replace(WILDCARD, '')
+
+    min_length = max(int(filters.get('min_length') or 1), len(starts_with), len(ends_with),
+                     len(pattern) - pattern.count(ANY_RUN))
+    max_length = filters.get('max_length')
+    max_length = int(max_length) if max_length is not None else None
+    if pattern and ANY_RUN not in pattern:
+        max_length = len(pattern) if max_length is None else min(max_length, len(pattern))
+
+    def fixed_letter(*candidates):
+        for letter in candidates:
+            if letter.isascii() and letter.isalpha():
+                return letter
+        return ''
+
+    return SearchLimits(
+        min_length,
+        max_length,
+        fixed_letter(starts_with[:1], pattern[:1]),
+        fixed_letter(ends_with[-1:], pattern[-1:]),
+        Counter(starts_with) | Counter(ends_with) | Counter(fixed)
+    )
+
+def _within_limits(signature, limits):
+    """True if words with this anagram signature can pass the limits."""
+    length = len(signature)
+    if length < limits.min_length or (limits.max_length is not None and length > limits.max_length):
+        return False
+    return all(signature.count(letter) >= count for letter, count in limits.required.items())
+
+def _signature_records(lexicon, signature, lookups):
+    """(word, score, length, '') records for one signature, read from the precomputed arrays."""
+    if lookups is not None:
+        found = lookups.get(signature)
+        if found is not None:
+            return found
+    word, scores, lengths = lexicon.word, lexicon.scores, lexicon.lengths
+    found = [(word(word_id), scores[word_id], lengths[word_id], '')
+             for word_id in lexicon.anagram_index.get(signature, ())]
+    if lookups is not None:
+        lookups[signature] = found
+    return found
+
+def _max_length(lexicon, limits):
+    """Longest word length worth searching for."""
+    if limits is None or limits.max_length is None:
+        return lexicon.max_word_length
+    return min(limits.max_length, lexicon.max_word_length)
+
+def _iter_anagram_records(letters, lexicon, lookups=None, length_order=None, limits=None, budget=None):
+    """Lazily yield records signature by signature, optionally grouped by ascending/descending length."""
+    tiles, blanks = split_rack(letters)
+    if not blanks:
+        signatures = rack_signatures(tiles, _max_length(lexicon, limits))
+        if limits is not None:
+            signatures = (signature for signature in signatures if _within_limits(signature, limits))
+        if length_order:
+            signatures = sorted(signatures, key=len, reverse=length_order == 'desc')
+        found = 0
+        for index, signature in enumerate(signatures):
+            if budget is not None and not index % BUDGET_CHECK_EVERY and budget.exhausted(found):
+                return
+            records = _signature_records(lexicon, signature, lookups)
+            found += len(records)
+            yield from records
+        return
+    # Blanks can complete any signature, so walk the signature graph instead of
+    # multiplying the sub-multisets by 26 letters per blank. Anagrams share the
+    # walk's score, which already leaves out the blanks.
+    walk = lexicon.signature_dawg.search_rack(tiles, blanks, SCRABBLE_SCORES, _max_length(lexicon, limits),
+                                              budget=budget)
+    if limits is not None:
+        walk = [item for item in walk if _within_limits(item[0], limits)]
+    if length_order:
+        walk.sort(key=lambda item: len(item[0]), reverse=length_order == 'desc')
+    word = lexicon.word
+    for signature, blank_letters, score in walk:
+        length = len(signature)
+        for word_id in lexicon.anagram_index[signature]:
+            yield (word(word_id), score, length, blank_letters)
+
+def _anagram_search(letters, lexicon, lookups=None, limits=None, budget=None):
+    return list(_iter_anagram_records(letters, lexicon, lookups, limits=limits, budget=budget))
+
+def _trie_search(letters, lexicon, lookups=None, limits=None, budget=None):
+    tiles, blanks = split_rack(letters)
+    if limits is None:
+        found = lexicon.dawg.search_rack(tiles, blanks, SCRABBLE_SCORES, budget=budget)
+    else:
+        found = lexicon.dawg.search_rack(tiles, blanks, SCRABBLE_SCORES, _max_length(lexicon, limits),
+                                         limits.first_letter, budget=budget)
+    return [(word, score, len(word), blank_letters) for word, blank_letters, score in found]
+
+def _gaddag_search(letters, lexicon, lookups=None, limits=None, budget=None):
+    tiles, blanks = split_rack(letters)
+    if limits is None:
+        found = lexicon.gaddag.search_rack(tiles, blanks, SCRABBLE_SCORES, budget=budget)
+    else:
+        found = lexicon.gaddag.search_rack(tiles, blanks, SCRABBLE_SCORES, _max_length(lexicon, limits),
+                                           limits.first_letter, limits.last_letter, budget=budget)
+    return [(word, score, len(word), blank_letters) for word, blank_letters, score in found]
+
+def _matrix_search(letters, lexicon, lookups=None, limits=None, budget=None):
+    # One vectorized pass with nothing to check in between, so the budget is only checked up front
+    if budget is not None and budget.exhausted():
+        return []
+    tiles, blanks = split_rack(letters)
+    if limits is None:
+        return lexicon.letter_matrix.search(tiles, blanks)
+    # Words sharing a first letter are a contiguous run of ids
+    id_range = lexicon.prefix_range(limits.first_letter) if limits.first_letter else None
+    return lexicon.letter_matrix.search(tiles, blanks, limits.min_length, limits.max_length, id_range)
+
+# Search engines selectable by name; each returns the same (word, score, length, blanks)
+# records. Engines may memoize partial lookups in a dict shared across a batch of racks,
+# and may skip words ruled out by SearchLimits (results are filtered exactly afterwards).
+# Given a SearchBudget for the one search, they stop once it runs out and return what they found.
+# The matrix engine is only offered when NumPy is installed.
+ENGINES = {
+    'anagram': _anagram_search,
+    'trie': _trie_search,
+    'gaddag': _gaddag_search,
+}
+if matrix_engine.AVAILABLE:
+    ENGINES['matrix'] = _matrix_search
+DEFAULT_ENGINE = 'anagram'
+
+def prepare_engine(dictionary, engine=DEFAULT_ENGINE):
+    """Build any lazy index the engine needs so the first query is not slowed down."""
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'")
+    if engine == 'trie':
+        dictionary.dawg
+    elif engine == 'gaddag':
+        dictionary.gaddag
+    elif engine == 'matrix':
+        dictionary.letter_matrix
+    else:
+        dictionary.signature_dawg
+
+def _result(word, score, length, blank_letters):
+    return WordResult(word, score, length, ''.join(sorted(blank_letters)) if len(blank_letters) > 1 else blank_letters)
+
+def _result_order(result):
+    # The 'score' page order of utils.pagination, so result lists can be paged by slicing
+    return -result.score, result.word, result.blanks
+
+def _end_search(letters, results, budget, search):
+    """Cut a rack's best-first results to max_words, and record on the budget if they were cut short."""
+    if search is None:
+        return results
+    if search.max_words is not None and len(results) > search.max_words:
+        del results[search.max_words:]
+        search.reason = search.reason or 'word_limit'
+    if search.reason:
+        budget.cut(letters, search.reason)
+    return results
+
+def _find_words(letters, lexicon, engine, lookups=None, filters=None, limit=None, budget=None):
+    search = budget.for_search() if budget is not None else None
+    records = ENGINES[engine](letters, lexicon, lookups, search_limits(filters), search)
+    results = (_result(*record) for record in records)
+    if filters:
+        results = iter_filters(results, filters)
+    if limit is not None:
+        results = heapq.nsmallest(limit, results, key=_result_order)
+    else:
+        results = list(results)
+        results.sort(key=_result_order)
+    return _end_search(letters, results, budget, search)
+
+def find_words(letters, dictionary, engine=DEFAULT_ENGINE, filters=None, limit=None, budget=None):
+    """
+    Find all valid words for a rack that may contain blank tiles ('?').
+
+    Returns WordResult objects (see utils.results; they read like dicts)
+    with the word, its score, its length and the letters the blanks stood
+    for, sorted by score (highest first) then alphabetically.
+    Filters (as accepted by utils.filtering.validate_filters) are applied
+    during the search, pruning it where the engine can, with the same result
+    as filtering the full list afterwards. With a limit only that many of the
+    best results are kept, selected with a bounded heap instead of a full sort.
+    With a SearchBudget the search stops once it runs out, returning (sorted)
+    the words found so far, at most max_words of them; budget.cut_short then
+    holds the rack.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'")
+    return _find_words(letters, as_lexicon(dictionary), engine, filters=filters, limit=limit, budget=budget)
+
+def find_words_batch(racks, dictionary, engine=DEFAULT_ENGINE, filters=None, budget=None):
+    """
+    Run find_words for many racks at once.
+
+    Racks that are anagrams of each other are solved once, and index lookups
+    are shared between racks. Returns one result list per rack, in input order;
+    racks with the same letters share the same list. A budget's deadline
+    covers the whole batch: racks left once it passes get empty results.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'")
+    lexicon = as_lexicon(dictionary)
+    lookups = {}
+    solved = {}
+    batch_results = []
+    for letters in racks:
+        key = word_signature(letters)
+        if key not in solved:
+            solved[key] = _find_words(letters, lexicon, engine, lookups, filters, budget=budget)
+        batch_results.append(solved[key])
+    return batch_results
+
+def find_pattern_words(pattern, dictionary, letters=None):
+    """
+    Find all words matching a crossword-style pattern ('?' one letter, '*' any run).
+
+    With a rack, the pattern's letters count as already placed and the rack,
+    which may contain blanks, must supply the rest of each word. Returns the
+    same results as find_words, in the same order.
+    """
+    lexicon = as_lexicon(dictionary)
+    word, scores, lengths = lexicon.word, lexicon.scores, lexicon.lengths
+    results = [
+        _result(word(word_id), scores[word_id] - calculate_word_score(blank_letters),
+                lengths[word_id], blank_letters)
+        for word_id, blank_letters in lexicon.pattern_index.search(pattern, letters)
+    ]
+    results.sort(key=_result_order)
+    return results
+
+def iter_words(letters, dictionary, engine=DEFAULT_ENGINE, length_order=None, filters=None, budget=None):
+    """
+    Lazily yield the find_words results for a rack, in discovery order.
+
+    The anagram engine produces results one signature at a time, so the first
+    words are available long before the search finishes and the full result
+    list is never held. Results are not sorted by score; with length_order
+    'asc' or 'desc' they arrive grouped by word length in that order. Filters
+    are pushed down as in find_words. With a budget the results end early
+    once it runs out or max_words have been yielded, and budget.cut_short
+    holds the rack once they have.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'")
+    lexicon = as_lexicon(dictionary)
+    limits = search_limits(filters)
+    search = budget.for_search() if budget is not None else None
+    if engine == 'anagram':
+        records = _iter_anagram_records(letters, lexicon, length_order=length_order, limits=limits, budget=search)
+    else:
+        records = ENGINES[engine](letters, lexicon, limits=limits, budget=search)
+        if length_order:
+            records = sorted(records, key=lambda record: record[2], reverse=length_order == 'desc')
+    results = (_result(*record) for record in records)
+    if filters:
+        results = iter_filters(results, filters)
+    if search is None or search.max_words is None:
+        yield from results
+    else:
+        for count, result in enumerate(results):
+            if count == search.max_words:
+                search.reason = search.reason or 'word_limit'
+                break
+            yield result
+    if search is not None and search.reason:
+        budget.cut(letters, search.reason)
+
+def _best_signatures(tiles, blanks, lexicon, max_length, budget=None):
+    """
+    Yield (signature, blank letters, score) for every signature the rack can spell, best first.
+
+    Partial signatures are expanded in order of the best score they could
+    still reach: their score so far plus the highest-valued remaining tiles
+    that fit, counting only letters that occur below their node and no more
+    tiles than its longest continuation. The bound never underestimates, so
+    a complete signature popped from the queue beats everything still in it.
+    With a budget the search ends once it runs out.
+    """
+    graph = lexicon.signature_dawg
+    heights, masks = lexicon.signature_bounds
+    edges, child, is_terminal = graph.edges, graph.child, graph.is_terminal
+    counts = Counter(tiles)
+    rack_letters = sorted(counts)
+    index_of = {letter: index for index, letter in enumerate(rack_letters)}
+    values = [SCRABBLE_SCORES.get(letter, 0) for letter in rack_letters]
+    bits = [letter_bit(letter) for letter in rack_letters]
+    by_value = sorted(range(len(rack_letters)), key=values.__getitem__, reverse=True)
+    max_length = min(max_length, len(tiles) + blanks)
+
+    def reachable(node, remaining, depth):
+        mask = masks[node]
+        room = min(heights[node], max_length - depth)
+        extra = 0
+        for index in by_value:
+            if not room:
+                break
+            if remaining[index] and mask & bits[index]:
+                taken = min(remaining[index], room)
+                extra += taken * values[index]
+                room -= taken
+        return extra
+
+    # Entries: (-best reachable score, 0 for a complete signature / 1 to expand, tie-breaker, state)
+    order = count()
+    start = tuple(counts[letter] for letter in rack_letters)
+    queue = [(-reachable(graph.root, start, 0), 1, next(order), (graph.root, '', start, blanks, '', 0))]
+    pops = found = 0
+    while queue:
+        if budget is not None and not pops % BUDGET_CHECK_EVERY and budget.exhausted(found):
+            return
+        pops += 1
+        _, kind, _, state = heapq.heappop(queue)
+        if not kind:
+            found += 1
+            yield state
+            continue
+        node, signature, remaining, blanks_left, blank_letters, score = state
+        if blanks_left:
+            candidates = edges(node)
+        else:
+            candidates = [(letter, child(node, letter)) for index, letter in enumerate(rack_letters)
+                          if remaining[index]]
+        depth = len(signature) + 1
+        for letter, next_node in candidates:
+            if next_node is None:
+                continue
+            index = index_of.get(letter)
+            if index is not None and remaining[index]:
+                next_remaining = remaining[:index] + (remaining[index] - 1,) + remaining[index + 1:]
+                next_blanks, next_blank_letters = blanks_left, blank_letters
+                next_score = score + values[index]
+            elif blanks_left:
+                next_remaining = remaining
+                next_blanks, next_blank_letters = blanks_left - 1, blank_letters + letter
+                next_score = score
+            else:
+                continue
+            next_signature = signature + letter
+            if is_terminal(next_node):
+                heapq.heappush(queue, (-next_score, 0, next(order),
+                                       (next_signature, next_blank_letters, next_score)))
+            if depth < max_length and heights[next_node]:
+                heapq.heappush(queue, (-(next_score + reachable(next_node, next_remaining, depth)), 1, next(order),
+                                       (next_node, next_signature, next_remaining, next_blanks,
+                                        next_blank_letters, next_score)))
+
+def best_words(letters, dictionary, n=10, filters=None, budget=None):
+    """
+    Find the n best-scoring words for a rack without enumerating the rest.
+
+    Returns the same results as find_words(letters, dictionary, filters=filters,
+    limit=n). Anagram signatures are searched best first, so the search
+    stops as soon as no signature left can reach the n-th best score. With a
+    budget that runs out first, the best words found so far are returned;
+    its max_words caps n.
+    """
+    if n <= 0:
+        return []
+    lexicon = as_lexicon(dictionary)
+    limits = search_limits(filters)
+    tiles, blanks = split_rack(letters)
+    word = lexicon.word
+    best = []
+    search = budget.for_search() if budget is not None else None
+    for signature, blank_letters, score in _best_signatures(tiles, blanks, lexicon, _max_length(lexicon, limits),
+                                                            search):
+        # Signatures arrive best first: once one falls short, so do all the rest
+        if len(best) >= n and score < best[n - 1].score:
+            break
+        if limits is not None and not _within_limits(signature, limits):
+            continue
+        results = (_result(word(word_id), score, len(signature), blank_letters)
+                   for word_id in lexicon.anagram_index[signature])
+        best.extend(iter_filters(results, filters) if filters else results)
+    return _end_search(letters, heapq.nsmallest(n, best, key=_result_order), budget, search)
+
+def generate_valid_words(letters, dictionary, engine=DEFAULT_ENGINE, filters=None, limit=None):
+    """Generate the valid Scrabble words from the given letters, optionally filtered and limited (see find_words)."""
+    return [result.word for result in find_words(letters, dictionary, engine, filters, limit)]
 
 def main():
     # Input Scrabble letters
@@ -33,13 +599,13 @@ def main():
     # Load dictionary
     dictionary = load_dictionary("dictionary.txt")  # Ensure you have a valid dictionary.txt file
     
-    # Generate valid words
-    valid_words = generate_valid_words(letters, dictionary)
+    # Generate valid words with their precomputed scores
+    valid_words = find_words(letters, dictionary)
     
     # Output sorted valid words with scores
     print("Valid Scrabble Words:")
-    for word in valid_words:
-        print(f"{word} ({calculate_word_score(word)} points)")
+    for result in valid_words:
+        print(f"{result['word']} ({result['score']} points)")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,166 @@
+"""
+Process pool for CPU-heavy solves in Scrabble Word Solver.
+
+Each pool process maps the compiled dictionary artifacts (see lexicon_file)
+it is asked to search rather than loading copies of its own, so each index
+is held once in the OS page cache however many processes search it. Heavy racks are sent to the
+pool, where they run in parallel and leave the web worker's threads free for
+short requests; light racks are solved in the calling thread, since a round
+trip to another process would cost more than their search. A search budget
+goes along with each heavy rack, so pooled searches stop at the same deadline.
+"""
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from lexicon_file import MappedLexicon
+from scrabble_solver import BLANK, DEFAULT_ENGINE, SearchBudget, best_words, find_words_batch, word_signature
+from utils.results import from_columns, to_columns
+
+# Racks whose weight reaches this are solved in the pool: each tile weighs one
+# and each blank BLANK_WEIGHT, as a blank multiplies the work of the search
+HEAVY_RACK_WEIGHT = 10
+BLANK_WEIGHT = 3
+
+# Lexicons each pool process keeps mapped
+WORKER_LEXICONS = 4
+
+
+class _StaleArtifact(Exception):
+    """The artifact at a path was replaced and no longer holds the version a solve was sent for."""
+
+
+@lru_cache(maxsize=WORKER_LEXICONS)
+def _mapped(artifact_path: str, version: str) -> MappedLexicon:
+    # The version is part of the key so a recompiled artifact is mapped afresh.
+    # A reload may have renamed a newer artifact over the path since the solve
+    # was sent; mapping that would answer (and cache) it from the wrong words.
+    # Raising leaves nothing cached, so the check runs again next time.
+    lexicon = MappedLexicon(artifact_path)
+    if lexicon.version != version:
+        raise _StaleArtifact(f'{artifact_path} holds version {lexicon.version}, not {version}')
+    return lexicon
+
+
+def _budget_limits(budget: Optional[SearchBudget]) -> Optional[tuple]:
+    # Monotonic clocks are per process, so the deadline travels as a wall-clock
+    # time; time spent queued for a pool process counts against it
+    if budget is None:
+        return None
+    remaining = budget.remaining()
+    return (None if remaining is None else time.time() + remaining), budget.max_words
+
+
+def _worker_budget(limits: Optional[tuple]) -> Optional[SearchBudget]:
+    if limits is None:
+        return None
+    deadline, max_words = limits
+    return SearchBudget(None if deadline is None else deadline - time.time(), max_words)
+
+
+# Results travel back as parallel arrays, which pickle far faster than one
+# object per word, along with the reason the search was cut short (if it was)
+
+def _find_words(artifact: Tuple[str, str], letters: str, engine: str, filters: Optional[Dict[str, Any]],
+                limits: Optional[tuple] = None) -> Tuple[Dict[str, List[Any]], Optional[str]]:
+    budget = _worker_budget(limits)
+    results = find_words_batch([letters], _mapped(*artifact), engine, filters, budget)[0]
+    return to_columns(results), budget.reason if budget else None
+
+
+def _best_words(artifact: Tuple[str, str], letters: str, n: int, filters: Optional[Dict[str, Any]],
+                limits: Optional[tuple] = None) -> Tuple[Dict[str, List[Any]], Optional[str]]:
+    budget = _worker_budget(limits)
+    results = best_words(letters, _mapped(*artifact), n, filters, budget)
+    return to_columns(results), budget.reason if budget else None
+
+
+def rack_weight(letters: str) -> int:
+    """Rough cost of solving a rack, in tiles (see HEAVY_RACK_WEIGHT)."""
+    blanks = letters.count(BLANK)
+    return len(letters) - blanks + BLANK_WEIGHT * blanks
+
+
+class SolverPool:
+    """
+    Solver processes sharing memory-mapped dictionaries.
+
+    find_words_batch and best_words take the same arguments as their
+    scrabble_solver counterparts and return the same results. The
+    dictionary passed in must be a MappedLexicon: light racks are searched
+    in it directly, and heavy ones in the pool's mapping of its artifact.
+    """
+
+    def __init__(self, processes: int, heavy_weight: int = HEAVY_RACK_WEIGHT):
+        """
+        Args:
+            processes: Number of solver processes
+            heavy_weight: Rack weight from which solves go to the pool
+        """
+        self.processes = processes
+        self.heavy_weight = heavy_weight
+        # Spawned rather than forked: the web worker may already be running threads
+        self._executor = ProcessPoolExecutor(processes, mp_context=multiprocessing.get_context('spawn'))
+
+    def is_heavy(self, letters: str) -> bool:
+        """True if the rack is worth solving in the pool."""
+        return rack_weight(letters) >= self.heavy_weight
+
+    def find_words_batch(self, racks: List[str], dictionary, engine: str = DEFAULT_ENGINE,
+                         filters: Optional[Dict[str, Any]] = None,
+                         budget: Optional[SearchBudget] = None) -> List[List[Any]]:
+        """
+        Solve many racks (see scrabble_solver.find_words_batch), heavy ones in the pool.
+
+        Each distinct heavy rack is its own task, so they are solved in
+        parallel while the light racks are solved here as one batch.
+
+        Returns:
+            One result list per rack, in input order; anagram racks share a list
+        """
+        futures = {}
+        light = []
+        limits = _budget_limits(budget)
+        for letters in racks:
+            key = word_signature(letters)
+            if not self.is_heavy(letters):
+                light.append(letters)
+            elif key not in futures:
+                futures[key] = letters, self._executor.submit(_find_words, (dictionary.path, dictionary.version),
+                                                              letters, engine, filters, limits)
+
+        solved = {word_signature(letters): results
+                  for letters, results in zip(light, find_words_batch(light, dictionary, engine, filters, budget))}
+        for key, (letters, future) in futures.items():
+            try:
+                columns, reason = future.result()
+            except _StaleArtifact:
+                # The dictionary's own mapping still holds the version asked for
+                solved[key] = find_words_batch([letters], dictionary, engine, filters, budget)[0]
+                continue
+            solved[key] = from_columns(columns)
+            if reason:
+                budget.cut(letters, reason)
+        return [solved[word_signature(letters)] for letters in racks]
+
+    def best_words(self, letters: str, dictionary, n: int = 10, filters: Optional[Dict[str, Any]] = None,
+                   budget: Optional[SearchBudget] = None) -> List[Any]:
+        """Find the n best words for a rack (see scrabble_solver.best_words), in the pool if heavy."""
+        if self.is_heavy(letters):
+            future = self._executor.submit(_best_words, (dictionary.path, dictionary.version), letters, n, filters,
+                                           _budget_limits(budget))
+            try:
+                columns, reason = future.result()
+            except _StaleArtifact:
+                return best_words(letters, dictionary, n, filters, budget)
+            if reason:
+                budget.cut(letters, reason)
+            return from_columns(columns)
+        return best_words(letters, dictionary, n, filters, budget)
+
+    def shutdown(self) -> None:
+        """Stop the solver processes, dropping queued solves."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -93,7 +93,7 @@ document.addEventListener('DOMContentLoaded', function() {
     });
 
     function validateInput() {
-        const letters = lettersInput.value.toLowerCase().replace(/[^a-z]/g, '');
+        const letters = lettersInput.value.toLowerCase().replace(/[^a-z?]/g, '');
         lettersInput.value = letters;
         
         if (letters.length > 15) {
@@ -322,7 +322,7 @@ document.addEventListener('DOMContentLoaded', function() {
                 <span class="badge bg-secondary me-3">#${rank}</span>
                 <div>
                     <div class="word-text">${wordData.word.toUpperCase()}</div>
-                    <div class="word-length">${wordData.length} letter${wordData.length !== 1 ? 's' : ''}</div>
+                    <div class="word-length">${wordData.length} letter${wordData.length !== 1 ? 's' : ''}${wordData.blanks ? ` &middot; blanks: ${wordData.blanks.toUpperCase()}` : ''}</div>
                 </div>
             </div>
             <div class="d-flex align-items-center">
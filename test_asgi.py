@@ -0,0 +1,174 @@
+"""
+Unit tests for the ASGI entry point of Scrabble Word Solver.
+"""
+
+import asyncio
+import json
+import unittest
+import app as wsgi
+import asgi
+
+
+def call(method, path, body=b''):
+    """Run one request through the ASGI app; returns (status, headers, body)."""
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {'type': 'http', 'method': method, 'path': path}
+    asyncio.run(asgi.app(scope, receive, send))
+    start = messages[0]
+    return start['status'], dict(start['headers']), b''.join(message.get('body', b'') for message in messages[1:])
+
+
+class TestAsgi(unittest.TestCase):
+
+    def post_solve(self, data):
+        return call('POST', '/solve', json.dumps(data).encode())
+
+    def test_solve_matches_flask(self):
+        """Test that /solve answers as the Flask route does."""
+        client = wsgi.app.test_client()
+        for data in ({'letters': 'cat?'}, {'letters': 'stare', 'view_type': 'flat', 'limit': 5},
+                     {'letters': 'stare', 'mode': 'best', 'format': 'columnar'}, {'letters': '123'},
+                     {'letters': 'cat', 'engine': 'unknown'}):
+            status, headers, body = self.post_solve(data)
+            expected = client.post('/solve', json=data)
+            self.assertEqual(status, expected.status_code)
+            self.assertEqual(headers[b'content-type'], b'application/json')
+            self.assertEqual(json.loads(body), expected.get_json())
+
+    def test_solve_stream(self):
+        """Test that streamed solves arrive as NDJSON."""
+        status, headers, body = self.post_solve({'letters': 'stare', 'stream': True, 'view_type': 'flat'})
+        self.assertEqual(status, 200)
+        self.assertEqual(headers[b'content-type'], b'application/x-ndjson')
+        records = [json.loads(line) for line in body.decode().splitlines()]
+        self.assertEqual(records[0]['type'], 'meta')
+        self.assertEqual(records[-1], {'type': 'end', 'total_words': len(records) - 2, 'truncated': False})
+
+    def test_solve_budget(self):
+        """Test time and word limits, and the truncated flag they set."""
+        status, _, body = self.post_solve({'letters': 'stare', 'view_type': 'flat'})
+        self.assertEqual((status, json.loads(body)['truncated']), (200, False))
+        
+        status, _, body = self.post_solve({'letters': 'stare??', 'view_type': 'flat', 'max_words': 1})
+        payload = json.loads(body)
+        self.assertEqual((payload['truncated'], payload['truncated_reason']), (True, 'word_limit'))
+        
+        # Cached or freshly searched, each rack gets at most max_words words
+        for data in ({'letters': 'aeinrst??', 'view_type': 'flat'}, {'letters': 'aeinrst??', 'mode': 'best', 'view_type': 'flat'},
+                     {'letters': 'stare', 'view_type': 'flat'}):
+            for _ in range(2):
+                payload = json.loads(self.post_solve({**data, 'max_words': 5})[2])
+                self.assertLessEqual(len(payload['words']), 5)
+                self.assertEqual(payload['total_words'], len(payload['words']))
+                self.assertEqual(payload['truncated_reason'], 'word_limit')
+        records = self.post_solve({'letters': 'stare', 'stream': True, 'view_type': 'flat', 'max_words': 5})[2]
+        records = [json.loads(line) for line in records.decode().splitlines()]
+        self.assertEqual(records[-1]['total_words'], 5)
+        self.assertEqual(records[-1]['truncated_reason'], 'word_limit')
+        
+        for time_limit in (0, -1, True, '1'):
+            self.assertEqual(self.post_solve({'letters': 'stare', 'time_limit': time_limit})[0], 400)
+        self.assertEqual(self.post_solve({'letters': 'stare', 'max_words': 1.5})[0], 400)
+        
+        limits = dict(wsgi.TIME_LIMITS)
+        wsgi.TIME_LIMITS['solve'] = 1e-9
+        try:
+            status, _, body = self.post_solve({'letters': 'ropes??', 'stream': True, 'view_type': 'flat'})
+        finally:
+            wsgi.TIME_LIMITS.update(limits)
+        end = json.loads(body.decode().splitlines()[-1])
+        self.assertEqual((end['truncated'], end['truncated_reason']), (True, 'time_limit'))
+    
+    def test_solve_non_ascii_letters(self):
+        """Test that letters outside a-z are dropped from the rack."""
+        for data in ({'letters': 't\xe9n'}, {'letters': 't\xe9n', 'mode': 'best'}):
+            status, _, body = self.post_solve(data)
+            self.assertEqual(status, 200)
+            self.assertEqual(json.loads(body)['letters'], 'tn')
+        status, _, body = self.post_solve({'letters': '\xe9\xdf'})
+        self.assertEqual((status, json.loads(body)), (400, {'error': 'No valid letters found'}))
+    
+    def test_invalid_json(self):
+        """Test that a malformed body is rejected."""
+        status, _, body = call('POST', '/solve', b'{')
+        self.assertEqual(status, 400)
+        self.assertEqual(json.loads(body), {'error': 'Invalid JSON'})
+
+    def test_cheap_routes(self):
+        """Test the score, grouping and sorting routes."""
+        status, _, body = call('GET', '/api/score/Quiz')
+        self.assertEqual((status, json.loads(body)), (200, {'word': 'quiz', 'score': 22, 'length': 4}))
+        self.assertEqual(call('GET', '/api/score/qu1z')[0], 400)
+        self.assertIn('options', json.loads(call('GET', '/api/groups')[2]))
+        self.assertIn('within_group_sort', json.loads(call('GET', '/api/sorting')[2]))
+
+    def test_metrics(self):
+        """Test that solves show up in the Prometheus metrics."""
+        before = wsgi.metrics.snapshot()
+        self.post_solve({'letters': 'stare', 'view_type': 'flat'})
+        self.post_solve({'letters': 'stare', 'view_type': 'flat'})
+        status, headers, body = call('GET', '/metrics')
+        self.assertEqual(status, 200)
+        self.assertEqual(headers[b'content-type'], b'text/plain; version=0.0.4; charset=utf-8')
+        self.assertIn('# TYPE scrabble_solve_stage_seconds histogram', body.decode())
+        
+        after = wsgi.metrics.snapshot()
+        def added(sample):
+            return after[sample] - before[sample]
+        for stage in ('sort', 'encode', 'serialize'):
+            self.assertEqual(added(f'scrabble_solve_stage_seconds_count{{stage="{stage}"}}'), 2)
+        self.assertEqual(added('scrabble_solve_stage_seconds_count{stage="group"}'), 0)
+        self.assertIn('group includes sorting the grouped view', body.decode())
+        
+        # The grouped view sorts while grouping, so only 'group' is timed
+        self.post_solve({'letters': 'stare'})
+        grouped = wsgi.metrics.snapshot()
+        for stage, count in (('group', 1), ('sort', 0)):
+            sample = f'scrabble_solve_stage_seconds_count{{stage="{stage}"}}'
+            self.assertEqual(grouped[sample] - after[sample], count)
+        self.assertEqual(added('scrabble_rack_length_bucket{le="5"}'), 2)
+        self.assertEqual(added('scrabble_solve_words_count'), 2)
+        hits = added('scrabble_result_cache_lookups_total{result="hit"}')
+        self.assertEqual(hits + added('scrabble_result_cache_lookups_total{result="miss"}'), 2)
+        self.assertGreaterEqual(hits, 1)
+        self.assertEqual(after['scrabble_lexicon_load_seconds_count{lexicon="default"}'], 1)
+        self.assertEqual(wsgi.app.test_client().get('/metrics').status_code, 200)
+    
+    def test_filtered_solve_looks_up_cache_once(self):
+        """Test that a filtered solve counts one result cache lookup per rack."""
+        for _ in range(2):
+            before = wsgi.result_cache.stats()
+            status, _, _ = self.post_solve({'letters': 'notes', 'filters': {'min_length': 4}})
+            self.assertEqual(status, 200)
+            after = wsgi.result_cache.stats()
+            self.assertEqual(after['hits'] + after['misses'] - before['hits'] - before['misses'], 1)
+        self.assertEqual(after['hits'], before['hits'] + 1)
+    
+    def test_unknown_routes_and_methods(self):
+        """Test 404 and 405 responses."""
+        self.assertEqual(call('GET', '/api/score/')[0], 404)
+        self.assertEqual(call('GET', '/missing')[0], 404)
+        self.assertEqual(call('GET', '/solve')[0], 405)
+        self.assertEqual(call('POST', '/api/groups')[0], 405)
+        self.assertEqual(call('POST', '/metrics')[0], 405)
+
+    def test_too_many_pending_solves(self):
+        """Test that solves past MAX_PENDING_SOLVES are turned away."""
+        asgi._pending_solves = asgi.MAX_PENDING_SOLVES
+        try:
+            status, headers, _ = self.post_solve({'letters': 'cat'})
+        finally:
+            asgi._pending_solves = 0
+        self.assertEqual(status, 503)
+        self.assertEqual(headers[b'retry-after'], b'1')
+
+
+if __name__ == '__main__':
+    unittest.main()
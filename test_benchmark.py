@@ -0,0 +1,58 @@
+"""
+Unit tests for the benchmark harness in Scrabble Word Solver.
+"""
+
+import unittest
+from benchmark import MOVE_BUDGET_MS, compare, make_rack, measure, over_budget, time_budgets
+
+
+class TestBenchmark(unittest.TestCase):
+    
+    def test_make_rack(self):
+        """Test that racks are reproducible and hold the requested blanks."""
+        rack = make_rack(7, 2)
+        self.assertEqual(len(rack), 7)
+        self.assertEqual(rack.count('?'), 2)
+        self.assertEqual(rack, make_rack(7, 2))
+        self.assertNotEqual(make_rack(7, 0, seed=1), make_rack(7, 0, seed=2))
+    
+    def test_measure(self):
+        """Test the recorded measurements."""
+        result = measure(lambda: [0] * 10000, repeat=2)
+        self.assertGreaterEqual(result['median_ms'], result['min_ms'])
+        self.assertGreater(result['peak_kib'], 50)
+    
+    def test_compare(self):
+        """Test regression detection against a baseline."""
+        baseline = {
+            'fast': {'median_ms': 0.1, 'peak_kib': 10.0},
+            'slow': {'median_ms': 100.0, 'peak_kib': 1000.0}
+        }
+        current = {
+            'fast': {'median_ms': 0.5, 'peak_kib': 10.0},     # under the noise floor
+            'slow': {'median_ms': 130.0, 'peak_kib': 2000.0},
+            'new': {'median_ms': 5.0, 'peak_kib': 1.0}        # not in the baseline
+        }
+        regressions = compare(current, baseline, threshold=0.25)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(all(regression.startswith('slow') for regression in regressions))
+        self.assertEqual(compare(current, baseline, threshold=1.5), [])
+    
+    def test_over_budget(self):
+        """Test the absolute time budgets checked alongside the baseline."""
+        budgets = time_budgets()
+        self.assertEqual(len(budgets), 4)
+        self.assertTrue(all(name.startswith('generate_moves/') for name in budgets))
+        self.assertFalse(any('?' in name for name in budgets))
+        name = next(iter(budgets))
+        current = {
+            name: {'median_ms': MOVE_BUDGET_MS + 1, 'peak_kib': 1.0},
+            'generate/anagram/len7/blanks0': {'median_ms': 500.0, 'peak_kib': 1.0}   # no budget
+        }
+        self.assertEqual(len(over_budget(current, budgets)), 1)
+        current[name]['median_ms'] = MOVE_BUDGET_MS - 1
+        self.assertEqual(over_budget(current, budgets), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Unit tests for the game board in Scrabble Word Solver.
+"""
+
+import unittest
+from board import ACROSS, BINGO_BONUS, DOWN, Board, allowed_letters
+from dawg import Dawg
+
+
+class TestBoard(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up test data."""
+        self.dawg = Dawg(['at', 'cat', 'cats', 'tab', 'ta', 'to'])
+        self.board = Board.from_rows([
+            '.....',
+            '..c..',
+            '..at.',
+            '..t..',
+            '.....',
+        ])
+    
+    def test_from_rows_round_trip(self):
+        """Test that a board prints back as its rows."""
+        self.assertEqual(str(self.board).split('\n')[2], '..at.')
+        self.assertEqual(self.board.get(1, 2), 'c')
+        self.assertIsNone(self.board.get(0, 0))
+        self.assertIsNone(self.board.get(-1, 2))
+    
+    def test_from_rows_rejects_ragged_rows(self):
+        """Test that every row must match the board size."""
+        with self.assertRaises(ValueError):
+            Board.from_rows(['...', '..', '...'])
+    
+    def test_empty_board_anchors_centre(self):
+        """Test that the first move must cover the centre square."""
+        self.assertEqual(Board().anchors(), {(7, 7)})
+    
+    def test_anchors(self):
+        """Test that anchors are the empty squares next to a tile."""
+        anchors = self.board.anchors()
+        self.assertIn((0, 2), anchors)
+        self.assertIn((2, 4), anchors)
+        self.assertIn((1, 3), anchors)
+        self.assertNotIn((0, 0), anchors)
+        self.assertNotIn((2, 2), anchors)
+    
+    def test_place(self):
+        """Test placing tiles, including blanks, and rejecting occupied squares."""
+        self.board.place([(4, 2, 's', True)])
+        self.assertEqual(self.board.get(4, 2), 's')
+        self.assertIn((4, 2), self.board.blanks)
+        with self.assertRaises(ValueError):
+            self.board.place([(4, 2, 'x', False)])
+    
+    def test_transposed(self):
+        """Test that transposing swaps rows and columns, blanks included."""
+        self.board.blanks.add((2, 3))
+        transposed = self.board.transposed()
+        self.assertEqual(transposed.get(2, 1), 'c')
+        self.assertEqual(transposed.get(3, 2), 't')
+        self.assertEqual(transposed.blanks, {(3, 2)})
+    
+    def test_standard_premiums(self):
+        """Test that a 15x15 board gets the standard premium squares."""
+        board = Board()
+        self.assertEqual(board.word_multipliers[0][0], 3)
+        self.assertEqual(board.word_multipliers[7][7], 2)
+        self.assertEqual(board.letter_multipliers[1][5], 3)
+        self.assertEqual(board.letter_multipliers[0][3], 2)
+        self.assertEqual(board.word_multipliers[0][1], 1)
+        self.assertEqual(self.board.word_multipliers[2][2], 1)
+    
+    def test_cross_scores(self):
+        """Test the face value of the perpendicular tiles next to empty squares."""
+        across = self.board.cross_scores[ACROSS]
+        self.assertEqual(across[4][2], 5)     # below c-a-t
+        self.assertEqual(across[1][3], 1)     # above the t of "at"
+        self.assertIsNone(across[2][4])       # nothing above or below
+        self.assertIsNone(across[2][2])       # occupied
+        self.assertEqual(self.board.cross_scores[DOWN][2][4], 2)  # right of "at"
+    
+    def test_place_updates_cross_scores_incrementally(self):
+        """Test that placing tiles gives the same cross-scores as rebuilding the board."""
+        self.board.place([(4, 2, 's', False), (4, 3, 'o', True)])
+        self.board.place([(0, 3, 'z', False)])
+        rebuilt = Board.from_rows(str(self.board).split('\n'), self.board.blanks)
+        self.assertEqual(self.board.cross_scores, rebuilt.cross_scores)
+        self.assertEqual(self.board.cross_scores[DOWN][4][4], 1)  # after s and a blank o
+    
+    def test_score_play(self):
+        """Test premiums under new tiles, cross-words and the bingo bonus."""
+        board = Board()
+        cat = [(7, 6, 'c', False), (7, 7, 'a', False), (7, 8, 't', False)]
+        # The opening move covers the centre double-word square
+        self.assertEqual(board.score_play(cat, ACROSS), 10)
+        board.place(cat)
+        
+        # Premiums under tiles already on the board no longer count
+        self.assertEqual(board.score_play([(7, 9, 's', False)], ACROSS), 6)
+        # A blank scores nothing, even on a double-letter square
+        self.assertEqual(board.score_play([(8, 6, 'h', True)], DOWN), 3)
+        # "tact" down through the t, with both new a and c on double-letter squares
+        tact = [(5, 8, 't', False), (6, 8, 'a', False), (8, 8, 'c', False)]
+        self.assertEqual(board.score_play(tact, DOWN), 1 + 2 + 1 + 6)
+        # A parallel play scores its main word and each cross-word: "ta", "at", "ta"
+        ta = [(8, 7, 't', False), (8, 8, 'a', False)]
+        self.assertEqual(board.score_play(ta, ACROSS), 3 + 2 + 3)
+    
+    def test_score_play_bingo(self):
+        """Test the bonus for playing all seven tiles."""
+        retains = [(7, 4 + index, letter, False) for index, letter in enumerate('retains')]
+        self.assertEqual(Board().score_play(retains, ACROSS), 7 * 2 + BINGO_BONUS)
+        self.assertEqual(Board().score_play(retains[:6], ACROSS), 6 * 2)
+    
+    def test_cross_checks(self):
+        """Test that squares with vertical neighbours only allow valid words."""
+        checks = self.board.cross_checks(self.dawg)
+        # Below 'cat' only 's' makes a word; above it nothing does
+        self.assertEqual(checks[(4, 2)], frozenset('s'))
+        self.assertEqual(checks[(0, 2)], frozenset())
+        # Above the 't' of 'at': ?t -> 'at'
+        self.assertEqual(checks[(1, 3)], frozenset('a'))
+        self.assertNotIn((2, 4), checks)
+    
+    def test_allowed_letters(self):
+        """Test letters completing a word around a gap."""
+        self.assertEqual(allowed_letters(self.dawg, 'c', 't'), frozenset('a'))
+        self.assertEqual(allowed_letters(self.dawg, 't', ''), frozenset('ao'))
+        self.assertEqual(allowed_letters(self.dawg, 'x', ''), frozenset())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Unit tests for result caching in Scrabble Word Solver.
+"""
+
+import unittest
+from unittest import mock
+from utils.cache import ResultCache, estimate_size, rack_cache_key
+
+
+class TestCache(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up test data."""
+        self.results = [
+            {'word': 'aster', 'score': 5, 'length': 5, 'blanks': ''},
+            {'word': 'star', 'score': 4, 'length': 4, 'blanks': ''}
+        ]
+    
+    def test_rack_cache_key(self):
+        """Test that anagram racks share a key within a dictionary version."""
+        self.assertEqual(rack_cache_key('aetrs', 'v1'), rack_cache_key('stare', 'v1'))
+        self.assertNotEqual(rack_cache_key('aetrs', 'v1'), rack_cache_key('aetrs', 'v2'))
+        self.assertNotEqual(rack_cache_key('aetrs', 'v1'), rack_cache_key('aetr?', 'v1'))
+    
+    def test_rack_cache_key_filters(self):
+        """Test that filtered searches get their own key, ignoring unset filters."""
+        filtered = rack_cache_key('aetrs', 'v1', {'min_length': 4, 'starts_with': 's'})
+        self.assertNotEqual(filtered, rack_cache_key('aetrs', 'v1'))
+        self.assertEqual(filtered, rack_cache_key('stare', 'v1', {'starts_with': 's', 'min_length': '4'}))
+        self.assertEqual(rack_cache_key('aetrs', 'v1', {'min_length': None, 'ends_with': ''}),
+                         rack_cache_key('aetrs', 'v1'))
+    
+    def test_estimate_size(self):
+        """Test size estimation grows with the result list."""
+        small = estimate_size(self.results)
+        large = estimate_size(self.results * 100)
+        self.assertGreater(small, 0)
+        self.assertGreater(large, small * 50)
+        self.assertGreater(estimate_size([]), 0)
+    
+    def test_get_and_put(self):
+        """Test hits and misses."""
+        cache = ResultCache()
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', self.results)
+        self.assertIs(cache.get('a'), self.results)
+        
+        stats = cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['entries'], 1)
+        self.assertEqual(stats['hit_rate'], 0.5)
+    
+    def test_get_first(self):
+        """Test that trying several keys counts one hit or miss."""
+        cache = ResultCache()
+        cache.put('b', self.results)
+        self.assertEqual(cache.get_first(['a', 'b']), ('b', self.results))
+        self.assertEqual(cache.get_first(['a', 'c']), (None, None))
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+    
+    def test_lru_eviction_by_count(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResultCache(max_entries=2)
+        cache.put('a', self.results)
+        cache.put('b', self.results)
+        cache.get('a')
+        cache.put('c', self.results)
+        
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('c'))
+        self.assertEqual(cache.stats()['evictions'], 1)
+    
+    def test_eviction_by_memory(self):
+        """Test that the byte budget is enforced."""
+        cache = ResultCache(max_bytes=250)
+        cache.put('a', self.results, size=100)
+        cache.put('b', self.results, size=100)
+        cache.put('c', self.results, size=100)
+        
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats()['bytes'], 200)
+        self.assertIsNone(cache.get('a'))
+        
+        # Oversized values are not cached at all
+        cache.put('d', self.results, size=1000)
+        self.assertIsNone(cache.get('d'))
+        self.assertEqual(len(cache), 2)
+    
+    def test_ttl_expiry(self):
+        """Test that entries expire after the TTL."""
+        cache = ResultCache(ttl=10)
+        with mock.patch('utils.cache.time.monotonic', return_value=100.0):
+            cache.put('a', self.results)
+        with mock.patch('utils.cache.time.monotonic', return_value=105.0):
+            self.assertIsNotNone(cache.get('a'))
+        with mock.patch('utils.cache.time.monotonic', return_value=111.0):
+            self.assertIsNone(cache.get('a'))
+        
+        stats = cache.stats()
+        self.assertEqual(stats['expirations'], 1)
+        self.assertEqual(stats['entries'], 0)
+    
+    def test_clear(self):
+        """Test clearing the cache."""
+        cache = ResultCache()
+        cache.put('a', self.results)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()['bytes'], 0)
+    
+    def test_invalidate_version(self):
+        """Test dropping the entries of one dictionary version."""
+        cache = ResultCache()
+        cache.put(rack_cache_key('stare', 'v1'), self.results)
+        cache.put(rack_cache_key('star', 'v1', {'min_length': 4}), self.results)
+        cache.put(rack_cache_key('stare', 'v2'), self.results)
+        self.assertEqual(cache.invalidate_version('v1'), 2)
+        self.assertIsNone(cache.get(rack_cache_key('stare', 'v1')))
+        self.assertEqual(cache.get(rack_cache_key('stare', 'v2')), self.results)
+        self.assertEqual(cache.stats()['bytes'], estimate_size(self.results))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Unit tests for the word graph in Scrabble Word Solver.
+"""
+
+import unittest
+from dawg import CompactDawg, Dawg, letter_bit, subtree_bounds
+
+
+class WordBudget:
+    """Search budget that runs out once a number of words are found."""
+    
+    def __init__(self, words):
+        self.words = words
+    
+    def exhausted(self, found):
+        return found >= self.words
+
+
+class TestDawg(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up test data."""
+        self.words = ['cat', 'cats', 'bat', 'bats', 'tab', 'tabs', 'at']
+        self.dawg = Dawg(self.words)
+    
+    def test_contains(self):
+        """Test membership lookups."""
+        for word in self.words:
+            self.assertIn(word, self.dawg)
+        self.assertNotIn('ca', self.dawg)
+        self.assertNotIn('catss', self.dawg)
+        self.assertNotIn('', self.dawg)
+    
+    def test_has_prefix(self):
+        """Test prefix lookups."""
+        self.assertTrue(self.dawg.has_prefix('ca'))
+        self.assertTrue(self.dawg.has_prefix(''))
+        self.assertFalse(self.dawg.has_prefix('x'))
+    
+    def test_suffixes_are_shared(self):
+        """Test that equivalent suffix states are merged."""
+        # cat/bat share the 'at'/'ats' tail, so the graph is far smaller than the trie
+        self.assertIs(self.dawg.root.children['c'].children['a'],
+                      self.dawg.root.children['b'].children['a'])
+        self.assertLess(self.dawg.node_count, 12)
+    
+    def test_words_from_rack(self):
+        """Test rack search with prefix pruning."""
+        result = self.dawg.words_from_rack('tacb')
+        self.assertEqual(sorted(result), ['at', 'bat', 'cat', 'tab'])
+    
+    def test_words_from_rack_respects_letter_counts(self):
+        """Test that each rack tile is used at most once."""
+        dawg = Dawg(['bee', 'be', 'ebb'])
+        self.assertEqual(sorted(dawg.words_from_rack('bbe')), ['be', 'ebb'])
+    
+    def test_search_rack_with_blanks(self):
+        """Test that blanks stand in for missing letters only."""
+        result = {word: blanks for word, blanks, _ in self.dawg.search_rack('at', blanks=1)}
+        self.assertEqual(result, {'at': '', 'bat': 'b', 'cat': 'c', 'tab': 'b'})
+        
+        result = {word: blanks for word, blanks, _ in self.dawg.search_rack('', blanks=2)}
+        self.assertEqual(result, {'at': 'at'})
+    
+    def test_search_rack_scores(self):
+        """Test that scores are summed along the walk, skipping blanks."""
+        values = {'a': 1, 'b': 3, 'c': 3, 't': 1}
+        result = {word: score for word, _, score in self.dawg.search_rack('at', 1, values)}
+        self.assertEqual(result, {'at': 2, 'bat': 2, 'cat': 2, 'tab': 2})
+        
+        result = {word: score for word, _, score in self.dawg.search_rack('bats', 0, values)}
+        self.assertEqual(result['bats'], 5)
+    
+    def test_search_rack_limits(self):
+        """Test that the search can be held to a first letter and a maximum length."""
+        result = sorted(word for word, _, _ in self.dawg.search_rack('tabcs', first_letter='b'))
+        self.assertEqual(result, ['bat', 'bats'])
+        
+        result = sorted(word for word, _, _ in self.dawg.search_rack('tabcs', max_length=3))
+        self.assertEqual(result, ['at', 'bat', 'cat', 'tab'])
+        
+        result = {word: blanks for word, blanks, _ in self.dawg.search_rack('at', 1, first_letter='c')}
+        self.assertEqual(result, {'cat': 'c'})
+    
+    def test_search_rack_budget(self):
+        """Test that a search stops once its budget runs out, keeping what it found."""
+        full = self.dawg.search_rack('tabcs', 1)
+        for graph in (self.dawg, CompactDawg.from_dawg(self.dawg)):
+            self.assertEqual(graph.search_rack('tabcs', 1, budget=WordBudget(0)), [])
+            found = graph.search_rack('tabcs', 1, budget=WordBudget(1))
+            self.assertTrue(found)
+            self.assertLess(len(found), len(full))
+            self.assertTrue(set(found) <= set(full))
+            self.assertEqual(sorted(graph.search_rack('tabcs', 1, budget=WordBudget(100))), sorted(full))
+    
+    def test_subtree_bounds(self):
+        """Test per-node heights and reachable letters, on both graph encodings."""
+        for graph in (self.dawg, CompactDawg.from_dawg(self.dawg)):
+            heights, masks = subtree_bounds(graph)
+            self.assertEqual(heights[graph.root], 4)
+            self.assertEqual(masks[graph.root], sum(letter_bit(letter) for letter in 'abcst'))
+            node = graph.child(graph.child(graph.root, 'c'), 'a')
+            self.assertEqual((heights[node], masks[node]), (2, letter_bit('t') | letter_bit('s')))
+            node = graph.child(graph.child(node, 't'), 's')
+            self.assertEqual((heights[node], masks[node]), (0, 0))
+        self.assertEqual(len(subtree_bounds(CompactDawg.from_dawg(self.dawg))[0]), self.dawg.node_count)
+    
+    def test_letters_outside_a_z(self):
+        """Test that characters sharing a letter's low bits do not follow its edge."""
+        compact = CompactDawg.from_dawg(self.dawg)
+        self.assertEqual(letter_bit('\xe3'), 0)
+        for letter in ('C', '\xe3', '#'):  # 'c' masked to five bits
+            self.assertIsNone(compact.child(compact.root, letter))
+            self.assertEqual(compact.search_rack('at', blanks=1, first_letter=letter), [])
+        self.assertNotIn('CAT', compact)
+        self.assertEqual(compact.words_from_rack('t\xe3a'), ['at'])
+    
+    def test_empty(self):
+        """Test an empty word list."""
+        dawg = Dawg([])
+        self.assertEqual(dawg.words_from_rack('abc'), [])
+        self.assertNotIn('a', dawg)
+
+
+if __name__ == '__main__':
+    unittest.main()
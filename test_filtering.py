@@ -7,7 +7,9 @@ from utils.filtering import (
     filter_words_by_length,
     filter_words_by_first_letter,
     filter_words_by_last_letter,
+    filter_words_by_pattern,
     apply_filters,
+    iter_filters,
     validate_filters,
     get_filter_summary
 )
@@ -179,6 +181,21 @@ class TestFiltering(unittest.TestCase):
         # Should return all words
         self.assertEqual(len(filtered), len(self.sample_words))
     
+    def test_iter_filters_matches_apply_filters(self):
+        """Test that lazy filtering keeps the same words as apply_filters."""
+        filter_sets = [
+            {},
+            {'min_length': 4},
+            {'max_length': 3, 'ends_with': 'O'},
+            {'min_length': 3, 'max_length': 5, 'starts_with': 'a'}
+        ]
+        for filters in filter_sets:
+            lazy = iter_filters(iter(self.sample_words), filters)
+            self.assertNotIsInstance(lazy, list)
+            self.assertEqual(list(lazy), apply_filters(self.sample_words, filters))
+        
+        self.assertEqual(list(iter_filters(self.sample_words, None)), self.sample_words)
+    
     def test_validate_filters_valid(self):
         """Test validating valid filters."""
         filters = {
@@ -232,6 +249,30 @@ class TestFiltering(unittest.TestCase):
         # Should have error for ends_with
         self.assertIn('ends_with', errors)
     
+    def test_filter_words_by_pattern(self):
+        """Test filtering words by a crossword-style pattern."""
+        words = [word['word'] for word in filter_words_by_pattern(self.sample_words, '?O?')]
+        self.assertEqual(words, ['dog', 'zoo'])
+        
+        words = [word['word'] for word in filter_words_by_pattern(self.sample_words, 'A*')]
+        self.assertEqual(words, ['a', 'apple'])
+        
+        words = [word['word'] for word in filter_words_by_pattern(self.sample_words, '*a*a*')]
+        self.assertEqual(words, ['banana'])
+    
+    def test_pattern_filter_in_apply_and_iter_filters(self):
+        """Test that the pattern filter is applied the same way eagerly and lazily."""
+        filters = {'pattern': '*o*', 'max_length': 3}
+        expected = [word['word'] for word in apply_filters(self.sample_words, filters)]
+        
+        self.assertEqual(expected, ['dog', 'zoo'])
+        self.assertEqual([word['word'] for word in iter_filters(self.sample_words, filters)], expected)
+    
+    def test_validate_filters_invalid_pattern(self):
+        """Test validating a pattern with unsupported characters."""
+        self.assertIn('pattern', validate_filters({'pattern': 'a.b'}))
+        self.assertNotIn('pattern', validate_filters({'pattern': '?a*E'}))
+    
     def test_validate_filters_no_filters(self):
         """Test validating no filters."""
         errors = validate_filters(None)
@@ -264,6 +305,12 @@ class TestFiltering(unittest.TestCase):
         self.assertIn("starts with: 'A'", summary)
         self.assertIn("ends with: 'E'", summary)
     
+    def test_get_filter_summary_pattern(self):
+        """Test getting filter summary with a pattern filter."""
+        summary = get_filter_summary({'pattern': 's*ing'})
+        
+        self.assertIn("pattern: 'S*ING'", summary)
+    
     def test_get_filter_summary_combined(self):
         """Test getting filter summary with combined filters."""
         filters = {
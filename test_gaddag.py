@@ -0,0 +1,101 @@
+"""
+Unit tests for the GADDAG word graph in Scrabble Word Solver.
+"""
+
+import unittest
+from dawg import Dawg
+from test_dawg import WordBudget
+from gaddag import SEPARATOR, Gaddag, gaddag_paths
+
+
+class TestGaddag(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up test data."""
+        self.words = ['cat', 'cats', 'bat', 'bats', 'tab', 'tabs', 'at']
+        self.gaddag = Gaddag.from_words(self.words)
+    
+    def test_paths(self):
+        """Test that each word is stored once per split point."""
+        self.assertEqual(gaddag_paths(['cat']), sorted([
+            'c' + SEPARATOR + 'at', 'ac' + SEPARATOR + 't', 'tac' + SEPARATOR
+        ]))
+        self.assertEqual(gaddag_paths(['cat'], 'a'), ['ac' + SEPARATOR + 't'])
+    
+    def test_contains(self):
+        """Test membership lookups."""
+        for word in self.words:
+            self.assertIn(word, self.gaddag)
+        self.assertNotIn('ca', self.gaddag)
+        self.assertNotIn('tabss', self.gaddag)
+        self.assertNotIn('', self.gaddag)
+    
+    def test_has_prefix(self):
+        """Test prefix lookups."""
+        self.assertTrue(self.gaddag.has_prefix('ca'))
+        self.assertTrue(self.gaddag.has_prefix(''))
+        self.assertFalse(self.gaddag.has_prefix('ta' + 'x'))
+    
+    def test_reads_outward_from_any_letter(self):
+        """Test walking left from a middle letter, then right after the separator."""
+        # "bats" split after "ba": read "ab" leftwards, then "t", "s" rightwards
+        node = self.gaddag.root
+        for letter in 'ab' + SEPARATOR + 't':
+            node = self.gaddag.child(node, letter)
+        self.assertTrue(self.gaddag.is_terminal(node))
+        self.assertTrue(self.gaddag.is_terminal(self.gaddag.child(node, 's')))
+        self.assertIsNone(self.gaddag.child(node, 'x'))
+    
+    def test_suffixes_are_shared(self):
+        """Test that the graph is minimized."""
+        paths = gaddag_paths(self.words)
+        self.assertLess(self.gaddag.node_count, sum(map(len, paths)) // 2)
+    
+    def test_search_rack_matches_dawg(self):
+        """Test that rack searches agree with the DAWG, blanks included."""
+        dawg = Dawg(self.words)
+        values = {'a': 1, 'b': 3, 'c': 3, 's': 1, 't': 1}
+        for letters, blanks in (('tacb', 0), ('at', 1), ('', 2), ('stab', 1)):
+            self.assertEqual(
+                sorted((word, ''.join(sorted(blank)), score)
+                       for word, blank, score in self.gaddag.search_rack(letters, blanks, values)),
+                sorted((word, ''.join(sorted(blank)), score)
+                       for word, blank, score in dawg.search_rack(letters, blanks, values))
+            )
+    
+    def test_search_rack_limits(self):
+        """Test fixing the first or last letter and capping the length."""
+        values = {'a': 1, 'b': 3, 'c': 3, 's': 1, 't': 1}
+        found = self.gaddag.search_rack('tabcs', 0, values, first_letter='b')
+        self.assertEqual(sorted(found), [('bat', '', 5), ('bats', '', 6)])
+        
+        found = self.gaddag.search_rack('tabs', 1, values, first_letter='c')
+        self.assertEqual(sorted(found), [('cat', 'c', 2), ('cats', 'c', 3)])
+        
+        found = self.gaddag.search_rack('tabcs', 0, values, last_letter='s')
+        self.assertEqual(sorted(word for word, _, _ in found), ['bats', 'cats', 'tabs'])
+        
+        found = self.gaddag.search_rack('tabcs', 0, values, max_length=2)
+        self.assertEqual([word for word, _, _ in found], ['at'])
+    
+    def test_search_rack_budget(self):
+        """Test that a search stops once its budget runs out, with either letter fixed."""
+        for limits in ({}, {'first_letter': 'b'}, {'last_letter': 's'}):
+            full = self.gaddag.search_rack('tabcs', 1, **limits)
+            self.assertEqual(self.gaddag.search_rack('tabcs', 1, budget=WordBudget(0), **limits), [])
+            found = self.gaddag.search_rack('tabcs', 1, budget=WordBudget(1), **limits)
+            self.assertTrue(found)
+            self.assertTrue(set(found) <= set(full))
+            self.assertEqual(sorted(self.gaddag.search_rack('tabcs', 1, budget=WordBudget(100), **limits)),
+                             sorted(full))
+    
+    def test_allowed_letters(self):
+        """Test cross-check letters read from the split at the gap."""
+        self.assertEqual(self.gaddag.allowed_letters('c', 't'), frozenset('a'))
+        self.assertEqual(self.gaddag.allowed_letters('', 'at'), frozenset('bc'))
+        self.assertEqual(self.gaddag.allowed_letters('ta', ''), frozenset('b'))
+        self.assertEqual(self.gaddag.allowed_letters('x', ''), frozenset())
+
+
+if __name__ == '__main__':
+    unittest.main()
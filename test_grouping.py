@@ -9,8 +9,11 @@ from utils.grouping import (
     group_by_first_letter, 
     group_by_last_letter,
     group_words,
+    group_and_sort,
+    iter_groups,
     get_available_grouping_options
 )
+from utils.sorting import apply_sorting
 
 
 class TestGrouping(unittest.TestCase):
@@ -128,6 +131,59 @@ class TestGrouping(unittest.TestCase):
         self.assertEqual(len(groups), 3)
         self.assertEqual(groups[0]['name'], '1 letter')
     
+    def test_group_words_typed_keys(self):
+        """Test that groups carry their typed key and do not copy words."""
+        groups = group_words(self.sample_words, 'length')
+        
+        self.assertEqual([group['key'] for group in groups], [1, 3, 4])
+        self.assertIs(groups[1]['words'][0], self.sample_words[0])
+        
+        groups = group_words(self.sample_words, 'last_letter')
+        self.assertEqual([group['key'] for group in groups], ['a', 'g', 'n', 'o', 'r', 't'])
+    
+    def test_group_and_sort_matches_apply_sorting(self):
+        """Test that the single-pass pipeline matches grouping then sorting."""
+        for group_by in ('length', 'first_letter', 'last_letter', 'invalid_type'):
+            for group_sort_order in ('asc', 'desc'):
+                for sort_by in ('score', 'alphabetical'):
+                    expected = apply_sorting(group_words(self.sample_words, group_by), group_sort_order, sort_by)
+                    self.assertEqual(group_and_sort(self.sample_words, group_by, group_sort_order, sort_by),
+                                     expected)
+    
+    def test_group_and_sort(self):
+        """Test group order by key and word order within groups."""
+        groups = group_and_sort(self.sample_words, 'length', 'desc', 'score')
+        
+        self.assertEqual([group['name'] for group in groups], ['4 letters', '3 letters', '1 letter'])
+        self.assertEqual([word['word'] for word in groups[1]['words']], ['zoo', 'cat', 'dog'])
+        self.assertEqual(groups[1]['total_score'], 22)
+        
+        groups = group_and_sort(iter(self.sample_words), 'length', 'asc', 'alphabetical')
+        self.assertEqual([word['word'] for word in groups[2]['words']], ['moon', 'star'])
+        self.assertEqual(group_and_sort([], 'length'), [])
+    
+    def test_iter_groups_ordered(self):
+        """Test that ordered input yields each group as soon as it completes."""
+        words = sorted(self.sample_words, key=lambda word: word['length'])
+        groups = iter_groups(iter(words), 'length', ordered=True)
+        
+        first = next(groups)
+        self.assertEqual(first['name'], '1 letter')
+        self.assertEqual(first['count'], 1)
+        
+        rest = list(groups)
+        self.assertEqual([group['name'] for group in rest], ['3 letters', '4 letters'])
+        self.assertEqual(rest[0]['total_score'], 22)
+        # Words are grouped as-is, not copied
+        self.assertIs(rest[0]['words'][0], words[1])
+    
+    def test_iter_groups_unordered_matches_group_words(self):
+        """Test that unordered input falls back to group_words."""
+        for group_by in ('length', 'first_letter', 'last_letter'):
+            self.assertEqual(list(iter_groups(iter(self.sample_words), group_by)),
+                             group_words(self.sample_words, group_by))
+        self.assertEqual(list(iter_groups([], 'length', ordered=True)), [])
+    
     def test_get_available_grouping_options(self):
         """Test getting available grouping options."""
         options = get_available_grouping_options()
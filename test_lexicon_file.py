@@ -0,0 +1,138 @@
+"""
+Unit tests for the compiled dictionary format in Scrabble Word Solver.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import lexicon_file
+from lexicon_file import (
+    compile_lexicon,
+    compiled_path,
+    gaddag_path,
+    load_compiled_dictionary,
+    load_gaddag,
+    MappedLexicon
+)
+from dawg import CompactDawg, subtree_bounds
+from scrabble_solver import best_words, find_words, load_dictionary
+
+
+class TestLexiconFile(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up a small dictionary file."""
+        self.directory = tempfile.mkdtemp()
+        self.source = os.path.join(self.directory, 'words.txt')
+        self.write_source(['CAT', 'ACT', 'TAB', 'BAT', 'AT', 'TACT', 'ZAX'])
+    
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+    
+    def write_source(self, words):
+        with open(self.source, 'w') as file:
+            file.write('\n'.join(words) + '\n')
+    
+    def test_compiled_path(self):
+        """Test the default artifact location."""
+        self.assertEqual(compiled_path('/data/dictionary.txt'), '/data/dictionary.lexicon')
+    
+    def test_round_trip(self):
+        """Test that the mapped lexicon holds the same words and indexes."""
+        lexicon = MappedLexicon(compile_lexicon(self.source))
+        
+        self.assertEqual(len(lexicon), 7)
+        self.assertEqual(list(lexicon), sorted(load_dictionary(self.source)))
+        self.assertIn('tact', lexicon)
+        self.assertNotIn('ta', lexicon)
+        self.assertNotIn('tacts', lexicon)
+        self.assertEqual(lexicon.anagrams('act'), ['act', 'cat'])
+        self.assertEqual(list(lexicon.anagram_index.get('act')), [0, 3])
+        self.assertEqual(list(lexicon.scores), [5, 2, 5, 5, 5, 6, 19])
+        self.assertEqual(list(lexicon.lengths), [3, 2, 3, 3, 3, 4, 3])
+        self.assertIsNone(lexicon.anagram_index.get('xyz'))
+        self.assertEqual(lexicon.max_word_length, 4)
+        self.assertIn('zax', lexicon.dawg)
+        self.assertIn('act', lexicon.signature_dawg)
+        text = load_dictionary(self.source)
+        self.assertEqual([list(bounds) for bounds in lexicon.signature_bounds],
+                         [list(bounds) for bounds in subtree_bounds(CompactDawg.from_dawg(text.signature_dawg))])
+    
+    def test_find_words_matches_text_dictionary(self):
+        """Test that both engines give identical results on the mapped lexicon."""
+        mapped = MappedLexicon(compile_lexicon(self.source))
+        text = load_dictionary(self.source)
+        
+        for letters in ('tacb', 'at?', 'xz?a', 'tact??'):
+            for engine in ('anagram', 'trie', 'gaddag'):
+                self.assertEqual(find_words(letters, mapped, engine),
+                                 find_words(letters, text, engine))
+            self.assertEqual(best_words(letters, mapped, 3), best_words(letters, text, 3))
+    
+    def test_non_ascii_letters(self):
+        """Test that letters outside a-z find nothing instead of failing the lookup."""
+        mapped = MappedLexicon(compile_lexicon(self.source))
+        text = load_dictionary(self.source)
+        self.assertIsNone(mapped.anagram_index.get('\xe9t'))
+        self.assertNotIn('caf\xe9', mapped)
+        for letters in ('t\xe9a', 'ca\xe9t', 't\xe3a'):
+            for engine in ('anagram', 'trie', 'gaddag'):
+                self.assertEqual(find_words(letters, mapped, engine), find_words(letters, text, engine))
+            self.assertEqual(best_words(letters, mapped, 3), best_words(letters, text, 3))
+    
+    @unittest.skipUnless(os.name == 'posix', 'requires POSIX file modes')
+    def test_artifact_mode(self):
+        """Test that artifacts get the umask's mode, not mkstemp's owner-only one."""
+        lexicon = MappedLexicon(compile_lexicon(self.source))
+        lexicon.gaddag
+        for path in (lexicon.path, gaddag_path(lexicon.path)):
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o666 & ~lexicon_file._UMASK)
+    
+    def test_gaddag_artifact(self):
+        """Test that the GADDAG is compiled next to the lexicon and mapped back."""
+        lexicon = MappedLexicon(compile_lexicon(self.source))
+        path = gaddag_path(lexicon.path)
+        self.assertFalse(os.path.exists(path))
+        
+        gaddag = lexicon.gaddag
+        self.assertTrue(os.path.exists(path))
+        self.assertIn('tact', gaddag)
+        self.assertNotIn('tac', gaddag)
+        self.assertEqual(load_gaddag(lexicon, path).sections(), gaddag.sections())
+        
+        # An artifact built from other words is rebuilt
+        self.write_source(['CAT', 'CATS'])
+        changed = MappedLexicon(compile_lexicon(self.source))
+        self.assertIn('cats', load_gaddag(changed, path))
+    
+    def test_staleness(self):
+        """Test that edits to the source file are detected."""
+        lexicon = MappedLexicon(compile_lexicon(self.source))
+        self.assertFalse(lexicon.is_stale(self.source))
+        
+        # Touching the file without changing it is not stale
+        os.utime(self.source, ns=(0, 0))
+        self.assertFalse(lexicon.is_stale(self.source))
+        
+        self.write_source(['CAT', 'DOG'])
+        self.assertTrue(lexicon.is_stale(self.source))
+    
+    def test_load_compiled_dictionary_rebuilds(self):
+        """Test that missing or stale artifacts are compiled on load."""
+        lexicon = load_compiled_dictionary(self.source)
+        self.assertTrue(os.path.exists(compiled_path(self.source)))
+        self.assertIn('zax', lexicon)
+        
+        self.write_source(['DOG', 'GOD'])
+        lexicon = load_compiled_dictionary(self.source)
+        self.assertEqual(list(lexicon), ['dog', 'god'])
+    
+    def test_rejects_other_files(self):
+        """Test that non-lexicon files are refused."""
+        with self.assertRaises(ValueError):
+            MappedLexicon(self.source)
+
+
+if __name__ == '__main__':
+    unittest.main()
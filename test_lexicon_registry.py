@@ -0,0 +1,178 @@
+"""
+Unit tests for the lexicon registry in Scrabble Word Solver.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+import matrix_engine
+from lexicon_registry import LexiconRegistry, lexicon_size, parse_lexicon_sources
+from scrabble_solver import find_words
+
+
+class TestLexiconRegistry(unittest.TestCase):
+
+    def setUp(self):
+        """Set up two small word lists."""
+        self.directory = tempfile.mkdtemp()
+        self.sources = {
+            'house': self.write_source('house.txt', ['CAT', 'ACT', 'AT']),
+            'big': self.write_source('big.txt', ['CAT', 'ACT', 'AT', 'TACT', 'ZAX', 'QI'])
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write_source(self, name, words):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w') as file:
+            file.write('\n'.join(words) + '\n')
+        return path
+
+    def test_parse_lexicon_sources(self):
+        """Test reading name=path lists."""
+        self.assertEqual(parse_lexicon_sources('twl=/data/twl.txt, collins=/data/collins.txt,'),
+                         {'twl': '/data/twl.txt', 'collins': '/data/collins.txt'})
+        self.assertEqual(parse_lexicon_sources(''), {})
+        for spec in ('twl', 'twl=', '=/data/twl.txt'):
+            with self.assertRaises(ValueError):
+                parse_lexicon_sources(spec)
+
+    def test_loads_on_first_use(self):
+        """Test that lexicons are mapped lazily and reused."""
+        prepared = []
+        registry = LexiconRegistry(self.sources, max_bytes=1 << 30, prepare=prepared.append)
+        self.assertEqual(registry.default, 'house')
+        self.assertFalse(registry.stats()['lexicons']['big']['loaded'])
+
+        big = registry.get('big')
+        self.assertIs(registry.get('big'), big)
+        self.assertEqual(prepared, [big])
+        self.assertEqual([r['word'] for r in find_words('tact', big)], ['tact', 'act', 'cat', 'at'])
+        self.assertEqual(registry.get().version, registry.get('house').version)
+        self.assertNotEqual(big.version, registry.get('house').version)
+
+        stats = registry.stats()
+        self.assertEqual(stats['loads'], 2)
+        self.assertEqual(stats['lexicons']['big']['version'], big.version)
+        self.assertEqual(stats['loaded_bytes'], lexicon_size(big) + lexicon_size(registry.get('house')))
+        with self.assertRaises(KeyError):
+            registry.get('collins')
+
+    def test_evicts_least_recently_used(self):
+        """Test eviction under the memory budget."""
+        sizes = {name: lexicon_size(LexiconRegistry({name: path}, 0).get()) for name, path in self.sources.items()}
+        registry = LexiconRegistry(self.sources, max_bytes=max(sizes.values()))
+
+        house = registry.get('house')
+        registry.get('big')
+        stats = registry.stats()
+        self.assertFalse(stats['lexicons']['house']['loaded'])
+        self.assertEqual(stats['evictions'], 1)
+
+        # An evicted lexicon loads again, still usable by whoever held it
+        self.assertEqual(registry.get('house').version, house.version)
+        self.assertEqual(find_words('at', house), find_words('at', registry.get('house')))
+        self.assertEqual(registry.stats()['loads'], 3)
+
+    def test_built_indexes_count(self):
+        """Test that indexes built after the load count against the budget."""
+        sizes = {name: lexicon_size(LexiconRegistry({name: path}, 0).get()) for name, path in self.sources.items()}
+        registry = LexiconRegistry(self.sources, max_bytes=sum(sizes.values()))
+        house = registry.get('house')
+        self.assertEqual(lexicon_size(house), sizes['house'])
+
+        house.pattern_index
+        house.gaddag
+        built = house.pattern_index.nbytes + house.gaddag.nbytes
+        if matrix_engine.AVAILABLE:
+            house.letter_matrix
+            built += house.letter_matrix.nbytes
+        self.assertGreater(house.pattern_index.nbytes, 0)
+        self.assertEqual(lexicon_size(house), sizes['house'] + built)
+
+        # Both artifacts fit the budget, but not with house's indexes too
+        registry.get('big')
+        self.assertFalse(registry.stats()['lexicons']['house']['loaded'])
+
+    def test_keeps_lexicon_over_budget(self):
+        """Test that a lexicon larger than the budget still loads."""
+        registry = LexiconRegistry(self.sources, max_bytes=0)
+        registry.get('house')
+        self.assertTrue(registry.get('big'))
+        self.assertEqual([name for name, lexicon in registry.stats()['lexicons'].items() if lexicon['loaded']],
+                         ['big'])
+
+    def test_concurrent_first_use_loads_once(self):
+        """Test that threads asking together share one load."""
+        registry = LexiconRegistry(self.sources, max_bytes=1 << 30)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(registry.get('big'))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(registry.loads, 1)
+        self.assertTrue(all(lexicon is results[0] for lexicon in results))
+
+    def test_reload_swaps_new_version(self):
+        """Test that a reload swaps in the rebuilt lexicon and reports the change."""
+        swaps = []
+        registry = LexiconRegistry(self.sources, max_bytes=1 << 30,
+                                   on_swap=lambda old, new: swaps.append((old, new)))
+        old = registry.get('house')
+        self.write_source('house.txt', ['CAT', 'ACT', 'TACT', 'QI'])
+
+        report = registry.reload('house')
+        new = registry.get('house')
+        self.assertIsNot(new, old)
+        self.assertEqual(report['old_version'], old.version)
+        self.assertEqual(report['version'], new.version)
+        self.assertEqual((report['words'], report['added'], report['removed']), (4, 2, 1))
+        self.assertGreater(report['build_ms'], 0)
+        self.assertEqual(swaps, [(old, new)])
+        # The old lexicon still answers for whoever holds it
+        self.assertEqual([r['word'] for r in find_words('at', old)], ['at'])
+        self.assertEqual(find_words('at', new), [])
+
+        # Nothing changed: nothing is rebuilt or swapped
+        report = registry.reload('house')
+        self.assertEqual((report['old_version'], report['added'], report['removed']), (new.version, 0, 0))
+        self.assertEqual(len(swaps), 1)
+        self.assertEqual(registry.stats()['lexicons']['house']['last_reload'], report)
+
+    def test_watch_reloads_changed_sources(self):
+        """Test that a changed source file is picked up in the background."""
+        registry = LexiconRegistry(self.sources, max_bytes=1 << 30)
+        old = registry.get('house')
+        registry.watch(0.05)
+        self.write_source('house.txt', ['CAT', 'ZAX'])
+
+        deadline = time.monotonic() + 60
+        while 'house' not in registry.last_reload and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertIsNot(registry.get('house'), old)
+        self.assertEqual([r['word'] for r in find_words('zax', registry.get('house'))], ['zax'])
+        self.assertEqual((registry.last_reload['house']['added'], registry.last_reload['house']['removed']), (1, 2))
+
+    def test_reports_load_times(self):
+        """Test that loads and reloads report how long they took."""
+        loads = []
+        registry = LexiconRegistry(self.sources, max_bytes=1 << 30,
+                                   on_load=lambda name, seconds: loads.append((name, seconds)))
+        registry.get('big')
+        registry.get('big')
+        registry.reload('big')
+        self.assertEqual([name for name, _ in loads], ['big', 'big'])
+        self.assertTrue(all(seconds > 0 for _, seconds in loads))
+
+    def test_requires_a_lexicon(self):
+        with self.assertRaises(ValueError):
+            LexiconRegistry({}, max_bytes=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+"""
+Unit tests for the load test harness in Scrabble Word Solver.
+"""
+
+import json
+import random
+import unittest
+from load_test import make_request, percentile
+
+
+class TestLoadTest(unittest.TestCase):
+    
+    def test_make_request(self):
+        """Test the request built for each kind."""
+        rng = random.Random(0)
+        method, path, body = make_request('heavy', rng)
+        self.assertEqual((method, path), ('POST', '/solve'))
+        self.assertEqual(json.loads(body)['letters'].count('?'), 2)
+        self.assertEqual(len(json.loads(make_request('light', rng)[2])['letters']), 7)
+        for _ in range(10):
+            method, path, body = make_request('cheap', rng)
+            self.assertEqual((method, body), ('GET', b''))
+            self.assertTrue(path.startswith('/api/'))
+    
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([3.0], 0.99), 3.0)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
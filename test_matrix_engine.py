@@ -0,0 +1,74 @@
+"""
+Unit tests for the NumPy letter-count matrix engine in Scrabble Word Solver.
+"""
+
+import unittest
+import matrix_engine
+from matrix_engine import pack_letter_counts
+from scrabble_solver import SCRABBLE_SCORES, Lexicon, find_words
+
+
+class TestPackLetterCounts(unittest.TestCase):
+    
+    def test_pack_letter_counts(self):
+        """Test packing letter counts into 26-byte rows."""
+        rows = pack_letter_counts(['ab', 'zz'])
+        self.assertEqual(len(rows), 52)
+        self.assertEqual(rows[0], 1)
+        self.assertEqual(rows[1], 1)
+        self.assertEqual(rows[26 + 25], 2)
+        self.assertEqual(sum(rows), 4)
+
+
+@unittest.skipUnless(matrix_engine.AVAILABLE, 'NumPy is not installed')
+class TestLetterMatrix(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up test data."""
+        self.words = sorted(['at', 'bat', 'cat', 'tab', 'tact', 'zax', 'zzz'])
+        self.matrix = matrix_engine.LetterMatrix.from_words(self.words, SCRABBLE_SCORES)
+    
+    def test_columns(self):
+        """Test precomputed length and score columns."""
+        self.assertEqual(self.matrix.lengths.tolist(), [len(word) for word in self.words])
+        self.assertEqual(self.matrix.scores.tolist(),
+                         [sum(SCRABBLE_SCORES[letter] for letter in word) for word in self.words])
+    
+    def test_search(self):
+        """Test rack search ordered by score then alphabetically."""
+        result = self.matrix.search('tacb')
+        self.assertEqual(result, [('bat', 5, 3, ''), ('cat', 5, 3, ''), ('tab', 5, 3, ''), ('at', 2, 2, '')])
+    
+    def test_search_with_blanks(self):
+        """Test that missing letters are covered by blanks scoring 0."""
+        result = dict((word, (blanks, score)) for word, score, _, blanks in self.matrix.search('zt', 2))
+        self.assertEqual(result['zax'], ('ax', 10))
+        self.assertEqual(result['at'], ('a', 1))
+        self.assertEqual(result['zzz'], ('zz', 10))
+        self.assertNotIn('tact', result)
+        
+        result = dict((word, (blanks, score)) for word, score, _, blanks in self.matrix.search('tt', 2))
+        self.assertEqual(result['tact'], ('ac', 2))
+    
+    def test_search_limits(self):
+        """Test restricting the search to a length range and a run of word ids."""
+        result = [word for word, _, _, _ in self.matrix.search('tacb', min_length=3)]
+        self.assertEqual(result, ['bat', 'cat', 'tab'])
+        
+        result = [word for word, _, _, _ in self.matrix.search('tacb', max_length=2)]
+        self.assertEqual(result, ['at'])
+        
+        # Ids 1-2 are the words starting with 'b' and 'c'
+        result = [word for word, _, _, _ in self.matrix.search('tac', 1, id_range=(1, 3))]
+        self.assertEqual(result, ['cat', 'bat'])
+    
+    def test_matches_other_engines(self):
+        """Test parity with the anagram engine through find_words."""
+        lexicon = Lexicon(self.words)
+        for letters in ('tacb', 'z?x', 'tt??', ''):
+            self.assertEqual(find_words(letters, lexicon, 'matrix'),
+                             find_words(letters, lexicon, 'anagram'))
+
+
+if __name__ == '__main__':
+    unittest.main()
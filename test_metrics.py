@@ -0,0 +1,140 @@
+"""
+Unit tests for metrics collection in Scrabble Word Solver.
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from utils.metrics import MetricsRegistry, format_value
+
+
+def make_registry(directory=None):
+    """A registry with one counter and one labelled histogram."""
+    registry = MetricsRegistry(directory)
+    requests = registry.counter('requests_total', 'Requests served')
+    stages = registry.histogram('stage_seconds', 'Seconds per stage', (0.1, 1), label='stage',
+                                label_values=('search', 'sort'))
+    return registry, requests, stages
+
+
+def record_in_child(directory):
+    """Record into a shared directory from another process."""
+    _, requests, stages = make_registry(directory)
+    requests.inc(amount=2)
+    stages.observe(0.5, 'sort')
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a metrics directory."""
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_render(self):
+        """Test the Prometheus text format of counters and histograms."""
+        registry, requests, stages = make_registry()
+        requests.inc()
+        stages.observe(0.05, 'search')
+        stages.observe(0.1, 'search')
+        stages.observe(3, 'search')
+        self.assertEqual(registry.render(), '\n'.join([
+            '# HELP requests_total Requests served',
+            '# TYPE requests_total counter',
+            'requests_total 1',
+            '# HELP stage_seconds Seconds per stage',
+            '# TYPE stage_seconds histogram',
+            'stage_seconds_bucket{stage="search",le="0.1"} 2',
+            'stage_seconds_bucket{stage="search",le="1"} 2',
+            'stage_seconds_bucket{stage="search",le="+Inf"} 3',
+            'stage_seconds_sum{stage="search"} 3.15',
+            'stage_seconds_count{stage="search"} 3',
+            'stage_seconds_bucket{stage="sort",le="0.1"} 0',
+            'stage_seconds_bucket{stage="sort",le="1"} 0',
+            'stage_seconds_bucket{stage="sort",le="+Inf"} 0',
+            'stage_seconds_sum{stage="sort"} 0',
+            'stage_seconds_count{stage="sort"} 0'
+        ]) + '\n')
+        self.assertEqual(format_value(0.25), '0.25')
+
+    def test_timer(self):
+        """Test that a timed block is observed once."""
+        registry, _, stages = make_registry()
+        with stages.timer('sort'):
+            pass
+        samples = registry.snapshot()
+        self.assertEqual(samples['stage_seconds_count{stage="sort"}'], 1)
+        self.assertEqual(samples['stage_seconds_bucket{stage="sort",le="0.1"}'], 1)
+
+    def test_declaration_errors(self):
+        """Test that metrics are declared once, up front, with known labels."""
+        registry, requests, stages = make_registry()
+        with self.assertRaises(ValueError):
+            registry.counter('requests_total', 'Again')
+        with self.assertRaises(ValueError):
+            registry.histogram('unsorted', 'Buckets out of order', (1, 0.1))
+        with self.assertRaises(ValueError):
+            registry.counter('labelled', 'No label values', label='result')
+        with self.assertRaises(KeyError):
+            stages.observe(1, 'serialize')
+        requests.inc()
+        with self.assertRaises(RuntimeError):
+            registry.counter('late_total', 'Declared after recording')
+
+    def test_threads(self):
+        """Test that updates from many threads are all counted."""
+        registry, requests, stages = make_registry()
+
+        def work():
+            for _ in range(2000):
+                requests.inc()
+                stages.observe(0.5, 'search')
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        samples = registry.snapshot()
+        self.assertEqual(samples['requests_total'], 16000)
+        self.assertEqual(samples['stage_seconds_count{stage="search"}'], 16000)
+        self.assertEqual(samples['stage_seconds_sum{stage="search"}'], 8000)
+
+    def test_processes_share_directory(self):
+        """Test that every process writing to the directory is counted."""
+        registry, requests, stages = make_registry(self.directory)
+        requests.inc()
+        stages.observe(0.05, 'sort')
+        child = multiprocessing.get_context('spawn').Process(target=record_in_child, args=(self.directory,))
+        child.start()
+        child.join()
+
+        # Files from a different set of metrics are left out
+        other = MetricsRegistry(self.directory)
+        other.counter('other_total', 'Unrelated').inc(amount=5)
+
+        samples = registry.snapshot()
+        self.assertEqual(samples['requests_total'], 3)
+        self.assertEqual(samples['stage_seconds_count{stage="sort"}'], 2)
+        self.assertEqual(samples['stage_seconds_bucket{stage="sort",le="0.1"}'], 1)
+        self.assertEqual(samples['stage_seconds_sum{stage="sort"}'], 0.55)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires fork')
+    def test_forked_worker_writes_own_file(self):
+        """Test that a forked worker starts its own file instead of writing to its parent's."""
+        registry, requests, _ = make_registry(self.directory)
+        requests.inc()
+        child = multiprocessing.get_context('fork').Process(target=requests.inc, args=(None, 10))
+        child.start()
+        child.join()
+        self.assertEqual(registry.snapshot()['requests_total'], 11)
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Unit tests for board move generation in Scrabble Word Solver.
+"""
+
+import unittest
+from board import ACROSS, BINGO_BONUS, DOWN, Board
+from dawg import CompactDawg
+from move_generator import generate_moves
+from scrabble_solver import Lexicon
+
+
+class TestMoveGenerator(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up test data."""
+        self.lexicon = Lexicon(['at', 'cat', 'cats', 'scat', 'act', 'acts', 'ta', 'tas', 'as'])
+        self.board = Board.from_rows([
+            '.......',
+            '.......',
+            '.......',
+            '..cat..',
+            '.......',
+            '.......',
+            '.......',
+        ])
+    
+    def plays(self, moves):
+        return {(move.word, move.row, move.col, move.direction) for move in moves}
+    
+    def test_first_move_covers_centre(self):
+        """Test that opening moves must cover the centre square."""
+        moves = generate_moves(Board(7), 'cat', self.lexicon)
+        for move in moves:
+            self.assertIn((3, 3), {(row, col) for row, col, _, _ in move.tiles})
+        self.assertIn(('cat', 3, 1, ACROSS), self.plays(moves))
+        self.assertIn(('cat', 1, 3, DOWN), self.plays(moves))
+    
+    def test_extends_existing_words(self):
+        """Test hooking onto the front and back of a word on the board."""
+        plays = self.plays(generate_moves(self.board, 's', self.lexicon))
+        self.assertIn(('cats', 3, 2, ACROSS), plays)
+        self.assertIn(('scat', 3, 1, ACROSS), plays)
+    
+    def test_moves_are_valid_and_unique(self):
+        """Test that every move forms only dictionary words and is found once."""
+        moves = generate_moves(self.board, 'stac', self.lexicon)
+        self.assertEqual(len(moves), len({frozenset(move.tiles) for move in moves}))
+        for move in moves:
+            board = Board.from_rows(str(self.board).split('\n'))
+            board.place(move.tiles)
+            for row, col, _, _ in move.tiles:
+                for d_row, d_col in ((0, 1), (1, 0)):
+                    while board.get(row - d_row, col - d_col):
+                        row, col = row - d_row, col - d_col
+                    word = ''
+                    while board.get(row, col):
+                        word += board.get(row, col)
+                        row, col = row + d_row, col + d_col
+                    if len(word) > 1:
+                        self.assertIn(word, self.lexicon, move)
+    
+    def test_cross_checks_restrict_parallel_plays(self):
+        """Test that a parallel play must form valid vertical words."""
+        plays = self.plays(generate_moves(self.board, 'as', self.lexicon))
+        # 'as' under 'at' of cat forms 'aa' and 'ts': not words
+        self.assertNotIn(('as', 4, 3, ACROSS), plays)
+        # 'as' starting under 't' forms 'ta'
+        self.assertIn(('as', 4, 4, ACROSS), plays)
+    
+    def test_blank_tiles(self):
+        """Test that blanks produce plays scoring zero for the blank letter."""
+        moves = generate_moves(self.board, '?', self.lexicon)
+        cats = [move for move in moves if move.word == 'cats' and move.direction == ACROSS]
+        self.assertEqual(len(cats), 1)
+        self.assertEqual(cats[0].tiles, ((3, 5, 's', True),))
+        self.assertEqual(cats[0].score, 5)
+        
+        real = [move for move in generate_moves(self.board, 's?', self.lexicon)
+                if move.word == 'cats' and move.direction == ACROSS]
+        self.assertEqual(sorted(move.score for move in real), [5, 6])
+    
+    def test_scores_match_board_scoring(self):
+        """Test that incrementally accumulated scores equal rescoring each play."""
+        board = Board()
+        board.place([(7, 6, 'c', False), (7, 7, 'a', False), (7, 8, 't', False)])
+        for backend in ('dawg', 'gaddag'):
+            moves = generate_moves(board, 'sat?', self.lexicon, backend)
+            self.assertTrue(moves)
+            for move in moves:
+                self.assertEqual(move.score, board.score_play(move.tiles, move.direction), move)
+    
+    def test_bingo_bonus(self):
+        """Test that a play using all seven tiles earns the bingo bonus."""
+        lexicon = Lexicon(['retains', 'retain', 'at'])
+        for backend in ('dawg', 'gaddag'):
+            moves = generate_moves(Board(), 'retains', lexicon, backend)
+            bingos = [move for move in moves if move.word == 'retains']
+            self.assertEqual(len(bingos), 14)  # 7 positions across the centre, 7 down
+            self.assertTrue(all(move.score >= 7 + BINGO_BONUS for move in bingos))
+    
+    def test_down_moves_use_board_coordinates(self):
+        """Test that down moves report tiles in untransposed coordinates."""
+        moves = [move for move in generate_moves(self.board, 'as', self.lexicon)
+                 if move.word == 'as' and move.direction == DOWN]
+        self.assertTrue(moves)
+        for move in moves:
+            self.assertEqual({col for _, col, _, _ in move.tiles}, {move.col})
+    
+    def test_gaddag_backend_matches(self):
+        """Test that generating outward from anchors finds the same moves."""
+        for rack in ('stac', 'sa?', 'c'):
+            self.assertEqual(sorted(generate_moves(self.board, rack, self.lexicon)),
+                             sorted(generate_moves(self.board, rack, self.lexicon, 'gaddag')))
+        self.assertEqual(sorted(generate_moves(Board(7), 'tac', self.lexicon)),
+                         sorted(generate_moves(Board(7), 'tac', self.lexicon, 'gaddag')))
+        with self.assertRaises(ValueError):
+            generate_moves(self.board, 's', self.lexicon, 'unknown')
+    
+    def test_compact_graph_matches(self):
+        """Test that the array-backed graph generates the same moves."""
+        compact = Lexicon(self.lexicon)
+        compact.dawg = CompactDawg.from_dawg(self.lexicon.dawg)
+        self.assertEqual(sorted(generate_moves(self.board, 'sa?', self.lexicon)),
+                         sorted(generate_moves(self.board, 'sa?', compact)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Unit tests for pagination functionality in Scrabble Word Solver.
+"""
+
+import unittest
+from utils.pagination import page_key, top_words, encode_cursor, decode_cursor, paginate
+from utils.results import WordResult
+
+
+class TestPagination(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up test data."""
+        self.sample_words = [
+            {'word': 'quiz', 'score': 22, 'length': 4, 'blanks': ''},
+            {'word': 'zoo', 'score': 12, 'length': 3, 'blanks': ''},
+            {'word': 'cat', 'score': 5, 'length': 3, 'blanks': ''},
+            {'word': 'dog', 'score': 5, 'length': 3, 'blanks': ''},
+            {'word': 'dog', 'score': 3, 'length': 3, 'blanks': 'd'},
+            {'word': 'a', 'score': 1, 'length': 1, 'blanks': ''}
+        ]
+    
+    def collect_pages(self, words, limit, sort_by, presorted=False):
+        """Follow cursors until the last page, returning every page."""
+        pages = []
+        cursor = None
+        while True:
+            page = paginate(words, limit, sort_by, cursor, presorted)
+            pages.append(page['words'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                return pages
+    
+    def test_top_words_by_score(self):
+        """Test that the first page holds the best words in order."""
+        page, remaining = top_words(self.sample_words, 2, 'score')
+        self.assertEqual([word['word'] for word in page], ['quiz', 'zoo'])
+        self.assertEqual(remaining, 4)
+    
+    def test_top_words_alphabetical(self):
+        """Test alphabetical pages, with equal words ordered by score."""
+        page, remaining = top_words(self.sample_words, 4, 'alphabetical')
+        self.assertEqual([(word['word'], word['score']) for word in page],
+                         [('a', 1), ('cat', 5), ('dog', 5), ('dog', 3)])
+        self.assertEqual(remaining, 2)
+    
+    def test_top_words_after_key(self):
+        """Test that a page resumes strictly after the given key."""
+        after = page_key('score')(self.sample_words[2])
+        page, remaining = top_words(self.sample_words, 10, 'score', after)
+        self.assertEqual([word['word'] for word in page], ['dog', 'dog', 'a'])
+        self.assertEqual(remaining, 0)
+    
+    def test_presorted_matches_heap(self):
+        """Test that slicing presorted words gives the same pages as the heap."""
+        presorted = sorted(self.sample_words, key=page_key('score'))
+        self.assertEqual(self.collect_pages(presorted, 2, 'score', presorted=True),
+                         self.collect_pages(self.sample_words, 2, 'score'))
+    
+    def test_pages_cover_every_word_once(self):
+        """Test that following cursors visits every word exactly once, in order."""
+        for sort_by in ('score', 'alphabetical'):
+            for limit in (1, 2, 4, 6, 10):
+                pages = self.collect_pages(self.sample_words, limit, sort_by)
+                words = [word for page in pages for word in page]
+                self.assertEqual(words, sorted(self.sample_words, key=page_key(sort_by)))
+                self.assertTrue(all(len(page) <= limit for page in pages))
+    
+    def test_compact_results(self):
+        """Test that WordResult objects page like dicts."""
+        compact = [WordResult(**word) for word in self.sample_words]
+        self.assertEqual(self.collect_pages(compact, 4, 'alphabetical'),
+                         self.collect_pages(self.sample_words, 4, 'alphabetical'))
+    
+    def test_last_page_has_no_cursor(self):
+        """Test that the final page carries no cursor."""
+        page = paginate(self.sample_words, 6, 'score')
+        self.assertIsNone(page['next_cursor'])
+        self.assertEqual(page['remaining'], 0)
+        self.assertEqual(paginate([], 5, 'score'), {'words': [], 'next_cursor': None, 'remaining': 0})
+    
+    def test_cursor_round_trip(self):
+        """Test that cursors decode to the key they were built from."""
+        key = (-5, 'cat', '')
+        cursor = encode_cursor('score', key)
+        self.assertNotIn('=', cursor)
+        self.assertEqual(decode_cursor(cursor, 'score'), key)
+        # Unknown within-group sorts page by score
+        self.assertEqual(decode_cursor(cursor, 'length'), key)
+    
+    def test_invalid_cursors(self):
+        """Test that malformed or mismatched cursors are rejected."""
+        for cursor in ('not a cursor', encode_cursor('score', ('cat', -5, '')), encode_cursor('random', (-5, 'a', ''))):
+            with self.assertRaises(ValueError):
+                decode_cursor(cursor, 'score')
+        with self.assertRaises(ValueError):
+            decode_cursor(encode_cursor('score', (-5, 'cat', '')), 'alphabetical')
+
+
+if __name__ == '__main__':
+    unittest.main()
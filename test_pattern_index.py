@@ -0,0 +1,86 @@
+"""
+Unit tests for pattern queries in Scrabble Word Solver.
+"""
+
+import re
+import unittest
+from pattern_index import PatternIndex
+from scrabble_solver import Lexicon, find_pattern_words
+
+
+class TestPatternIndex(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up test data."""
+        self.words = sorted([
+            'a', 'at', 'cat', 'cot', 'cut', 'table', 'cable', 'maize', 'sing', 'sting',
+            'string', 'sorting', 'staring', 'string', 'singing', 'ring', 'oxidize'
+        ])
+        self.lexicon = Lexicon(self.words)
+        self.index = PatternIndex.from_words(self.lexicon.word_list)
+    
+    def matching(self, pattern, letters=None):
+        return sorted(self.lexicon.word(word_id) for word_id, _ in self.index.search(pattern, letters))
+    
+    def test_fixed_length_patterns(self):
+        """Test patterns made of letters and single-letter wildcards."""
+        self.assertEqual(self.matching('c?t'), ['cat', 'cot', 'cut'])
+        self.assertEqual(self.matching('?a??e'), ['cable', 'maize', 'table'])
+        self.assertEqual(self.matching('?????'), ['cable', 'maize', 'sting', 'table'])
+        self.assertEqual(self.matching('c?x'), [])
+        self.assertEqual(self.matching('??????????'), [])
+    
+    def test_any_run_patterns(self):
+        """Test '*' matching any run of letters, including none."""
+        self.assertEqual(self.matching('s*ing'), ['sing', 'singing', 'sorting', 'staring', 'sting', 'string'])
+        self.assertEqual(self.matching('*ing'), ['ring', 'sing', 'singing', 'sorting', 'staring', 'sting', 'string'])
+        self.assertEqual(self.matching('S*NG'), self.matching('s*ng'))
+        self.assertEqual(self.matching('*x*z*'), ['oxidize'])
+        self.assertEqual(self.matching('*'), sorted(set(self.words)))
+        
+        # Results come shortest first, in id order within each length
+        found = [word_id for word_id, _ in self.index.search('*ing')]
+        self.assertEqual(found, sorted(found, key=lambda word_id: (len(self.lexicon.word(word_id)), word_id)))
+        self.assertNotEqual(found, sorted(found))
+    
+    def test_matches_regex_scan(self):
+        """Test that index lookups agree with scanning every word."""
+        for pattern in ('*', '?*', 's*', '*g', '?t*', '*a*e', '*i*i*', 's?*?g', '*r?n*', 'a*'):
+            regex = re.compile(pattern.replace('?', '.').replace('*', '.*'))
+            expected = sorted(word for word in set(self.words) if regex.fullmatch(word))
+            self.assertEqual(self.matching(pattern), expected, pattern)
+    
+    def test_rack_constraint(self):
+        """Test that a rack must supply every letter not fixed by the pattern."""
+        self.assertEqual(self.matching('?a??e', 'tble'), ['table'])
+        self.assertEqual(self.matching('?a??e', 'tbl'), ['table'])
+        self.assertEqual(self.matching('s*ing', 'tr'), ['sting', 'string'])
+        
+        # Words already spelled out by the pattern leave nothing to play
+        self.assertEqual(self.matching('s*ing', ''), [])
+        self.assertEqual(self.matching('cat', 'cat'), [])
+    
+    def test_rack_blanks(self):
+        """Test that blanks fill the letters the rack is missing."""
+        found = {self.lexicon.word(word_id): blanks for word_id, blanks in self.index.search('s*ing', 'tr?')}
+        self.assertEqual(found, {'sting': '', 'string': '', 'sorting': 'o', 'staring': 'a'})
+    
+    def test_find_pattern_words(self):
+        """Test scored pattern results from a lexicon."""
+        results = find_pattern_words('s*ing', self.lexicon, 'tr?')
+        by_word = {result['word']: result for result in results}
+        
+        # Blank letters score nothing; pattern letters count at face value
+        self.assertEqual(by_word['sorting']['blanks'], 'o')
+        self.assertEqual(by_word['sorting']['score'], 7)
+        self.assertEqual(by_word['string']['score'], 7)
+        self.assertEqual([result['word'] for result in results],
+                         ['sorting', 'staring', 'string', 'sting'])
+        
+        # Plain collections are indexed on the fly
+        self.assertEqual([result['word'] for result in find_pattern_words('c?t', ['cut', 'cat', 'dog'])],
+                         ['cat', 'cut'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Unit tests for the compact result type in Scrabble Word Solver.
+"""
+
+import json
+import pickle
+import unittest
+from utils.results import WordResult, to_dicts, to_columns, from_columns, encode_words, field_getter
+from utils.filtering import apply_filters, iter_filters
+from utils.grouping import group_words, group_and_sort, iter_groups
+from utils.sorting import apply_sorting, sort_flat_words
+from utils.cache import estimate_size
+
+
+class TestResults(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up test data."""
+        self.sample_words = [
+            {'word': 'cat', 'score': 5, 'length': 3, 'blanks': ''},
+            {'word': 'dog', 'score': 5, 'length': 3, 'blanks': 'g'},
+            {'word': 'a', 'score': 1, 'length': 1, 'blanks': ''},
+            {'word': 'quiz', 'score': 22, 'length': 4, 'blanks': ''},
+            {'word': 'zoo', 'score': 12, 'length': 3, 'blanks': ''}
+        ]
+        self.compact_words = [WordResult(**word) for word in self.sample_words]
+    
+    def test_reads_like_a_dict(self):
+        """Test key access, get, unpacking and equality with dicts."""
+        result = self.compact_words[1]
+        self.assertEqual(result['word'], 'dog')
+        self.assertEqual(result.get('blanks'), 'g')
+        self.assertIsNone(result.get('missing'))
+        self.assertEqual(dict(result), self.sample_words[1])
+        self.assertEqual({'type': 'word', **result}['score'], 5)
+        self.assertEqual(result, self.sample_words[1])
+        self.assertEqual(result, WordResult('dog', 5, 3, 'g'))
+        self.assertNotEqual(result, self.compact_words[0])
+    
+    def test_missing_key(self):
+        """Test that only result fields are keys, as with a result dict."""
+        result = self.compact_words[0]
+        for key in ('missing', '__class__', 'as_dict', 'get'):
+            with self.assertRaises(KeyError):
+                result[key]
+    
+    def test_has_no_instance_dict(self):
+        """Test that results are slots-only."""
+        with self.assertRaises(AttributeError):
+            self.compact_words[0].first_letter = 'c'
+    
+    def test_to_dicts(self):
+        """Test conversion to plain dicts, passing dicts through."""
+        dicts = to_dicts(self.compact_words)
+        self.assertEqual(dicts, self.sample_words)
+        self.assertTrue(all(type(word) is dict for word in dicts))
+        self.assertIs(to_dicts(self.sample_words)[0], self.sample_words[0])
+    
+    def test_to_columns(self):
+        """Test conversion to parallel arrays."""
+        columns = to_columns(self.compact_words)
+        self.assertEqual(columns['word'], ['cat', 'dog', 'a', 'quiz', 'zoo'])
+        self.assertEqual(columns['score'], [5, 5, 1, 22, 12])
+        self.assertEqual(columns['length'], [3, 3, 1, 4, 3])
+        self.assertEqual(columns['blanks'], ['', 'g', '', '', ''])
+        self.assertEqual(to_columns(self.sample_words), columns)
+        self.assertEqual(to_columns([]), {'word': [], 'score': [], 'length': [], 'blanks': []})
+    
+    def test_from_columns(self):
+        """Test rebuilding results from parallel arrays."""
+        rebuilt = from_columns(to_columns(self.sample_words))
+        self.assertEqual(rebuilt, self.compact_words)
+        self.assertTrue(all(type(word) is WordResult for word in rebuilt))
+        self.assertEqual(from_columns(to_columns([])), [])
+    
+    def test_pickle(self):
+        """Test that results survive pickling (e.g. from a solver process)."""
+        self.assertEqual(pickle.loads(pickle.dumps(self.compact_words)), self.compact_words)
+    
+    def test_encode_words(self):
+        """Test that both response formats are JSON-serializable and default to objects."""
+        self.assertEqual(json.loads(json.dumps(encode_words(self.compact_words))), self.sample_words)
+        columnar = json.loads(json.dumps(encode_words(self.compact_words, 'columnar')))
+        self.assertEqual(columnar['word'][3], 'quiz')
+    
+    def test_field_getter(self):
+        """Test that the accessor matches the kind of result."""
+        self.assertEqual(field_getter('score', self.compact_words[3])(self.compact_words[3]), 22)
+        self.assertEqual(field_getter('score', self.sample_words[3])(self.sample_words[3]), 22)
+    
+    def test_filtering_parity(self):
+        """Test that filters keep the same words for both representations."""
+        filters = {'min_length': 3, 'ends_with': 'o', 'pattern': '?o?'}
+        self.assertEqual(list(iter_filters(self.compact_words, filters)),
+                         apply_filters(self.sample_words, filters))
+        self.assertEqual(apply_filters(self.compact_words, {'starts_with': 'q'}), [self.sample_words[3]])
+    
+    def test_grouping_and_sorting_parity(self):
+        """Test that grouping and sorting give the same output for both representations."""
+        for group_by in ('length', 'first_letter', 'last_letter'):
+            expected = group_and_sort(self.sample_words, group_by, 'desc', 'alphabetical')
+            self.assertEqual(group_and_sort(self.compact_words, group_by, 'desc', 'alphabetical'), expected)
+            self.assertEqual(apply_sorting(group_words(self.compact_words, group_by), 'desc', 'alphabetical'),
+                             expected)
+        self.assertEqual(list(iter_groups(self.compact_words, 'length')),
+                         group_words(self.sample_words, 'length'))
+        self.assertEqual(sort_flat_words(self.compact_words, 'score'), sort_flat_words(self.sample_words, 'score'))
+        self.assertEqual(group_words([], 'length'), [])
+    
+    def test_smaller_than_dicts(self):
+        """Test that compact results are estimated smaller than the equivalent dicts."""
+        self.assertLess(estimate_size(self.compact_words), estimate_size(self.sample_words))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,9 @@
 import unittest
-from scrabble_solver import calculate_word_score, generate_valid_words
+from scrabble_solver import (
+    best_words, calculate_word_score, generate_valid_words, find_words, find_words_batch, iter_words, Lexicon,
+    SearchBudget, build_anagram_index, rack_signatures, ENGINES
+)
+from utils.filtering import apply_filters
 
 class TestScrabbleSolver(unittest.TestCase):
     def test_calculate_word_score(self):
@@ -19,5 +23,190 @@ class TestScrabbleSolver(unittest.TestCase):
         for i in range(len(result) - 1):
             self.assertGreaterEqual(calculate_word_score(result[i]), calculate_word_score(result[i + 1]))
 
+    def test_generate_valid_words_repeated_letters(self):
+        dictionary = Lexicon({"bee", "be", "eel", "bell", "ebb"})
+        result = generate_valid_words("ebel", dictionary)
+        self.assertEqual(set(result), {"bee", "be", "eel"})
+        self.assertEqual(len(result), len(set(result)))
+
+    def test_engines_agree(self):
+        dictionary = Lexicon({"cat", "bat", "tab", "rat", "art", "at", "tact"})
+        for letters in ("atcb", "tact", "rtatc"):
+            self.assertEqual(generate_valid_words(letters, dictionary, "trie"),
+                             generate_valid_words(letters, dictionary, "anagram"))
+            self.assertEqual(generate_valid_words(letters, dictionary, "gaddag"),
+                             generate_valid_words(letters, dictionary, "anagram"))
+        with self.assertRaises(ValueError):
+            generate_valid_words("atcb", dictionary, "unknown")
+
+    def test_calculate_word_score_with_blanks(self):
+        self.assertEqual(calculate_word_score("quiz", "z"), 12)
+        self.assertEqual(calculate_word_score("quiz", "qz"), 2)
+
+    def test_find_words_with_blanks(self):
+        dictionary = Lexicon({"cat", "bat", "tab", "at", "zat", "tact"})
+        for engine in ("anagram", "trie"):
+            results = {r["word"]: r for r in find_words("at?", dictionary, engine)}
+            self.assertEqual(set(results), {"at", "bat", "cat", "tab", "zat"})
+            self.assertEqual(results["at"]["blanks"], "")
+            self.assertEqual(results["zat"]["blanks"], "z")
+            self.assertEqual(results["zat"]["score"], 2)
+            self.assertEqual(results["bat"]["length"], 3)
+
+    def test_find_words_uses_real_tiles_before_blanks(self):
+        dictionary = Lexicon({"tact"})
+        for engine in ("anagram", "trie"):
+            results = find_words("tac??", dictionary, engine)
+            self.assertEqual(results, [{"word": "tact", "score": 5, "length": 4, "blanks": "t"}])
+
+    def test_find_words_batch(self):
+        dictionary = Lexicon({"cat", "bat", "tab", "at", "act"})
+        racks = ["tacb", "bcat", "at", "z", "at?"]
+        for engine in ("anagram", "trie"):
+            results = find_words_batch(racks, dictionary, engine)
+            self.assertEqual(results, [find_words(rack, dictionary, engine) for rack in racks])
+            # Anagram racks are solved once
+            self.assertIs(results[0], results[1])
+        self.assertEqual(find_words_batch([], dictionary), [])
+
+    def test_iter_words(self):
+        dictionary = Lexicon({"cat", "bat", "tab", "at", "tact", "act"})
+        for engine in ("anagram", "trie"):
+            for letters in ("tacb", "tac?"):
+                expected = find_words(letters, dictionary, engine)
+                lazy = list(iter_words(letters, dictionary, engine))
+                self.assertEqual(sorted(lazy, key=lambda r: (-r["score"], r["word"])), expected)
+
+                lengths = [r["length"] for r in iter_words(letters, dictionary, engine, "asc")]
+                self.assertEqual(lengths, sorted(lengths))
+                lengths = [r["length"] for r in iter_words(letters, dictionary, engine, "desc")]
+                self.assertEqual(lengths, sorted(lengths, reverse=True))
+
+    def test_filters_pushed_down_match_post_filtering(self):
+        dictionary = Lexicon({"cat", "bat", "tab", "at", "tact", "act", "tacts", "bats", "stab", "a", "aa"})
+        filter_specs = [
+            {"min_length": 4, "starts_with": "t"},
+            {"max_length": 2},
+            {"ends_with": "s", "min_length": 3},
+            {"starts_with": "a", "ends_with": "a"},
+            {"pattern": "?a*"},
+            {"pattern": "*t", "starts_with": "c"},
+            {"starts_with": "z"},
+        ]
+        for engine in ENGINES:
+            for letters in ("tacbsa", "ta?", "s??", "aa"):
+                for filters in filter_specs:
+                    expected = apply_filters(find_words(letters, dictionary, engine), filters)
+                    self.assertEqual(find_words(letters, dictionary, engine, filters), expected)
+                    lazy = iter_words(letters, dictionary, engine, "asc", filters)
+                    self.assertEqual(sorted(lazy, key=lambda r: (-r["score"], r["word"])), expected)
+
+    def test_limit_keeps_best_results(self):
+        dictionary = Lexicon({"cat", "bat", "tab", "at", "tact", "act", "tacts", "bats", "stab", "a", "aa"})
+        for engine in ENGINES:
+            for letters in ("tacbsa", "ta?", "s??"):
+                full = find_words(letters, dictionary, engine)
+                for limit in (0, 1, 3, 100):
+                    self.assertEqual(find_words(letters, dictionary, engine, limit=limit), full[:limit])
+                self.assertEqual(generate_valid_words(letters, dictionary, engine, limit=2),
+                                 [r["word"] for r in full[:2]])
+
+    def test_best_words_match_full_search(self):
+        dictionary = Lexicon({"cat", "bat", "tab", "at", "tact", "act", "tacts", "bats", "stab", "a", "aa",
+                              "quiz", "quit", "qat", "zax", "ax", "ta"})
+        for letters in ("tacbsa", "ta?", "s??", "aa", "quizatx", "qt??", "", "zzz"):
+            for filters in (None, {"min_length": 3}, {"starts_with": "t"}, {"pattern": "?a*"}):
+                for n in (0, 1, 2, 5, 100):
+                    self.assertEqual(best_words(letters, dictionary, n, filters),
+                                     find_words(letters, dictionary, filters=filters, limit=n))
+
+    def test_search_budget(self):
+        dictionary = Lexicon({"cat", "bat", "tab", "at", "tact", "act", "tacts", "bats", "stab", "a", "aa"})
+        for engine in ENGINES:
+            for letters in ("tacbsa", "ta?"):
+                full = find_words(letters, dictionary, engine)
+                budget = SearchBudget(seconds=60)
+                self.assertEqual(find_words(letters, dictionary, engine, budget=budget), full)
+                self.assertEqual((budget.reason, budget.cut_short), (None, {}))
+
+                # A deadline already passed stops the search before it finds anything
+                budget = SearchBudget(seconds=0)
+                self.assertEqual(find_words(letters, dictionary, engine, budget=budget), [])
+                self.assertEqual(budget.was_cut(letters[::-1]), "time_limit")
+                self.assertEqual(list(iter_words(letters, dictionary, engine, budget=budget)), [])
+
+        for engine in ("anagram", "trie", "gaddag"):
+            budget = SearchBudget(max_words=1)
+            partial = find_words("tacbs?", dictionary, engine, budget=budget)
+            self.assertEqual(budget.reason, "word_limit")
+            full = find_words("tacbs?", dictionary, engine)
+            self.assertTrue(0 < len(partial) < len(full))
+            self.assertTrue(all(result in full for result in partial))
+
+    def test_max_words_caps_results(self):
+        dictionary = Lexicon({"cat", "bat", "tab", "at", "tact", "act", "tacts", "bats", "stab", "a", "aa"})
+        for engine in ENGINES:
+            for letters in ("tacbsa", "ta?", "s??"):
+                full = find_words(letters, dictionary, engine)
+                for max_words in (1, 2, 5):
+                    budget = SearchBudget(max_words=max_words)
+                    words = find_words(letters, dictionary, engine, budget=budget)
+                    self.assertLessEqual(len(words), max_words)
+                    self.assertEqual(budget.was_cut(letters), "word_limit" if len(full) > max_words else None)
+                    self.assertTrue(all(result in full for result in words))
+
+                    words = list(iter_words(letters, dictionary, engine, budget=SearchBudget(max_words=max_words)))
+                    self.assertLessEqual(len(words), max_words)
+
+        budget = SearchBudget(max_words=2)
+        words = best_words("tacbsa", dictionary, 5, budget=budget)
+        self.assertEqual(words, best_words("tacbsa", dictionary, 2))
+        self.assertEqual(budget.reason, "word_limit")
+
+    def test_search_budget_batch(self):
+        dictionary = Lexicon({"cat", "bat", "tab", "at", "act"})
+        # Each rack gets its own word budget, so one reaching it leaves the rest whole
+        budget = SearchBudget(max_words=2)
+        results = find_words_batch(["tacb?", "at"], dictionary, "trie", budget=budget)
+        self.assertEqual(budget.cut_short, {"?abct": "word_limit"})
+        self.assertEqual(results[1], find_words("at", dictionary))
+
+        budget = SearchBudget(seconds=0)
+        self.assertEqual(find_words_batch(["tacb", "at"], dictionary, budget=budget), [[], []])
+        self.assertEqual(set(budget.cut_short.values()), {"time_limit"})
+
+    def test_best_words_budget(self):
+        dictionary = Lexicon({"cat", "bat", "tab", "at", "tact", "act", "quiz", "qat", "zax", "ax"})
+        budget = SearchBudget(seconds=0)
+        self.assertEqual(best_words("quizatx", dictionary, 3, budget=budget), [])
+        self.assertEqual(budget.reason, "time_limit")
+        budget = SearchBudget(seconds=60)
+        self.assertEqual(best_words("quizatx", dictionary, 3, budget=budget), best_words("quizatx", dictionary, 3))
+        self.assertIsNone(budget.reason)
+
+    def test_lexicon_prefix_range(self):
+        lexicon = Lexicon({"at", "bat", "bats", "cat", "tab"})
+        self.assertEqual(lexicon.prefix_range("b"), (1, 3))
+        self.assertEqual(lexicon.prefix_range("a"), (0, 1))
+        self.assertEqual(lexicon.prefix_range("z"), (5, 5))
+
+    def test_build_anagram_index(self):
+        index = build_anagram_index(["stare", "aster", "rates", "star"])
+        self.assertEqual(index["aerst"], [0, 1, 2])
+        self.assertEqual(index["arst"], [3])
+
+    def test_lexicon_precomputed_columns(self):
+        lexicon = Lexicon({"quiz", "at", "tact"})
+        self.assertEqual(lexicon.word_list, ["at", "quiz", "tact"])
+        self.assertEqual(list(lexicon.scores), [2, 22, 6])
+        self.assertEqual(list(lexicon.lengths), [2, 4, 4])
+        self.assertEqual(lexicon.anagrams("acctt"), [])
+        self.assertEqual(lexicon.anagrams("actt"), ["tact"])
+
+    def test_rack_signatures_are_distinct(self):
+        signatures = list(rack_signatures("aab"))
+        self.assertEqual(sorted(signatures), ["a", "aa", "aab", "ab", "b"])
+        self.assertEqual(sorted(rack_signatures("aab", max_length=1)), ["a", "b"])
+
 if __name__ == "__main__":
     unittest.main()
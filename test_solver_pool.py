@@ -0,0 +1,107 @@
+"""
+Unit tests for the solver process pool in Scrabble Word Solver.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from lexicon_file import compile_lexicon, MappedLexicon
+from scrabble_solver import SearchBudget, best_words, find_words_batch
+from solver_pool import SolverPool, rack_weight, BLANK_WEIGHT
+
+
+class TestSolverPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Compile a small dictionary and start a one-process pool on it."""
+        cls.directory = tempfile.mkdtemp()
+        source = os.path.join(cls.directory, 'words.txt')
+        with open(source, 'w') as file:
+            file.write('\n'.join(['CAT', 'ACT', 'TAB', 'BAT', 'AT', 'TACT', 'TACTS', 'STAB', 'ZAX', 'AX']) + '\n')
+        cls.artifact = compile_lexicon(source)
+        cls.lexicon = MappedLexicon(cls.artifact)
+        # Racks of four or more tiles go to the pool
+        cls.pool = SolverPool(1, heavy_weight=4)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+        shutil.rmtree(cls.directory)
+
+    def test_rack_weight(self):
+        """Test that blanks weigh more than tiles."""
+        self.assertEqual(rack_weight('cat'), 3)
+        self.assertEqual(rack_weight('ca?'), 2 + BLANK_WEIGHT)
+        self.assertFalse(self.pool.is_heavy('cat'))
+        self.assertTrue(self.pool.is_heavy('ca?'))
+
+    def test_find_words_batch_matches_inline(self):
+        """Test that pooled and inline solves return the same results."""
+        racks = ['tacts', 'stact', 'at', 'tab', 'zax?', 'tacbs', 'q']
+        for filters in (None, {'min_length': 3}, {'starts_with': 't'}):
+            results = self.pool.find_words_batch(racks, self.lexicon, filters=filters)
+            self.assertEqual(results, find_words_batch(racks, self.lexicon, filters=filters))
+            # Anagram racks are solved once
+            self.assertIs(results[0], results[1])
+        self.assertEqual(self.pool.find_words_batch([], self.lexicon), [])
+
+    def test_lexicons_by_artifact(self):
+        """Test that each rack is searched in the lexicon it was asked for."""
+        source = os.path.join(self.directory, 'other.txt')
+        with open(source, 'w') as file:
+            file.write('\n'.join(['TACTS', 'CAST', 'ACTS']) + '\n')
+        other = MappedLexicon(compile_lexicon(source))
+        for lexicon in (self.lexicon, other):
+            self.assertEqual(self.pool.find_words_batch(['tacts'], lexicon),
+                             find_words_batch(['tacts'], lexicon))
+
+    def test_replaced_artifact(self):
+        """Test that a solve sent for an artifact replaced since is not answered from the new one."""
+        source = os.path.join(self.directory, 'reloaded.txt')
+        artifact = os.path.join(self.directory, 'reloaded.lexicon')
+        with open(source, 'w') as file:
+            file.write('\n'.join(['TACTS', 'ACTS']) + '\n')
+        old = MappedLexicon(compile_lexicon(source, artifact))
+        with open(source, 'w') as file:
+            file.write('\n'.join(['TACTS', 'CAST', 'CATS']) + '\n')
+        new = MappedLexicon(compile_lexicon(source, artifact))
+        self.assertNotEqual(old.version, new.version)
+        for _ in range(2):
+            for lexicon in (old, new):
+                self.assertEqual(self.pool.find_words_batch(['tacts'], lexicon),
+                                 find_words_batch(['tacts'], lexicon))
+                self.assertEqual(self.pool.best_words('tacts', lexicon, 3), best_words('tacts', lexicon, 3))
+
+    def test_best_words_matches_inline(self):
+        """Test that pooled best_words returns the same results."""
+        for letters in ('tacts', 'at', 'zax??'):
+            for n in (0, 1, 3):
+                self.assertEqual(self.pool.best_words(letters, self.lexicon, n),
+                                 best_words(letters, self.lexicon, n))
+
+    def test_budget_reaches_pool(self):
+        """Test that pooled searches stop at the budget and report why."""
+        budget = SearchBudget(seconds=0)
+        self.assertEqual(self.pool.find_words_batch(['tacts', 'at'], self.lexicon, budget=budget), [[], []])
+        self.assertEqual(budget.cut_short, {'acstt': 'time_limit', 'at': 'time_limit'})
+
+        budget = SearchBudget(seconds=0)
+        self.assertEqual(self.pool.best_words('zax??', self.lexicon, budget=budget), [])
+        self.assertEqual(budget.was_cut('zax??'), 'time_limit')
+
+        budget = SearchBudget(max_words=2)
+        results = self.pool.find_words_batch(['tacts', 'zax?'], self.lexicon, budget=budget)
+        self.assertEqual([len(words) for words in results], [2, 2])
+        self.assertEqual(budget.was_cut('tacts'), 'word_limit')
+        self.assertEqual(len(self.pool.best_words('zax??', self.lexicon, 5, budget=budget)), 2)
+
+        budget = SearchBudget(seconds=60)
+        self.assertEqual(self.pool.find_words_batch(['tacts'], self.lexicon, budget=budget),
+                         find_words_batch(['tacts'], self.lexicon))
+        self.assertEqual(budget.cut_short, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
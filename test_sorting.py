@@ -88,6 +88,17 @@ class TestSorting(unittest.TestCase):
         self.assertEqual(sorted_groups[1]['name'], "Starts with 'C'")
         self.assertEqual(sorted_groups[2]['name'], "Starts with 'Z'")
     
+    def test_sort_groups_by_typed_key(self):
+        """Test that groups with a typed key are ordered by it, not by name."""
+        groups = [
+            {'name': '10 letters', 'key': 10, 'count': 0, 'total_score': 0, 'words': []},
+            {'name': '9 letters', 'key': 9, 'count': 0, 'total_score': 0, 'words': []},
+            {'name': '11 letters', 'key': 11, 'count': 0, 'total_score': 0, 'words': []}
+        ]
+        
+        self.assertEqual([group['key'] for group in sort_groups(groups, 'asc')], [9, 10, 11])
+        self.assertEqual([group['key'] for group in sort_groups(groups, 'desc')], [11, 10, 9])
+    
     def test_sort_words_within_groups_by_score(self):
         """Test sorting words within groups by score."""
         sorted_groups = sort_words_within_groups(self.sample_groups, 'score')
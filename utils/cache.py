@@ -0,0 +1,206 @@
+"""
+Result caching utilities for Scrabble Word Solver.
+Provides a bounded, thread-safe LRU cache for raw solver results.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+# Number of items sampled when estimating the memory used by a result list
+SIZE_SAMPLE = 32
+
+
+def estimate_size(results: List[Dict[str, Any]]) -> int:
+    """
+    Estimate the memory held by a list of result dictionaries.
+
+    A sample of the items is measured and extrapolated, so the cost stays
+    flat for very large result lists.
+
+    Args:
+        results: List of word dictionaries
+
+    Returns:
+        Approximate size in bytes
+    """
+    size = sys.getsizeof(results)
+    if not results:
+        return size
+
+    step = max(1, len(results) // SIZE_SAMPLE)
+    sample = results[::step]
+    sample_size = sum(
+        sys.getsizeof(item) + sum(sys.getsizeof(value) for value in item.values())
+        for item in sample
+    )
+    return size + sample_size * len(results) // len(sample)
+
+
+def rack_cache_key(letters: str, version: str, filters: Optional[Dict[str, Any]] = None) -> tuple:
+    """
+    Build the cache key for a rack: anagram racks share one entry per dictionary version.
+
+    Args:
+        letters: Normalized rack letters
+        version: Dictionary version identifier
+        filters: Filter spec the results were searched with, if any
+
+    Returns:
+        Hashable cache key
+    """
+    key = (version, ''.join(sorted(letters)))
+    applied = tuple(sorted((name, str(value)) for name, value in (filters or {}).items()
+                           if value is not None and value != ''))
+    return key + (applied,) if applied else key
+
+
+class ResultCache:
+    """
+    LRU cache bounded by entry count and estimated memory, with per-entry TTL.
+
+    All operations take a single lock, so one cache can be shared by every
+    thread of a worker process.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024,
+                 ttl: Optional[float] = 600.0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a cached value, refreshing its recency.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None on a miss or expired entry
+        """
+        return self.get_first([key])[1]
+
+    def get_first(self, keys: Sequence[Hashable]) -> Tuple[Optional[Hashable], Optional[Any]]:
+        """
+        Look up several keys that can each answer one request, in order.
+
+        Counts as a single hit or miss however many keys are tried, so
+        the counters stay per request.
+
+        Args:
+            keys: Cache keys, most preferred first
+
+        Returns:
+            The first cached key and its value, or (None, None) if none is cached
+        """
+        with self._lock:
+            for key in keys:
+                value = self._lookup(key)
+                if value is not None:
+                    self.hits += 1
+                    return key, value
+            self.misses += 1
+            return None, None
+
+    def _lookup(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, size, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self._remove(key)
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None) -> None:
+        """
+        Store a value, evicting least recently used entries to stay within bounds.
+
+        Args:
+            key: Cache key
+            value: Value to cache (a list of result dictionaries)
+            size: Size in bytes (estimated with estimate_size if omitted)
+        """
+        if size is None:
+            size = estimate_size(value)
+
+        # Values larger than the whole budget are never cached
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (value, size, expires_at)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def invalidate_version(self, version: str) -> int:
+        """
+        Drop the entries cached for one dictionary version (see rack_cache_key).
+
+        Args:
+            version: Dictionary version identifier
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            stale = [key for key in self._entries if isinstance(key, tuple) and key[:1] == (version,)]
+            for key in stale:
+                self._remove(key)
+            return len(stale)
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters for the API.
+
+        Returns:
+            Dictionary with sizes, limits and hit/miss/eviction counters
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
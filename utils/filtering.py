@@ -3,7 +3,14 @@ Filtering utilities for Scrabble Word Solver.
 Provides functions to filter words by various criteria.
 """
 
-from typing import List, Dict, Any
+import re
+from itertools import chain
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Pattern
+
+from utils.results import field_getter
+
+# Pattern characters: '?' is exactly one letter, '*' any run of letters
+PATTERN_WILDCARDS = '?*'
 
 
 def filter_words_by_length(words: List[Dict[str, Any]], 
@@ -69,6 +76,64 @@ def filter_words_by_last_letter(words: List[Dict[str, Any]],
     return [word for word in words if word['word'].lower().endswith(ends_with)]
 
 
+def pattern_regex(pattern: str) -> Pattern[str]:
+    """
+    Compile a crossword-style pattern such as '?A??E' or 'S*ING' to a regex.
+    
+    Args:
+        pattern: Letters, '?' for one letter and '*' for any run of letters
+        
+    Returns:
+        Compiled regex to be used with fullmatch on lowercase words
+    """
+    parts = []
+    for char in pattern.lower():
+        if char == '?':
+            parts.append('[a-z]')
+        elif char == '*':
+            parts.append('[a-z]*')
+        else:
+            parts.append(re.escape(char))
+    return re.compile(''.join(parts))
+
+
+def validate_pattern(pattern: Any) -> Optional[str]:
+    """
+    Check a pattern string.
+    
+    Args:
+        pattern: Pattern from a request
+        
+    Returns:
+        Error message, or None if the pattern is valid
+    """
+    pattern = str(pattern or '').strip()
+    if not pattern:
+        return 'Pattern must not be empty'
+    if not all((char.isascii() and char.isalpha()) or char in PATTERN_WILDCARDS for char in pattern):
+        return "Pattern may only contain letters, '?' and '*'"
+    return None
+
+
+def filter_words_by_pattern(words: List[Dict[str, Any]], 
+                            pattern: str = None) -> List[Dict[str, Any]]:
+    """
+    Filter words by a crossword-style pattern.
+    
+    Args:
+        words: List of word dictionaries
+        pattern: Pattern the whole word must match (see pattern_regex)
+        
+    Returns:
+        Filtered list of words
+    """
+    if not pattern:
+        return words
+    
+    regex = pattern_regex(pattern.strip())
+    return [word for word in words if regex.fullmatch(word['word'].lower())]
+
+
 def apply_filters(words: List[Dict[str, Any]], filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
     """
     Apply all filters to the word list.
@@ -99,9 +164,57 @@ def apply_filters(words: List[Dict[str, Any]], filters: Dict[str, Any] = None) -
     if 'ends_with' in filters and filters['ends_with']:
         filtered_words = filter_words_by_last_letter(filtered_words, filters['ends_with'])
     
+    if 'pattern' in filters and filters['pattern']:
+        filtered_words = filter_words_by_pattern(filtered_words, filters['pattern'])
+    
     return filtered_words
 
 
+def iter_filters(words: Iterable[Dict[str, Any]], filters: Dict[str, Any] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily apply all filters to a stream of words.
+    
+    Yields the same words apply_filters would keep, in input order, without
+    building intermediate lists.
+    
+    Args:
+        words: Iterable of word dictionaries or WordResult objects
+        filters: Dictionary containing filter criteria
+        
+    Returns:
+        Iterator over the matching words
+    """
+    filters = filters or {}
+    min_length = filters.get('min_length')
+    max_length = filters.get('max_length')
+    min_length = int(min_length) if min_length is not None else None
+    max_length = int(max_length) if max_length is not None else None
+    starts_with = (filters.get('starts_with') or '').lower()
+    ends_with = (filters.get('ends_with') or '').lower()
+    pattern = pattern_regex(filters['pattern'].strip()) if filters.get('pattern') else None
+    
+    words = iter(words)
+    first = next(words, None)
+    if first is None:
+        return
+    # Fields are read with the accessor that suits the kind of result streamed
+    length_of = field_getter('length', first)
+    word_of = field_getter('word', first)
+    
+    for word in chain((first,), words):
+        if min_length is not None and length_of(word) < min_length:
+            continue
+        if max_length is not None and length_of(word) > max_length:
+            continue
+        if starts_with and not word_of(word).lower().startswith(starts_with):
+            continue
+        if ends_with and not word_of(word).lower().endswith(ends_with):
+            continue
+        if pattern is not None and not pattern.fullmatch(word_of(word).lower()):
+            continue
+        yield word
+
+
 def validate_filters(filters: Dict[str, Any]) -> Dict[str, str]:
     """
     Validate filter parameters and return any errors.
@@ -153,6 +266,11 @@ def validate_filters(filters: Dict[str, Any]) -> Dict[str, str]:
             ends_with = str(filters['ends_with']).strip()
             if not ends_with.isalpha() or len(ends_with) != 1:
                 errors['ends_with'] = 'Ends with must be a single letter'
+        
+        if 'pattern' in filters and filters['pattern']:
+            pattern_error = validate_pattern(filters['pattern'])
+            if pattern_error:
+                errors['pattern'] = pattern_error
     
     return errors
 
@@ -184,6 +302,9 @@ def get_filter_summary(filters: Dict[str, Any]) -> str:
     if 'ends_with' in filters and filters['ends_with']:
         filter_parts.append(f"ends with: '{filters['ends_with'].upper()}'")
     
+    if 'pattern' in filters and filters['pattern']:
+        filter_parts.append(f"pattern: '{filters['pattern'].strip().upper()}'")
+    
     if filter_parts:
         return f"Filters: {', '.join(filter_parts)}"
     else:
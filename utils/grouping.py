@@ -4,7 +4,20 @@ Provides functions to group words by various criteria.
 """
 
 from collections import defaultdict
-from typing import List, Dict, Any
+from itertools import chain
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Tuple
+
+from utils.results import field_getter
+from utils.sorting import word_sort_key
+
+# Per grouping criteria: the result field the typed group key is read from,
+# the index of the key within that field (None for the whole value) and the
+# display name of a key
+GROUPINGS = {
+    'length': ('length', None, lambda length: f"{length} letter{'s' if length != 1 else ''}"),
+    'first_letter': ('word', 0, lambda letter: f"Starts with '{letter.upper()}'"),
+    'last_letter': ('word', -1, lambda letter: f"Ends with '{letter.upper()}'")
+}
 
 
 def extract_word_metadata(word_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -125,25 +138,122 @@ def group_words(words: List[Dict[str, Any]], group_by: str = 'length') -> List[D
     """
     Group words by the specified criteria.
     
+    Words are bucketed by a typed key in one pass, without copying them;
+    groups come out in ascending key order and keep each word's input order.
+    
     Args:
-        words: List of word dictionaries
+        words: List of word dictionaries or WordResult objects
         group_by: Grouping criteria ('length', 'first_letter', 'last_letter')
         
     Returns:
         List of groups with group metadata
     """
-    # Extract metadata for all words
-    enhanced_words = [extract_word_metadata(word_data) for word_data in words]
-    
-    if group_by == 'length':
-        return group_by_length(enhanced_words)
-    elif group_by == 'first_letter':
-        return group_by_first_letter(enhanced_words)
-    elif group_by == 'last_letter':
-        return group_by_last_letter(enhanced_words)
-    else:
-        # Default to length grouping
-        return group_by_length(enhanced_words)
+    if not words:
+        return []
+    key_of, name_of = _grouping(group_by, words[0])
+    buckets = _bucket_words(words, key_of)
+    return [_make_group(key, buckets[key], name_of) for key in sorted(buckets)]
+
+
+def group_and_sort(words: Iterable[Dict[str, Any]], group_by: str = 'length',
+                   group_sort_order: str = 'asc', sort_within_groups: str = 'score') -> List[Dict[str, Any]]:
+    """
+    Group and sort words in a single pass.
+    
+    Words are sorted once by their precomputed within-group key, then
+    bucketed by group key, so every group is already in order; groups are
+    ordered by the key itself rather than by their display names. The result
+    matches apply_sorting(group_words(words, group_by), ...).
+    
+    Args:
+        words: Iterable of word dictionaries or WordResult objects
+        group_by: Grouping criteria ('length', 'first_letter', 'last_letter')
+        group_sort_order: Group sort order ('asc' or 'desc')
+        sort_within_groups: Within-group sort criteria ('score' or 'alphabetical')
+        
+    Returns:
+        Sorted groups with sorted words
+    """
+    words = list(words)
+    if not words:
+        return []
+    key_of, name_of = _grouping(group_by, words[0])
+    word_key, reverse = word_sort_key(sort_within_groups, words[0])
+    buckets = _bucket_words(sorted(words, key=word_key, reverse=reverse), key_of)
+    keys = sorted(buckets, reverse=group_sort_order.lower() == 'desc')
+    return [_make_group(key, buckets[key], name_of) for key in keys]
+
+
+def _grouping(group_by: str, sample: Any = None) -> Tuple[Callable[[Any], Any], Callable[[Any], str]]:
+    """
+    Key function and group name formatter for a grouping criteria (length by default),
+    reading words of the same kind as sample (WordResult or dict).
+    """
+    field, index, name_of = GROUPINGS.get(group_by, GROUPINGS['length'])
+    get_field = field_getter(field, sample)
+    if index is None:
+        return get_field, name_of
+    return (lambda word_data: get_field(word_data)[index]), name_of
+
+
+def _bucket_words(words: Iterable[Dict[str, Any]],
+                  key_of: Callable[[Dict[str, Any]], Any]) -> Dict[Any, List[Dict[str, Any]]]:
+    buckets = defaultdict(list)
+    for word_data in words:
+        buckets[key_of(word_data)].append(word_data)
+    return buckets
+
+
+def _make_group(key: Any, words: List[Dict[str, Any]], name_of: Callable[[Any], str]) -> Dict[str, Any]:
+    return {
+        'name': name_of(key),
+        'key': key,
+        'count': len(words),
+        'total_score': sum(map(field_getter('score', words[0]), words)),
+        'words': words
+    }
+
+
+def iter_groups(words: Iterable[Dict[str, Any]], group_by: str = 'length',
+                ordered: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield groups as soon as they are complete.
+    
+    When ordered is True the words must arrive clustered by group key (for
+    example by ascending length), so each group is yielded as soon as the
+    key changes. Otherwise every word is buffered and the groups are yielded
+    at the end, in the same order as group_words.
+    
+    Args:
+        words: Iterable of word dictionaries
+        group_by: Grouping criteria ('length', 'first_letter', 'last_letter')
+        ordered: Whether the words are already clustered by group key
+        
+    Returns:
+        Iterator over group dictionaries
+    """
+    if not ordered:
+        yield from group_words(list(words), group_by)
+        return
+    
+    words = iter(words)
+    first = next(words, None)
+    if first is None:
+        return
+    key_of, name_of = _grouping(group_by, first)
+    current_key = None
+    group_words_so_far = None
+    for word_data in chain((first,), words):
+        key = key_of(word_data)
+        if group_words_so_far is None or key != current_key:
+            if group_words_so_far is not None:
+                yield _make_group(current_key, group_words_so_far, name_of)
+            current_key = key
+            group_words_so_far = []
+        group_words_so_far.append(word_data)
+    
+    if group_words_so_far is not None:
+        yield _make_group(current_key, group_words_so_far, name_of)
 
 
 def get_available_grouping_options() -> List[Dict[str, str]]:
@@ -0,0 +1,260 @@
+"""
+Metrics collection for Scrabble Word Solver.
+Provides counters and histograms rendered in the Prometheus text format,
+summed across worker processes that share a metrics directory.
+"""
+
+import mmap
+import os
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Histogram buckets for request stage latencies, in seconds
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Bytes per stored value (a float64)
+SLOT_BYTES = 8
+
+
+def format_value(value: float) -> str:
+    """Format a sample value or bucket bound as Prometheus expects."""
+    if value == float('inf'):
+        return '+Inf'
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class _Metric(ABC):
+    """A metric's series: one block of slots per label value."""
+
+    kind = ''
+
+    def __init__(self, registry: 'MetricsRegistry', name: str, help_text: str, width: int,
+                 label: Optional[str], label_values: Sequence[str]):
+        if label and not label_values:
+            raise ValueError(f"Metric '{name}' needs the values of its label '{label}'")
+        self.registry = registry
+        self.name = name
+        self.help = help_text
+        self.label = label
+        self.width = width
+        offset = registry._reserve(self, width * (len(label_values) if label else 1))
+        self._series = {value: offset + index * width
+                        for index, value in enumerate(label_values if label else (None,))}
+        self._lock = threading.Lock()
+
+    def _labels(self, label_value: Optional[str], **extra: str) -> str:
+        pairs = ([(self.label, label_value)] if self.label else []) + list(extra.items())
+        if not pairs:
+            return ''
+        return '{' + ','.join(f'{name}="{_escape(str(value))}"' for name, value in pairs) + '}'
+
+    def _header(self) -> List[str]:
+        return [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} {self.kind}']
+
+    @abstractmethod
+    def render(self, values: Sequence[float]) -> List[str]:
+        """Render this metric's exposition lines from the summed slot values."""
+
+
+class Counter(_Metric):
+    """Monotonic count, optionally split by one label."""
+
+    kind = 'counter'
+
+    def inc(self, label_value: Optional[str] = None, amount: float = 1.0) -> None:
+        """
+        Add to the count.
+
+        Raises:
+            KeyError: If the label value was not declared
+        """
+        slot = self._series[label_value]
+        values = self.registry._values or self.registry._allocate()
+        with self._lock:
+            values[slot] += amount
+
+    def render(self, values: Sequence[float]) -> List[str]:
+        return self._header() + [f'{self.name}{self._labels(label_value)} {format_value(values[slot])}'
+                                 for label_value, slot in self._series.items()]
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets, optionally split by one label."""
+
+    kind = 'histogram'
+
+    def __init__(self, registry: 'MetricsRegistry', name: str, help_text: str, buckets: Sequence[float],
+                 label: Optional[str], label_values: Sequence[str]):
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError(f"Buckets of '{name}' must be increasing")
+        self.buckets = tuple(float(bound) for bound in buckets)
+        # Slots per series: one per bucket, one for +Inf, then the sum
+        super().__init__(registry, name, help_text, len(self.buckets) + 2, label, label_values)
+
+    def observe(self, value: float, label_value: Optional[str] = None) -> None:
+        """
+        Record one observation.
+
+        Raises:
+            KeyError: If the label value was not declared
+        """
+        base = self._series[label_value]
+        bucket = bisect_left(self.buckets, value)
+        values = self.registry._values or self.registry._allocate()
+        with self._lock:
+            values[base + bucket] += 1
+            values[base + self.width - 1] += value
+
+    @contextmanager
+    def timer(self, label_value: Optional[str] = None) -> Iterator[None]:
+        """Observe the seconds spent in a with block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, label_value)
+
+    def render(self, values: Sequence[float]) -> List[str]:
+        lines = self._header()
+        for label_value, base in self._series.items():
+            count = 0.0
+            for index, bound in enumerate(self.buckets + (float('inf'),)):
+                count += values[base + index]
+                lines.append(f'{self.name}_bucket{self._labels(label_value, le=format_value(bound))} '
+                             f'{format_value(count)}')
+            lines.append(f'{self.name}_sum{self._labels(label_value)} {format_value(values[base + self.width - 1])}')
+            lines.append(f'{self.name}_count{self._labels(label_value)} {format_value(count)}')
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Counters and histograms for one process, rendered in the Prometheus text format.
+
+    Every value is a float64 slot in one array, laid out as the metrics are
+    declared, so all of them must be declared before the first is recorded.
+    An update takes only its own metric's lock, for a bisect and two
+    additions. With a directory, each process keeps its array in a file
+    mapped from there, and render sums the files of every process with the
+    same metrics, so any gunicorn worker answers a scrape for all of them.
+    Files of exited workers keep counting, so counters never go backwards
+    when a worker is replaced; empty the directory before the server starts.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Args:
+            directory: Directory shared by the worker processes (None keeps metrics in memory)
+        """
+        self.directory = directory
+        self._metrics: List[_Metric] = []
+        self._size = 1  # Slot 0 holds the layout fingerprint
+        self._values = None
+        self._lock = threading.Lock()
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def counter(self, name: str, help_text: str, label: Optional[str] = None,
+                label_values: Sequence[str] = ()) -> Counter:
+        """Declare a counter; with a label, every value it can take is declared up front."""
+        return Counter(self, name, help_text, 1, label, label_values)
+
+    def histogram(self, name: str, help_text: str, buckets: Sequence[float] = LATENCY_BUCKETS,
+                  label: Optional[str] = None, label_values: Sequence[str] = ()) -> Histogram:
+        """Declare a histogram with the given upper bucket bounds (+Inf is added)."""
+        return Histogram(self, name, help_text, buckets, label, label_values)
+
+    def _reserve(self, metric: _Metric, slots: int) -> int:
+        with self._lock:
+            if self._values is not None:
+                raise RuntimeError(f"Metric '{metric.name}' declared after metrics were recorded")
+            if any(existing.name == metric.name for existing in self._metrics):
+                raise ValueError(f"Metric '{metric.name}' is already declared")
+            self._metrics.append(metric)
+            offset = self._size
+            self._size += slots
+            return offset
+
+    def _fingerprint(self) -> float:
+        layout = ';'.join(f'{metric.kind}:{metric.name}:{len(metric._series)}:{metric.width}'
+                          for metric in self._metrics)
+        return float(zlib.crc32(layout.encode()))
+
+    def _allocate(self):
+        with self._lock:
+            if self._values is None:
+                size = self._size * SLOT_BYTES
+                if self.directory:
+                    os.makedirs(self.directory, exist_ok=True)
+                    path = os.path.join(self.directory, f'metrics-{os.getpid()}-{time.time_ns()}.db')
+                    with open(path, 'w+b') as file:
+                        file.truncate(size)
+                        buffer = mmap.mmap(file.fileno(), size)
+                else:
+                    buffer = bytearray(size)
+                values = memoryview(buffer).cast('d')
+                values[0] = self._fingerprint()
+                self._values = values
+            return self._values
+
+    def _after_fork(self) -> None:
+        # A thread of the parent may have held a lock, and a forked worker
+        # must not write into the parent's file
+        self._lock = threading.Lock()
+        for metric in self._metrics:
+            metric._lock = threading.Lock()
+        if self.directory:
+            self._values = None
+
+    def collect(self) -> List[float]:
+        """Current values of every slot, summed over the processes sharing the directory."""
+        own = self._values or self._allocate()
+        if not self.directory:
+            return list(own)
+        totals = [0.0] * self._size
+        for name in os.listdir(self.directory):
+            if not (name.startswith('metrics-') and name.endswith('.db')):
+                continue
+            try:
+                with open(os.path.join(self.directory, name), 'rb') as file:
+                    data = file.read()
+            except OSError:
+                continue
+            if len(data) != self._size * SLOT_BYTES:
+                continue
+            values = memoryview(data).cast('d')
+            # Files written by a different set of metrics (e.g. an older release) are skipped
+            if values[0] != own[0]:
+                continue
+            for index in range(1, self._size):
+                totals[index] += values[index]
+        return totals
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text format."""
+        values = self.collect()
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render(values))
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self) -> Dict[str, float]:
+        """Sample values keyed by their exposition line prefix (name and labels), e.g. for tests."""
+        samples = {}
+        for line in self.render().splitlines():
+            if line and not line.startswith('#'):
+                key, _, value = line.rpartition(' ')
+                samples[key] = float(value.replace('+Inf', 'inf'))
+        return samples
@@ -0,0 +1,149 @@
+"""
+Pagination utilities for Scrabble Word Solver.
+Provides top-K page selection over result lists and opaque keyset cursors.
+"""
+
+import base64
+import heapq
+import json
+from bisect import bisect_right
+from typing import List, Dict, Any, Callable, Optional, Tuple
+
+from utils.results import field_getter
+
+# Page orderings; each is a total order over results, so a page can resume
+# strictly after the last result of the previous one
+PAGE_ORDERINGS = ('score', 'alphabetical')
+
+
+def page_ordering(sort_by: str) -> str:
+    """Page ordering used for a within-group sort option (score unless alphabetical)."""
+    return sort_by if sort_by in PAGE_ORDERINGS else 'score'
+
+
+def page_key(sort_by: str = 'score', sample: Any = None) -> Callable[[Any], tuple]:
+    """
+    Get the total-order sort key used for pages.
+
+    'score' orders by score (highest first), then word, then blanks, which is
+    the order find_words returns results in; 'alphabetical' by word, then
+    score (highest first), then blanks. Both refine the sort_flat_words orderings
+    with tie-breakers.
+
+    Args:
+        sort_by: Page ordering ('score' or 'alphabetical'; anything else is by score)
+        sample: A word of the kind being paged, to pick the fastest field accessor
+
+    Returns:
+        Key function mapping a word to a tuple
+    """
+    word_of = field_getter('word', sample)
+    score_of = field_getter('score', sample)
+    blanks_of = field_getter('blanks', sample)
+    if sort_by == 'alphabetical':
+        return lambda word_data: (word_of(word_data), -score_of(word_data), blanks_of(word_data))
+    return lambda word_data: (-score_of(word_data), word_of(word_data), blanks_of(word_data))
+
+
+def top_words(words: List[Any], limit: int, sort_by: str = 'score',
+              after: Optional[tuple] = None, presorted: bool = False) -> Tuple[List[Any], int]:
+    """
+    Select one page of words: the first limit words after a key, in page order.
+
+    The page is taken with a bounded heap, so only limit words are ever
+    ordered rather than the whole list. Words already in page order (such as
+    find_words results for 'score') are paged with a binary search and a
+    slice instead.
+
+    Args:
+        words: List of word dictionaries or WordResult objects
+        limit: Maximum number of words on the page
+        sort_by: Page ordering ('score' or 'alphabetical')
+        after: Page key of the last word of the previous page, if any
+        presorted: Whether words are already sorted by the page key
+
+    Returns:
+        Tuple of (page of words, number of words left after the page)
+    """
+    if not words:
+        return [], 0
+    key = page_key(sort_by, words[0])
+
+    if presorted:
+        start = bisect_right(words, after, key=key) if after is not None else 0
+        page = words[start:start + limit]
+        return page, len(words) - start - len(page)
+
+    candidates = words if after is None else [word for word in words if key(word) > after]
+    page = heapq.nsmallest(limit, candidates, key=key)
+    return page, len(candidates) - len(page)
+
+
+def encode_cursor(sort_by: str, last_key: tuple) -> str:
+    """
+    Build the opaque cursor that resumes after a page.
+
+    Args:
+        sort_by: Page ordering the cursor belongs to
+        last_key: Page key of the last word on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([sort_by, list(last_key)], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, sort_by: str) -> tuple:
+    """
+    Read the page key back out of a cursor.
+
+    Args:
+        cursor: Cursor from encode_cursor
+        sort_by: Page ordering of the current request
+
+    Returns:
+        Page key of the last word of the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another ordering
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        cursor_sort_by, last_key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise ValueError('Invalid cursor') from None
+
+    expected = (str, int, str) if cursor_sort_by == 'alphabetical' else (int, str, str)
+    if (cursor_sort_by not in PAGE_ORDERINGS or not isinstance(last_key, list) or len(last_key) != 3 or
+            not all(type(value) is kind for value, kind in zip(last_key, expected))):
+        raise ValueError('Invalid cursor')
+    if cursor_sort_by != page_ordering(sort_by):
+        raise ValueError('Cursor was issued for a different sort order')
+    return tuple(last_key)
+
+
+def paginate(words: List[Any], limit: int, sort_by: str = 'score', cursor: Optional[str] = None,
+             presorted: bool = False) -> Dict[str, Any]:
+    """
+    Take one page of words and the cursor for the next.
+
+    Args:
+        words: List of word dictionaries or WordResult objects
+        limit: Maximum number of words on the page
+        sort_by: Page ordering ('score' or 'alphabetical')
+        cursor: Cursor returned with the previous page, if any
+        presorted: Whether words are already sorted by the page key
+
+    Returns:
+        Dictionary with the page 'words', 'next_cursor' (None on the last
+        page) and 'remaining' (words after this page)
+
+    Raises:
+        ValueError: If the cursor is invalid for this ordering
+    """
+    sort_by = page_ordering(sort_by)
+    after = decode_cursor(cursor, sort_by) if cursor else None
+    page, remaining = top_words(words, limit, sort_by, after, presorted)
+    next_cursor = encode_cursor(sort_by, page_key(sort_by, page[-1])(page[-1])) if page and remaining else None
+    return {'words': page, 'next_cursor': next_cursor, 'remaining': remaining}
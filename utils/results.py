@@ -0,0 +1,147 @@
+"""
+Result representation utilities for Scrabble Word Solver.
+Provides the compact word result type and its dict and columnar encodings.
+"""
+
+from operator import attrgetter, itemgetter
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Tuple
+
+# Fields of a word result, in output order
+RESULT_FIELDS = ('word', 'score', 'length', 'blanks')
+
+# Response formats for word lists: one object per word, or one array per field
+RESULT_FORMATS = ('objects', 'columnar')
+
+
+class WordResult:
+    """
+    One solver result: the word, its score, its length and the letters the blanks stood for.
+
+    Slots keep each result at a fraction of the size of an equivalent dict.
+    It still reads like the result dicts used throughout utils (result['score'],
+    result.get('word'), dict(result), {**result}), so helpers accept either.
+    """
+
+    __slots__ = RESULT_FIELDS
+
+    def __init__(self, word: str, score: int, length: int, blanks: str = ''):
+        self.word = word
+        self.score = score
+        self.length = length
+        self.blanks = blanks
+
+    def __getitem__(self, key: str) -> Any:
+        # Only the fields are keys; other names (such as '__class__') are
+        # missing, as they would be from a result dict
+        if key in RESULT_FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default) if key in RESULT_FIELDS else default
+
+    def keys(self) -> Tuple[str, ...]:
+        return RESULT_FIELDS
+
+    def values(self) -> List[Any]:
+        return [self.word, self.score, self.length, self.blanks]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return list(zip(RESULT_FIELDS, self.values()))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(RESULT_FIELDS)
+
+    def __len__(self) -> int:
+        return len(RESULT_FIELDS)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain dict copy, as sent in the default response format."""
+        return {'word': self.word, 'score': self.score, 'length': self.length, 'blanks': self.blanks}
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, WordResult):
+            return self.values() == other.values()
+        if isinstance(other, dict):
+            return self.as_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # Pickled as bare values (e.g. when returned from a solver process)
+        return WordResult, (self.word, self.score, self.length, self.blanks)
+
+    def __repr__(self) -> str:
+        return f'WordResult({self.word!r}, {self.score}, {self.length}, {self.blanks!r})'
+
+
+def field_getter(name: str, sample: Any = None) -> Callable[[Any], Any]:
+    """
+    Get the fastest accessor for a result field.
+
+    Args:
+        name: Field name
+        sample: A result of the kind about to be read (WordResult or dict)
+
+    Returns:
+        Attribute getter for WordResult samples, item getter otherwise
+    """
+    return attrgetter(name) if isinstance(sample, WordResult) else itemgetter(name)
+
+
+def to_dicts(words: Iterable[Any]) -> List[Dict[str, Any]]:
+    """
+    Convert results to plain dicts.
+
+    Args:
+        words: WordResult objects or word dictionaries
+
+    Returns:
+        List of word dictionaries
+    """
+    return [word.as_dict() if isinstance(word, WordResult) else word for word in words]
+
+
+def to_columns(words: Iterable[Any]) -> Dict[str, List[Any]]:
+    """
+    Convert results to parallel arrays, one per field.
+
+    Args:
+        words: WordResult objects or word dictionaries
+
+    Returns:
+        Dictionary mapping each field in RESULT_FIELDS to its list of values
+    """
+    words = list(words)
+    sample = words[0] if words else None
+    return {name: list(map(field_getter(name, sample), words)) for name in RESULT_FIELDS}
+
+
+def from_columns(columns: Dict[str, List[Any]]) -> List[WordResult]:
+    """
+    Rebuild results from parallel arrays (the inverse of to_columns).
+
+    Args:
+        columns: Dictionary mapping each field in RESULT_FIELDS to its list of values
+
+    Returns:
+        List of WordResult objects
+    """
+    return list(map(WordResult, *(columns[name] for name in RESULT_FIELDS)))
+
+
+def encode_words(words: Iterable[Any], result_format: str = 'objects') -> Any:
+    """
+    Encode a word list for a response.
+
+    Args:
+        words: WordResult objects or word dictionaries
+        result_format: 'objects' (list of dicts) or 'columnar' (dict of arrays)
+
+    Returns:
+        JSON-serializable word list
+    """
+    if result_format == 'columnar':
+        return to_columns(words)
+    return to_dicts(words)
@@ -3,13 +3,65 @@ Sorting utilities for Scrabble Word Solver.
 Provides functions to sort groups and words within groups.
 """
 
-from typing import List, Dict, Any
+import re
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Tuple
+
+from utils.results import field_getter
+
+# Word orderings: the result field sorted on and whether it runs highest first
+WORD_ORDERINGS = {
+    'score': ('score', True),
+    'alphabetical': ('word', False)
+}
+
+_NUMBER = re.compile(r'\d+')
+_QUOTED_LETTER = re.compile(r"'([a-z])'")
+
+
+def word_sort_key(sort_by: str = 'score', sample: Any = None) -> Tuple[Callable[[Any], Any], bool]:
+    """
+    Get the sort key for a word ordering.
+    
+    Args:
+        sort_by: Sort criteria ('score' or 'alphabetical'; anything else sorts by score)
+        sample: A word of the kind being sorted, to pick the fastest field accessor
+        
+    Returns:
+        Tuple of (key function, reverse flag) for sorted()
+    """
+    field, reverse = WORD_ORDERINGS.get(sort_by, WORD_ORDERINGS['score'])
+    return field_getter(field, sample), reverse
+
+
+def _group_name_key(group: Dict[str, Any]) -> Any:
+    """Recover a sort key from a group's display name, for groups built without a 'key'."""
+    name = group['name'].lower()
+    
+    # For length groups, extract the number
+    if 'letter' in name:
+        numbers = _NUMBER.findall(name)
+        if numbers:
+            return int(numbers[0])
+    
+    # For letter groups, extract the letter
+    if "starts with" in name or "ends with" in name:
+        letters = _QUOTED_LETTER.findall(name)
+        if letters:
+            return letters[0]
+    
+    # Default to alphabetical
+    return name
 
 
 def sort_groups(groups: List[Dict[str, Any]], sort_order: str = 'asc') -> List[Dict[str, Any]]:
     """
     Sort groups by their criteria (length, alphabetical, etc.).
     
+    Groups from utils.grouping carry their typed 'key' (a length or a
+    letter) and are ordered by it; other groups fall back to parsing the key
+    out of their names.
+    
     Args:
         groups: List of group dictionaries
         sort_order: Sort order ('asc' or 'desc')
@@ -20,29 +72,10 @@ def sort_groups(groups: List[Dict[str, Any]], sort_order: str = 'asc') -> List[D
     if not groups:
         return groups
     
-    # Determine sort key based on group name
-    def get_sort_key(group):
-        name = group['name'].lower()
-        
-        # For length groups, extract the number
-        if 'letter' in name:
-            import re
-            numbers = re.findall(r'\d+', name)
-            if numbers:
-                return int(numbers[0])
-        
-        # For letter groups, extract the letter
-        if "starts with" in name or "ends with" in name:
-            import re
-            letters = re.findall(r"'([a-z])'", name)
-            if letters:
-                return letters[0]
-        
-        # Default to alphabetical
-        return name
-    
     reverse = sort_order.lower() == 'desc'
-    return sorted(groups, key=get_sort_key, reverse=reverse)
+    if all('key' in group for group in groups):
+        return sorted(groups, key=itemgetter('key'), reverse=reverse)
+    return sorted(groups, key=_group_name_key, reverse=reverse)
 
 
 def sort_words_within_groups(groups: List[Dict[str, Any]], sort_by: str = 'score') -> List[Dict[str, Any]]:
@@ -57,15 +90,9 @@ def sort_words_within_groups(groups: List[Dict[str, Any]], sort_by: str = 'score
         Groups with sorted words
     """
     for group in groups:
-        if sort_by == 'score':
-            # Sort by score descending (highest first)
-            group['words'] = sorted(group['words'], key=lambda x: x['score'], reverse=True)
-        elif sort_by == 'alphabetical':
-            # Sort alphabetically
-            group['words'] = sorted(group['words'], key=lambda x: x['word'])
-        else:
-            # Default to score sorting
-            group['words'] = sorted(group['words'], key=lambda x: x['score'], reverse=True)
+        words = group['words']
+        key, reverse = word_sort_key(sort_by, words[0] if words else None)
+        group['words'] = sorted(words, key=key, reverse=reverse)
     
     return groups
 
@@ -75,21 +102,14 @@ def sort_flat_words(words: List[Dict[str, Any]], sort_by: str = 'score') -> List
     Sort a flat list of words by the specified criteria.
     
     Args:
-        words: List of word dictionaries
+        words: List of word dictionaries or WordResult objects
         sort_by: Sort criteria ('score' or 'alphabetical')
         
     Returns:
         Sorted list of words
     """
-    if sort_by == 'score':
-        # Sort by score descending (highest first)
-        return sorted(words, key=lambda x: x['score'], reverse=True)
-    elif sort_by == 'alphabetical':
-        # Sort alphabetically
-        return sorted(words, key=lambda x: x['word'])
-    else:
-        # Default to score sorting
-        return sorted(words, key=lambda x: x['score'], reverse=True)
+    key, reverse = word_sort_key(sort_by, words[0] if words else None)
+    return sorted(words, key=key, reverse=reverse)
 
 
 def apply_sorting(groups: List[Dict[str, Any]], 